@@ -2,21 +2,23 @@
 
 import os
 import sys
+from collections.abc import Callable, Hashable
+from typing import Any
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from data_processing.event_command import (
-    filter_events,
-    format_event_message,
-    get_events,
-)
-from data_processing.job_event import (
-    filter_jobs,
-    format_jobs_message,
-    get_jobs,
-)
+from data_processing.cache import TTLCache
+from data_processing.data_access import ListingDataAccess
+from data_processing.event_command import EVENTS_PER_MESSAGE, format_event_message
+from data_processing.facet_view import FacetView, describe_filters
+from data_processing.facets import FacetedResult
+from data_processing.job_event import JOBS_PER_MESSAGE, format_jobs_message
+from data_processing.listing_store import CSV_FILE_PATH, ListingStore
+
+# Maximum number of replies kept by the response cache
+RESPONSE_CACHE_SIZE = 256
 
 # Set up Discord Intents to enable bot to receive message events
 intents: discord.Intents = discord.Intents.default()
@@ -27,6 +29,34 @@ intents.members = True  # Privileged intent
 # Initialize bot with command prefix '!' and specified intents
 bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
 
+# Shared, hot-reloading copy of runningCSV.csv (or the SQLite database named by
+# LISTINGS_DB) used by !events and !jobs
+listing_store = ListingStore(os.getenv("LISTINGS_DB") or CSV_FILE_PATH)
+# Runs CSV loading and searching in a worker pool, off the event loop
+listing_data = ListingDataAccess(listing_store)
+# Final content of replies that many users receive unchanged, such as the
+# first page of !events or !jobs until the listings reload
+response_cache = TTLCache(max_size=RESPONSE_CACHE_SIZE)
+
+# Replies of the commands that do not depend on the listings, built once
+HELP_MESSAGE = (
+    "**🤖 BugBot Commands:**\n"
+    "`!resume` – Link to engineering resume resources\n"
+    "`!events` – See upcoming club events\n"
+    "`!resources` – Get recommended CS learning materials\n"
+    "`!jobs search-terms` – Search for jobs and internships\n\n"
+)
+RESUME_MESSAGE = (
+    "📄 Resume Resources: https://www.reddit.com/r/EngineeringResumes/wiki/index/"
+)
+RESOURCES_MESSAGE = (
+    "📚 CS Learning Resources:\n"
+    "- [CS50](https://cs50.harvard.edu)\n"
+    "- [The Odin Project](https://www.theodinproject.com/)\n"
+    "- [FreeCodeCamp](https://www.freecodecamp.org/)\n"
+    "- [LeetCode](https://leetcode.com/)"
+)
+
 
 # prints a message when the bot is ready in the terminal.
 @bot.event
@@ -38,24 +68,36 @@ async def on_ready():
     print(f"✅ Logged in as {bot.user}")
 
 
-# Welcome message when a new member joins the server (requires privileged intent)
-@bot.event
-async def on_member_join(member: discord.Member) -> None:
+def cached_response(key: Hashable, build: Callable[[], Any]) -> Any:
     """
-    Sends a welcome message when a new member joins the server.
+    Returns a reply's content from the response cache, building and caching
+    it on a miss.
 
-    Attempts to post the welcome message in a suitable channel
-    (e.g., "welcome", "general", "introductions", or "lobby"),
-    falling back to the system channel or the first available
-    text channel if necessary. If no appropriate channel is found,
-    sends a direct message to the new member. The welcome message
-    includes a mention of the "networking" channel if it exists.
+    Keys name the command and everything its content depends on, such as the
+    arguments and the snapshot generation, so stale entries are never read.
+    """
+    content = response_cache.get(key)
+    if content is None:
+        content = build()
+        response_cache.put(key, content)
+    return content
+
+
+def welcome_parts(
+    guild: discord.Guild,
+) -> tuple[discord.TextChannel | None, str, str]:
+    """
+    Finds the guild's welcome channel and builds the welcome text around the
+    new member's mention.
+
+    Returns the welcome channel, or None, and the text before and after the
+    mention.
     """
     # Try to find a dedicated welcome channel only
     welcome_channel: discord.TextChannel | None = None
 
     # Prefer dedicated welcome channels only; do not fall back to other channels
-    for channel in member.guild.text_channels:
+    for channel in guild.text_channels:
         if channel.name.lower() in ["welcome", "welcomes"]:
             welcome_channel = channel
             break
@@ -64,7 +106,7 @@ async def on_member_join(member: discord.Member) -> None:
 
     # Find networking channel for clickable link
     networking_channel: discord.TextChannel | None = None
-    for channel in member.guild.text_channels:
+    for channel in guild.text_channels:
         if channel.name.lower() == "networking":
             networking_channel = channel
             break
@@ -73,13 +115,57 @@ async def on_member_join(member: discord.Member) -> None:
     networking_mention = (
         f"<#{networking_channel.id}>" if networking_channel else "#networking"
     )
+    return (
+        welcome_channel,
+        f"Welcome to **{guild.name}**, ",
+        f"! Feel free to introduce yourself in {networking_mention}",
+    )
 
-    # Create welcome message
-    welcome_message = (
-        f"Welcome to **{member.guild.name}**, {member.mention}! "
-        f"Feel free to introduce yourself in {networking_mention}"
+
+# Channel and guild changes can alter the cached welcome text
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel) -> None:
+    response_cache.discard(("welcome", channel.guild.id))
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+    response_cache.discard(("welcome", channel.guild.id))
+
+
+@bot.event
+async def on_guild_channel_update(
+    before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+) -> None:
+    response_cache.discard(("welcome", after.guild.id))
+
+
+@bot.event
+async def on_guild_update(before: discord.Guild, after: discord.Guild) -> None:
+    response_cache.discard(("welcome", after.id))
+
+
+# Welcome message when a new member joins the server (requires privileged intent)
+@bot.event
+async def on_member_join(member: discord.Member) -> None:
+    """
+    Sends a welcome message when a new member joins the server.
+
+    Attempts to post the welcome message in a suitable channel
+    (e.g., "welcome", "general", "introductions", or "lobby"),
+    falling back to the system channel or the first available
+    text channel if necessary. If no appropriate channel is found,
+    sends a direct message to the new member. The welcome message
+    includes a mention of the "networking" channel if it exists.
+    The channels and text are looked up once per guild and cached.
+    """
+    welcome_channel, before_mention, after_mention = cached_response(
+        ("welcome", member.guild.id), lambda: welcome_parts(member.guild)
     )
 
+    # Create welcome message
+    welcome_message = f"{before_mention}{member.mention}{after_mention}"
+
     try:
         if welcome_channel:
             await welcome_channel.send(welcome_message)
@@ -109,14 +195,7 @@ async def help(ctx) -> None:
     Sends a message listing all available bot commands and their
     descriptions in the current channel.
     """
-    help_message = (
-        "**🤖 BugBot Commands:**\n"
-        "`!resume` – Link to engineering resume resources\n"
-        "`!events` – See upcoming club events\n"
-        "`!resources` – Get recommended CS learning materials\n"
-        "`!jobs search-terms` – Search for jobs and internships\n\n"
-    )
-    await ctx.send(help_message)
+    await ctx.send(HELP_MESSAGE)
 
 
 # !resume command placeholder
@@ -125,9 +204,45 @@ async def resume(ctx) -> None:
     """
     Sends a link to engineering resume resources in response to the !resume command.
     """
-    await ctx.send(
-        "📄 Resume Resources: https://www.reddit.com/r/EngineeringResumes/wiki/index/"
-    )
+    await ctx.send(RESUME_MESSAGE)
+
+
+async def faceted_reply(
+    kind: str,
+    args: str,
+    format_message: Callable[..., str],
+    page_size: int,
+    author_id: int,
+) -> tuple[str, FacetView | None]:
+    """
+    Searches and builds a reply's content with the facet select menus and
+    page buttons attached to it, usable only by the member who sent the
+    command. A search without results gets no menus.
+
+    Raises OSError or RuntimeError when the search fails or the data layer
+    is busy.
+    """
+    result = await listing_data.facet_search(kind, args)
+    if not result.total:
+        return format_message([], args), None
+
+    def render(narrowed: FacetedResult, page: int) -> str:
+        def build() -> str:
+            return format_message(
+                narrowed.page(page, page_size),
+                describe_filters(narrowed.corrected or args, narrowed.selections),
+                narrowed.total,
+                None if narrowed.selections else narrowed.corrected,
+                offset=page * page_size,
+            )
+
+        # First pages of cached searches are shared by everyone sending them
+        if page or narrowed.key is None:
+            return build()
+        return cached_response((kind, args, narrowed.key), build)
+
+    view = FacetView(result, listing_data.cursors, render, page_size, author_id)
+    return view.content(), view
 
 
 # !events command placeholder
@@ -138,17 +253,19 @@ async def events(ctx, *, args: str = "") -> None:
     response to the `!events` command.
 
     Usage: !events [location] [date] [type]
+        Criteria can be qualified, e.g. !events type:workshop location:remote
     """
-    csv_file_path = "data_collections/runningCSV.csv"
+    args = args.strip()
     try:
-        _events = get_events(csv_file_path)
+        content, view = await faceted_reply(
+            "events", args, format_event_message, EVENTS_PER_MESSAGE, ctx.author.id
+        )
     except (OSError, RuntimeError):
         await ctx.send("Error retrieving events. Please try again later")
     else:
-        args = args.strip()
-        _events = filter_events(_events, args)
-        message = format_event_message(_events, args)
-        await ctx.send(message)
+        message = await ctx.send(content, view=view)
+        if view is not None:
+            view.message = message
 
 
 # !resources command placeholder
@@ -158,13 +275,7 @@ async def resources(ctx) -> None:
     Sends a list of recommended computer science learning resources
     to the channel in response to the `!resources` command.
     """
-    await ctx.send(
-        "📚 CS Learning Resources:\n"
-        "- [CS50](https://cs50.harvard.edu)\n"
-        "- [The Odin Project](https://www.theodinproject.com/)\n"
-        "- [FreeCodeCamp](https://www.freecodecamp.org/)\n"
-        "- [LeetCode](https://leetcode.com/)"
-    )
+    await ctx.send(RESOURCES_MESSAGE)
 
 
 @bot.command()
@@ -172,26 +283,28 @@ async def jobs(ctx, *, args: str = "") -> None:
     """
     Searches for jobs and internships based on specified criteria.
 
-    Usage: !jobs [search_terms]
+    Usage: !jobs [search_terms] [company:name] [location:place] [type:kind]
 
     Examples:
     - !jobs software engineer
     - !jobs google remote
     - !jobs python internship summer
     - !jobs microsoft internship
+    - !jobs company:google location:remote type:internship python
     """
-    csv_file_path = "data_collections/runningCSV.csv"
+    args = args.strip()
     try:
-        _jobs = get_jobs(csv_file_path)
+        content, view = await faceted_reply(
+            "jobs", args, format_jobs_message, JOBS_PER_MESSAGE, ctx.author.id
+        )
     except (OSError, RuntimeError):
         await ctx.send(
             "Sorry, there was an error searching for jobs. Please try again later."
         )
     else:
-        args = args.strip()
-        _jobs = filter_jobs(_jobs, args)
-        message = format_jobs_message(_jobs, args)
-        await ctx.send(message)
+        message = await ctx.send(content, view=view)
+        if view is not None:
+            view.message = message
 
 
 def run_bot() -> None:
@@ -1,8 +1,14 @@
+import argparse
 import csv
 import os
+import tempfile
 
 import pandas as pd
 
+from .dates import TIMESTAMP_COLUMNS, add_timestamps
+from .link_index import LinkIndex
+from .locations import join_locations
+
 
 def extract_entries_from_csv(path: str) -> list[dict]:
     """
@@ -25,12 +31,16 @@ def extract_entries_from_csv(path: str) -> list[dict]:
     return entries_from_csv
 
 
-def remove_duplicates(data: list[dict]) -> list[dict]:
+def remove_duplicates(
+    data: list[dict], link_index: LinkIndex | None = None
+) -> list[dict]:
     """
     Remove duplicate entries based on the "link" key.
 
     Args:
         data list[dict]: List of dictionaries containing possible duplicate entries
+        link_index LinkIndex | None: persisted index of links already stored;
+            entries whose link it contains are removed as well
 
     Returns:
         list[dict]: List of dictionaries with duplicates removed
@@ -40,6 +50,8 @@ def remove_duplicates(data: list[dict]) -> list[dict]:
 
     for entry in data:
         link = entry.get("link")
+        if link and link_index is not None and link in link_index:
+            continue
         if link and entry["link"] not in entry_links:
             entry_links.add(entry["link"])
             unique_data.append(entry)
@@ -73,3 +85,206 @@ def items_to_csv(data: list[dict], path_to_file: str):
             print(f"Items Successfully saved to {path_to_file}")
         except Exception as e:
             raise RuntimeError(f"Failed to save data to CSV: {e}") from e
+
+
+def _read_header(path_to_file: str) -> list[str]:
+    """
+    Read the header row of a CSV file.
+
+    Args:
+        path_to_file str: path to CSV file
+
+    Returns:
+        list[str]: column names, empty if the file has no rows
+    """
+    with open(path_to_file, encoding="utf8", newline="") as file:
+        return next(csv.reader(file), [])
+
+
+def _storage_row(entry: dict) -> dict:
+    """
+    Return an entry with its `Location` in the stored, separator-joined form.
+    """
+    if "Location" not in entry:
+        return entry
+    return {**entry, "Location": join_locations(entry["Location"])}
+
+
+def _rewrite_csv(path_to_file: str, header: list[str], rows: list[dict]) -> None:
+    """
+    Atomically replace a CSV file with the given header and rows.
+
+    The file is written next to the original and renamed over it, so readers
+        never see a partially written CSV.
+    """
+    temp_path = None
+    try:
+        directory = os.path.dirname(os.path.abspath(path_to_file))
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf8", newline="", dir=directory, delete=False
+        ) as file:
+            temp_path = file.name
+            writer = csv.DictWriter(file, fieldnames=header, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(_storage_row(row) for row in rows)
+        os.replace(temp_path, path_to_file)
+    except Exception:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def add_timestamp_columns(path_to_file: str) -> bool:
+    """
+    Add the normalized timestamp columns to a CSV written before they existed,
+        filling them in from each row's date columns.
+
+    Args:
+        path_to_file (str): Path of the CSV file to upgrade
+
+    Returns:
+        bool: True if the file was rewritten, False if it already had them
+
+    Raises:
+        RuntimeError: If the CSV cannot be read or rewritten
+    """
+    header = _read_header(path_to_file)
+    missing = [column for column in TIMESTAMP_COLUMNS if column not in header]
+    if not header or not missing:
+        return False
+    entries = [
+        add_timestamps(entry) for entry in extract_entries_from_csv(path_to_file)
+    ]
+    try:
+        _rewrite_csv(path_to_file, header + missing, entries)
+    except Exception as e:
+        raise RuntimeError(f"Failed to add timestamp columns to CSV: {e}") from e
+    return True
+
+
+def append_items_to_csv(data: list[dict], path_to_file: str) -> int:
+    """
+    Append only the entries whose link is not already in the CSV file.
+
+    Unlike `items_to_csv`, the existing rows are never read or rewritten: the
+        links already stored are looked up in the file's `LinkIndex`, and new
+        rows are appended in the CSV's existing column order. Use
+        `compact_csv` to rewrite the file. A CSV without the timestamp columns
+        the new entries carry is upgraded first with `add_timestamp_columns`.
+
+    Args:
+        data (list[dict]): List of dictionaries containing the data to save
+        path_to_file (str): Path of the existing CSV file to append to
+
+    Returns:
+        int: number of rows appended
+
+    Raises:
+        RuntimeError: If there's an error while appending to the CSV
+    """
+    if not data:
+        return 0
+    try:
+        if not os.path.isfile(path_to_file):
+            raise ValueError("path_to_csv not found")
+        if any(column in entry for entry in data for column in TIMESTAMP_COLUMNS):
+            add_timestamp_columns(path_to_file)
+        with LinkIndex(path_to_file) as index:
+            new_rows = remove_duplicates(data, index)
+            if not new_rows:
+                print(f"No new items to save to {path_to_file}")
+                return 0
+            header = _read_header(path_to_file)
+            write_header = not header
+            if write_header:
+                header = list(dict.fromkeys(key for entry in new_rows for key in entry))
+            with open(path_to_file, "a", encoding="utf8", newline="") as file:
+                writer = csv.DictWriter(
+                    file, fieldnames=header, extrasaction="ignore", lineterminator="\n"
+                )
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(_storage_row(entry) for entry in new_rows)
+                file.flush()
+                os.fsync(file.fileno())
+            # The index is only updated once the rows are safely on disk; if
+            # this step is lost, the index catches up from the CSV's tail
+            index.add_many([entry["link"] for entry in new_rows])
+        print(f"Items Successfully saved to {path_to_file}")
+        return len(new_rows)
+    except Exception as e:
+        raise RuntimeError(f"Failed to save data to CSV: {e}") from e
+
+
+def compact_csv(path_to_file: str) -> int:
+    """
+    Rewrite a CSV file without duplicate entries and rebuild its link index.
+
+    Locations stored in the legacy stringified-list form are rewritten in the
+        separator-joined form.
+
+    The file is written next to the original and renamed over it, so readers
+        never see a partially written CSV.
+
+    Args:
+        path_to_file (str): Path of the CSV file to compact
+
+    Returns:
+        int: number of rows removed
+
+    Raises:
+        RuntimeError: If the CSV cannot be read or rewritten
+    """
+    entries = extract_entries_from_csv(path_to_file)
+    unique_entries = remove_duplicates(entries)
+    try:
+        _rewrite_csv(path_to_file, _read_header(path_to_file), unique_entries)
+    except Exception as e:
+        raise RuntimeError(f"Failed to compact CSV: {e}") from e
+    with LinkIndex(path_to_file) as index:
+        index.rebuild()
+    return len(entries) - len(unique_entries)
+
+
+def rebuild_link_index(path_to_file: str) -> int:
+    """
+    Rebuild the persisted link index of a CSV file from scratch.
+
+    Args:
+        path_to_file (str): Path of the CSV file whose index to rebuild
+
+    Returns:
+        int: number of distinct links in the rebuilt index
+    """
+    with LinkIndex(path_to_file) as index:
+        index.rebuild()
+        return len(index)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain a listings CSV file.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compact_parser = subparsers.add_parser(
+        "compact", help="remove duplicate rows and rebuild the link index"
+    )
+    compact_parser.add_argument("csv_path")
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-index", help="rebuild the link index from the CSV"
+    )
+    rebuild_parser.add_argument("csv_path")
+    timestamps_parser = subparsers.add_parser(
+        "add-timestamps", help="add the normalized timestamp columns"
+    )
+    timestamps_parser.add_argument("csv_path")
+    args = parser.parse_args()
+    if args.command == "compact":
+        removed = compact_csv(args.csv_path)
+        print(f"Removed {removed} duplicate entries from {args.csv_path}")
+    elif args.command == "add-timestamps":
+        if add_timestamp_columns(args.csv_path):
+            print(f"Added timestamp columns to {args.csv_path}")
+        else:
+            print(f"{args.csv_path} already has timestamp columns")
+    else:
+        count = rebuild_link_index(args.csv_path)
+        print(f"Indexed {count} links from {args.csv_path}")
@@ -0,0 +1,162 @@
+"""
+dates.py
+
+Normalizes the dates found in RSS entries into UTC epoch seconds when they are
+    collected, so readers of `runningCSV.csv` never have to parse date strings.
+
+Every entry keeps its original text columns and gains three timestamp columns:
+    - pubTimestamp: the feed's publication date (`pubDate`)
+    - whenTimestamp: the event date or the posting's expiry date (`whenDate`)
+    - entryTimestamp: when the entry was first collected (`entryDate`)
+
+A timestamp is left empty when its date cannot be parsed.
+"""
+
+import datetime
+import re
+from email.utils import parsedate_to_datetime
+
+TIMESTAMP_COLUMNS = ("pubTimestamp", "whenTimestamp", "entryTimestamp")
+
+_MONTHS = {
+    month: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for month in names
+}
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_US_DATE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+_TEXT_DATE = re.compile(r"\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})")
+_TIME = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([AaPp])\.?[Mm]\b")
+
+
+def _epoch(value: datetime.datetime) -> int:
+    """
+    Convert a datetime to epoch seconds, treating naive values as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp())
+
+
+def parse_pub_date(value) -> int | None:
+    """
+    Parse an RSS publication date.
+
+    Args:
+        value str | datetime.datetime: RFC 2822 date (as used by RSS feeds),
+            ISO 8601 date or datetime
+
+    Returns:
+        int | None: epoch seconds, or None if the date cannot be parsed
+    """
+    if isinstance(value, datetime.datetime):
+        return _epoch(value)
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        return _epoch(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return _epoch(datetime.datetime.fromisoformat(value))
+    except ValueError:
+        return None
+
+
+def parse_when_date(value) -> int | None:
+    """
+    Parse the date out of a free-text `whenDate`.
+
+    Understands "MM/DD/YYYY" expiry dates, ISO dates and event descriptions
+        such as "Monday, July 28, 2025, 5:00 PM - 6:00 PM". When a start time
+        follows the date it is included; otherwise the date's midnight is used.
+
+    Args:
+        value str: `whenDate` text
+
+    Returns:
+        int | None: epoch seconds (UTC), or None if no date is found
+    """
+    if not value:
+        return None
+    text = str(value)
+    date = None
+    for pattern in (_ISO_DATE, _US_DATE, _TEXT_DATE):
+        match = pattern.search(text)
+        if not match:
+            continue
+        try:
+            if pattern is _ISO_DATE:
+                year, month, day = (int(part) for part in match.groups())
+            elif pattern is _US_DATE:
+                month, day, year = (int(part) for part in match.groups())
+            else:
+                month = _MONTHS.get(match.group(1).lower())
+                if month is None:
+                    continue
+                day, year = int(match.group(2)), int(match.group(3))
+            date = datetime.datetime(year, month, day)
+        except ValueError:
+            continue
+        text = text[match.end() :]
+        break
+    if date is None:
+        return None
+    time = _TIME.search(text)
+    if time:
+        hour = int(time.group(1)) % 12 + (12 if time.group(3).lower() == "p" else 0)
+        date = date.replace(hour=hour, minute=int(time.group(2) or 0))
+    return _epoch(date)
+
+
+def parse_entry_date(value) -> int | None:
+    """
+    Parse the `entryDate` written when an entry was collected.
+
+    Args:
+        value str | datetime.datetime: datetime or its string form
+
+    Returns:
+        int | None: epoch seconds, or None if the date cannot be parsed
+    """
+    if isinstance(value, datetime.datetime):
+        return _epoch(value)
+    if not value:
+        return None
+    try:
+        return _epoch(datetime.datetime.fromisoformat(str(value).strip()))
+    except ValueError:
+        return None
+
+
+def add_timestamps(entry: dict) -> dict:
+    """
+    Add the timestamp columns to an entry, in place.
+
+    Args:
+        entry dict: entry with `pubDate`, `whenDate` and `entryDate` columns
+
+    Returns:
+        dict: the same entry
+    """
+    entry["pubTimestamp"] = parse_pub_date(entry.get("pubDate"))
+    entry["whenTimestamp"] = parse_when_date(entry.get("whenDate"))
+    entry["entryTimestamp"] = parse_entry_date(entry.get("entryDate"))
+    return entry
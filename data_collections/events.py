@@ -3,6 +3,8 @@ import re
 
 import feedparser
 
+from .dates import add_timestamps
+
 
 def getEvents(url, subType):
     """
@@ -20,6 +22,8 @@ def getEvents(url, subType):
         - Location: The location of the event.
         - link: The link to the event details.
         - entryDate: Date that the entry entered the our `runningCSV.csv`
+        - pubTimestamp, whenTimestamp, entryTimestamp: the dates above as
+            epoch seconds, or None if they cannot be parsed
     """
     try:
         data = feedparser.parse(url)
@@ -75,5 +79,6 @@ def getEvents(url, subType):
             "entryDate": datetime.datetime.now(tz=datetime.timezone.utc),
         }
 
-        events.append(event)  # list of each event which is stored in a dictionary
+        # list of each event which is stored in a dictionary
+        events.append(add_timestamps(event))
     return events
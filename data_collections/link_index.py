@@ -0,0 +1,300 @@
+"""
+link_index.py
+
+Persisted set of the links already stored in a listings CSV, used to drop
+    duplicate entries without re-reading the whole file.
+
+The index lives next to the CSV as `<csv path>.links.db`, a SQLite database
+    holding a 16-byte hash of every link in a primary-key table, so a lookup
+    is a single B-tree probe no matter how long the history is. An optional
+    Bloom filter, persisted alongside, answers most lookups for new links
+    without touching the table.
+
+The index also records how many bytes of the CSV it covers and a fingerprint
+    of the bytes just before that point. When it is opened:
+    - if the CSV grew past that point (a crash after appending rows but before
+        updating the index), only the new tail of the CSV is read;
+    - if the CSV was rewritten or truncated, or the index is missing or
+        unreadable, the index is rebuilt from the CSV's link column.
+
+Usage:
+    python -m data_collections.csv_updater rebuild-index runningCSV.csv
+"""
+
+import csv
+import hashlib
+import io
+import os
+import sqlite3
+
+# Bytes just before the covered offset that must be unchanged for the index
+# to be trusted
+FINGERPRINT_SIZE = 64
+# Bloom filter bits per expected link and number of hash functions (~1% false
+# positives)
+BLOOM_BITS_PER_LINK = 10
+BLOOM_HASHES = 7
+BLOOM_MIN_CAPACITY = 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (hash BLOB PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB);
+"""
+
+
+def hash_link(link: str) -> bytes:
+    """
+    Hash a link into the fixed-size key stored in the index.
+
+    Args:
+        link str: link to hash
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(link.encode("utf8"), digest_size=16).digest()
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over link hashes.
+    """
+
+    def __init__(self, capacity: int, bits: bytes | None = None):
+        """
+        Args:
+            capacity int: number of links the filter is sized for
+            bits bytes | None: previously saved filter contents
+        """
+        self.capacity = capacity
+        self.size = capacity * BLOOM_BITS_PER_LINK
+        self.bits = bytearray(bits) if bits else bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Double hashing from the two halves of the link hash
+        first = int.from_bytes(key[:8], "little")
+        second = int.from_bytes(key[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(BLOOM_HASHES)]
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+def read_csv_links(csv_path: str, offset: int = 0) -> list[str]:
+    """
+    Read only the `link` column of a listings CSV.
+
+    Args:
+        csv_path str: path to the CSV file
+        offset int: byte offset of a row boundary to start reading from. The
+            header is always read from the start of the file.
+
+    Returns:
+        list[str]: non-empty links in file order
+
+    Raises:
+        RuntimeError: If the CSV cannot be read
+    """
+    try:
+        with open(csv_path, "rb") as file:
+            header = next(csv.reader([file.readline().decode("utf8")]), [])
+            if "link" not in header:
+                return []
+            column = header.index("link")
+            if offset:
+                file.seek(offset)
+            text = io.StringIO(file.read().decode("utf8"), newline="")
+            return [
+                row[column]
+                for row in csv.reader(text)
+                if len(row) > column and row[column]
+            ]
+    except Exception as e:
+        raise RuntimeError(f"Failed to read CSV file: {e}") from e
+
+
+def _csv_state(csv_path: str) -> tuple[int, bytes]:
+    """
+    Return the size of the CSV and the fingerprint of its last bytes.
+    """
+    with open(csv_path, "rb") as file:
+        size = file.seek(0, os.SEEK_END)
+        file.seek(max(0, size - FINGERPRINT_SIZE))
+        return size, file.read()
+
+
+def _fingerprint_at(csv_path: str, offset: int) -> bytes:
+    """
+    Return the bytes of the CSV just before `offset`.
+    """
+    with open(csv_path, "rb") as file:
+        file.seek(max(0, offset - FINGERPRINT_SIZE))
+        return file.read(min(offset, FINGERPRINT_SIZE))
+
+
+class LinkIndex:
+    """
+    On-disk set of the links present in a listings CSV.
+    """
+
+    def __init__(self, csv_path: str, use_bloom: bool = True):
+        """
+        Args:
+            csv_path str: path to the CSV file the index describes
+            use_bloom bool: keep a Bloom filter in front of the table
+        """
+        self.csv_path = csv_path
+        self.path = csv_path + ".links.db"
+        self.use_bloom = use_bloom
+        self._conn: sqlite3.Connection | None = None
+        self._bloom: BloomFilter | None = None
+
+    def __enter__(self) -> "LinkIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the index database.
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _meta(self, key: str) -> bytes | int | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,))
+        found = row.fetchone()
+        return found[0] if found else None
+
+    def _open(self) -> sqlite3.Connection:
+        """
+        Open the index and bring it up to date with the CSV.
+        """
+        if self._conn is not None:
+            return self._conn
+        try:
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.executescript(_SCHEMA)
+            offset = self._meta("csv_offset")
+            fingerprint = self._meta("csv_fingerprint")
+        except sqlite3.DatabaseError:
+            # An unreadable index is rebuilt from scratch
+            self.close()
+            os.remove(self.path)
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.executescript(_SCHEMA)
+            offset = fingerprint = None
+        size, _ = _csv_state(self.csv_path)
+        if (
+            offset is None
+            or offset > size
+            or _fingerprint_at(self.csv_path, offset) != fingerprint
+        ):
+            self.rebuild()
+        elif offset < size:
+            # Rows were appended without being indexed, e.g. after a crash
+            self._insert(read_csv_links(self.csv_path, offset))
+        elif self.use_bloom:
+            self._load_bloom()
+        return self._conn
+
+    def _load_bloom(self) -> None:
+        capacity = self._meta("bloom_capacity")
+        bits = self._meta("bloom_bits")
+        if capacity is None or bits is None or len(self) > capacity:
+            self._rebuild_bloom()
+        else:
+            self._bloom = BloomFilter(capacity, bits)
+
+    def _rebuild_bloom(self) -> None:
+        capacity = max(BLOOM_MIN_CAPACITY, 2 * len(self))
+        self._bloom = BloomFilter(capacity)
+        for (key,) in self._conn.execute("SELECT hash FROM links"):
+            self._bloom.add(key)
+        self._save_bloom()
+
+    def _save_bloom(self) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("bloom_capacity", self._bloom.capacity),
+                ("bloom_bits", bytes(self._bloom.bits)),
+            ],
+        )
+
+    def _insert(self, links: list[str]) -> None:
+        """
+        Add links and record the CSV's current size and fingerprint, in one
+            transaction.
+        """
+        keys = [hash_link(link) for link in links]
+        size, fingerprint = _csv_state(self.csv_path)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO links (hash) VALUES (?)",
+                [(key,) for key in keys],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("csv_offset", size), ("csv_fingerprint", fingerprint)],
+            )
+            if self.use_bloom:
+                if self._bloom is None:
+                    self._load_bloom()
+                if len(self) > self._bloom.capacity:
+                    self._rebuild_bloom()
+                else:
+                    for key in keys:
+                        self._bloom.add(key)
+                    self._save_bloom()
+
+    def __contains__(self, link: str) -> bool:
+        conn = self._open()
+        key = hash_link(link)
+        if self._bloom is not None and key not in self._bloom:
+            return False
+        found = conn.execute("SELECT 1 FROM links WHERE hash = ?", (key,))
+        return found.fetchone() is not None
+
+    def __len__(self) -> int:
+        conn = self._conn or self._open()
+        return conn.execute("SELECT count(*) FROM links").fetchone()[0]
+
+    def add_many(self, links: list[str]) -> None:
+        """
+        Record links that were just appended to the CSV.
+
+        Must be called after the rows are written, since the index also
+            records how much of the CSV it now covers.
+
+        Args:
+            links list[str]: links that were just written to the CSV
+        """
+        self._open()
+        self._insert(links)
+
+    def rebuild(self) -> None:
+        """
+        Recreate the index from the links currently in the CSV.
+
+        Raises:
+            RuntimeError: If the CSV cannot be read
+        """
+        links = read_csv_links(self.csv_path)
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute("DELETE FROM links")
+            self._conn.execute("DELETE FROM meta")
+        self._bloom = None
+        self._insert(links)
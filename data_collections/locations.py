@@ -0,0 +1,61 @@
+"""
+locations.py
+
+Encoding of the multi-valued `Location` column.
+
+A listing can have several locations ("Remote", "Hybrid", "Syracuse, NY"), so
+    they are stored in one column joined by `LOCATION_SEPARATOR`, e.g.
+    "Remote; Syracuse, NY". Since city names contain commas the separator is a
+    semicolon. Rows written before this encoding hold a stringified Python
+    list ("['Remote', 'Syracuse, NY']"), which `parse_locations` still reads.
+"""
+
+import ast
+
+LOCATION_SEPARATOR = "; "
+
+
+def join_locations(locations) -> str:
+    """
+    Encode locations for storage.
+
+    Args:
+        locations list[str] | tuple[str, ...] | str: locations, or a single
+            location string
+
+    Returns:
+        str: locations joined by `LOCATION_SEPARATOR`
+    """
+    if locations is None:
+        return ""
+    if isinstance(locations, str):
+        return join_locations(parse_locations(locations))
+    return LOCATION_SEPARATOR.join(
+        str(location).strip() for location in locations if str(location).strip()
+    )
+
+
+def parse_locations(value) -> tuple[str, ...]:
+    """
+    Decode a stored `Location` value.
+
+    Args:
+        value str | list[str] | tuple[str, ...] | None: stored value, in the
+            separator-joined or the legacy stringified-list form
+
+    Returns:
+        tuple[str, ...]: individual locations, empty if there are none
+    """
+    if not value:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(location).strip() for location in value if location)
+    text = str(value).strip()
+    if text.startswith("[") and text.endswith("]"):
+        try:
+            items = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            items = None
+        if isinstance(items, list):
+            return parse_locations(items)
+    return tuple(location.strip() for location in text.split(";") if location.strip())
@@ -8,7 +8,9 @@ This Module does the following:
     - loads environment variables (RSS Feed URLS)
     - determines the task type (from ENV variables)
     - fetches event data from an RSS feed
-    - writes the collected items to a CSV file.
+    - appends the new collected items to a CSV file. When LISTINGS_DB names a
+        SQLite database, the items are inserted there and the CSV is
+        re-exported from it.
 
 Functions:
     run_get_events(url, subType):
@@ -19,6 +21,7 @@ Usage:
         - TASK_TYPE: Specifies the type of task to run
             (e.g., "INFO_SESSION", "WORKSHOP", "SPEAKER_PANEL", "OTHER", "CAREER_FAIR").
         - Corresponding RSS URL environment variable for the selected TASK_TYPE.
+        - LISTINGS_DB (optional): path to the SQLite listings database.
 
 Raises:
     ValueError:
@@ -31,9 +34,12 @@ import os
 
 from dotenv import load_dotenv
 
-from .csv_updater import items_to_csv
+from .csv_updater import append_items_to_csv
 from .events import getEvents
 from .rss_parser import getInternships, getJobs
+from .sqlite_store import export_csv, insert_listings
+
+CSV_PATH = "data_collections/runningCSV.csv"
 
 
 def run_events_RSS(url, subType):
@@ -88,4 +94,10 @@ if __name__ == "__main__":
         data = run_internships_RSS(url)
     else:
         raise ValueError(f"Unsupported TASK_TYPE: {task_type}")
-    items_to_csv(data, "data_collections/runningCSV.csv")
+    db_path = os.getenv("LISTINGS_DB")
+    if db_path:
+        inserted = insert_listings(db_path, data)
+        export_csv(db_path, CSV_PATH)
+        print(f"Inserted {inserted} new entries into {db_path}")
+    else:
+        append_items_to_csv(data, CSV_PATH)
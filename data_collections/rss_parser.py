@@ -4,6 +4,8 @@ import re
 import feedparser
 
 from .constants import VALID_STATES
+from .dates import add_timestamps
+from .locations import join_locations
 
 
 def getInternships(url):
@@ -67,12 +69,12 @@ def parse_rss_feed(url, item_type):
             "Description": "",
             "whenDate": whenDate,
             "pubDate": pubDate,
-            "Location": locations,
+            "Location": join_locations(locations),
             "link": link,
             "entryDate": datetime.datetime.now(tz=datetime.timezone.utc),
         }
 
-        items.append(item)
+        items.append(add_timestamps(item))
     return items
 
 
@@ -0,0 +1,333 @@
+"""
+sqlite_store.py
+
+Optional SQLite storage backend for the listings kept in `runningCSV.csv`.
+
+The database holds the same columns as the CSV in a `listings` table with a
+    unique index on `link`, so duplicate entries are rejected by SQLite
+    instead of being filtered in Python. A `listings_fts` FTS5 table, kept in
+    sync by triggers, provides full-text search. The database runs in WAL
+    mode so the RSS ingest job can write while the bot reads.
+
+The normalized date columns (see `dates.py`) are stored as INTEGER epoch
+    seconds. A database created before they existed gains them, filled in
+    from the text date columns, the next time it is opened.
+
+The CSV remains the exchange format: `import_csv` loads an existing CSV into
+    the database and `export_csv` writes the database back out.
+
+Usage:
+    python -m data_collections.sqlite_store import runningCSV.csv listings.db
+    python -m data_collections.sqlite_store export listings.db runningCSV.csv
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import tempfile
+
+from .csv_updater import extract_entries_from_csv
+from .dates import TIMESTAMP_COLUMNS, add_timestamps
+from .locations import join_locations
+
+TEXT_COLUMNS = (
+    "Type",
+    "subType",
+    "Company",
+    "Title",
+    "Description",
+    "whenDate",
+    "pubDate",
+    "Location",
+    "link",
+    "entryDate",
+)
+COLUMNS = TEXT_COLUMNS + TIMESTAMP_COLUMNS
+
+# Columns indexed by the FTS5 table
+SEARCH_COLUMNS = ("Title", "subType", "Company", "Description", "Location")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f'"{column}" TEXT NOT NULL DEFAULT ""' for column in TEXT_COLUMNS)},
+    {", ".join(f'"{column}" INTEGER' for column in TIMESTAMP_COLUMNS)}
+);
+CREATE UNIQUE INDEX IF NOT EXISTS listings_link ON listings(link);
+CREATE INDEX IF NOT EXISTS listings_type ON listings(Type);
+CREATE VIRTUAL TABLE IF NOT EXISTS listings_fts USING fts5(
+    {", ".join(SEARCH_COLUMNS)},
+    content='listings',
+    content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS listings_ai AFTER INSERT ON listings BEGIN
+    INSERT INTO listings_fts(rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{c}" for c in SEARCH_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS listings_ad AFTER DELETE ON listings BEGIN
+    INSERT INTO listings_fts(listings_fts, rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{c}" for c in SEARCH_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS listings_au
+AFTER UPDATE OF {", ".join(SEARCH_COLUMNS)} ON listings BEGIN
+    INSERT INTO listings_fts(listings_fts, rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{c}" for c in SEARCH_COLUMNS)});
+    INSERT INTO listings_fts(rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{c}" for c in SEARCH_COLUMNS)});
+END;
+"""
+
+_SELECT = f"SELECT {', '.join(f'listings.{c}' for c in COLUMNS)} FROM listings"
+
+
+def _add_timestamp_columns(conn: sqlite3.Connection) -> None:
+    """
+    Add the timestamp columns to a database created before they existed and
+        fill them in from the text date columns.
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(listings)")}
+    missing = [column for column in TIMESTAMP_COLUMNS if column not in existing]
+    if not missing:
+        return
+    with conn:
+        for column in missing:
+            conn.execute(f'ALTER TABLE listings ADD COLUMN "{column}" INTEGER')
+        rows = conn.execute(
+            "SELECT id, pubDate, whenDate, entryDate FROM listings"
+        ).fetchall()
+        conn.executemany(
+            "UPDATE listings SET "
+            + ", ".join(f"{column} = ?" for column in TIMESTAMP_COLUMNS)
+            + " WHERE id = ?",
+            [
+                (*(add_timestamps(dict(row))[c] for c in TIMESTAMP_COLUMNS), row[0])
+                for row in rows
+            ],
+        )
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """
+    Open the listings database, creating the schema if needed.
+
+    Args:
+        db_path str: path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection: connection in WAL mode returning sqlite3.Row rows
+
+    Raises:
+        RuntimeError: If the database cannot be opened or initialized
+    """
+    try:
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _add_timestamp_columns(conn)
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to open listings database: {e}") from e
+    return conn
+
+
+def _row_values(entry: dict) -> tuple[str | int | None, ...]:
+    """
+    Convert an entry into the column values stored in the database, using
+        the same text representation as the CSV. Entries without timestamp
+        columns have them computed from their date columns.
+    """
+    if any(column not in entry for column in TIMESTAMP_COLUMNS):
+        entry = add_timestamps(dict(entry))
+    values: list[str | int | None] = []
+    for column in TEXT_COLUMNS:
+        value = entry.get(column)
+        if column == "Location":
+            value = join_locations(value)
+        values.append("" if value is None else str(value))
+    for column in TIMESTAMP_COLUMNS:
+        value = entry.get(column)
+        values.append(None if value in (None, "") else int(value))
+    return tuple(values)
+
+
+def insert_listings(db_path: str, data: list[dict]) -> int:
+    """
+    Insert entries into the database, skipping links that already exist.
+
+    Args:
+        db_path str: path to the SQLite database file
+        data list[dict]: entries to insert
+
+    Returns:
+        int: number of entries actually inserted
+
+    Raises:
+        RuntimeError: If the entries cannot be written
+    """
+    rows = [_row_values(entry) for entry in data if entry.get("link")]
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.executemany(
+                f"INSERT OR IGNORE INTO listings ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                rows,
+            )
+            return cursor.rowcount
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to save data to database: {e}") from e
+    finally:
+        conn.close()
+
+
+def fetch_types_data(
+    db_path: str, data_types: tuple[str, ...] | None = None
+) -> dict[str, list[dict]]:
+    """
+    Read listings grouped by Type, in insertion order.
+
+    Args:
+        db_path str: path to the SQLite database file
+        data_types tuple[str, ...] | None: types to read, or None for all
+
+    Returns:
+        dict[str, list[dict]]: lists of entries keyed by type. Every requested
+            type is present, even when it has no entries.
+
+    Raises:
+        RuntimeError: If the database cannot be read
+    """
+    query = _SELECT
+    params: tuple[str, ...] = ()
+    if data_types is not None:
+        query += f" WHERE Type IN ({', '.join('?' for _ in data_types)})"
+        params = tuple(data_types)
+    grouped: dict[str, list[dict]] = {t: [] for t in data_types or ()}
+    conn = connect(db_path)
+    try:
+        for row in conn.execute(query + " ORDER BY id", params):
+            grouped.setdefault(row["Type"], []).append(dict(row))
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to read database: {e}") from e
+    finally:
+        conn.close()
+    return grouped
+
+
+def search_listings(
+    db_path: str,
+    query: str,
+    data_types: tuple[str, ...] | None = None,
+    limit: int = 5,
+) -> list[dict]:
+    """
+    Full-text search of the listings, best matches first.
+
+    Every whitespace-separated term is matched as a prefix and any term may
+        match, mirroring the bot's `!jobs` search.
+
+    Args:
+        db_path str: path to the SQLite database file
+        query str: search terms
+        data_types tuple[str, ...] | None: types to search, or None for all
+        limit int: maximum number of results
+
+    Returns:
+        list[dict]: matching entries ordered by FTS5 bm25 rank
+
+    Raises:
+        RuntimeError: If the database cannot be searched
+    """
+    terms = query.split()
+    if not terms:
+        return []
+    match = " OR ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+    sql = (
+        f"{_SELECT} JOIN listings_fts ON listings_fts.rowid = listings.id "
+        "WHERE listings_fts MATCH ?"
+    )
+    params: list = [match]
+    if data_types is not None:
+        sql += f" AND listings.Type IN ({', '.join('?' for _ in data_types)})"
+        params.extend(data_types)
+    sql += " ORDER BY listings_fts.rank LIMIT ?"
+    params.append(limit)
+    conn = connect(db_path)
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to search database: {e}") from e
+    finally:
+        conn.close()
+
+
+def import_csv(csv_path: str, db_path: str) -> int:
+    """
+    Load the entries of a CSV file into the database.
+
+    Args:
+        csv_path str: path to the CSV file to import
+        db_path str: path to the SQLite database file
+
+    Returns:
+        int: number of new entries inserted
+    """
+    return insert_listings(db_path, extract_entries_from_csv(csv_path))
+
+
+def export_csv(db_path: str, csv_path: str) -> None:
+    """
+    Write every listing in the database to a CSV file.
+
+    The file is written next to the destination and then renamed over it, so
+        readers never see a partially written CSV.
+
+    Args:
+        db_path str: path to the SQLite database file
+        csv_path str: path of the CSV file to write
+
+    Raises:
+        RuntimeError: If the database cannot be read or the CSV written
+    """
+    conn = connect(db_path)
+    try:
+        rows = [dict(row) for row in conn.execute(_SELECT + " ORDER BY id")]
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to read database: {e}") from e
+    finally:
+        conn.close()
+    directory = os.path.dirname(os.path.abspath(csv_path))
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf8", newline="", dir=directory, delete=False
+        ) as file:
+            temp_path = file.name
+            writer = csv.DictWriter(file, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(temp_path, csv_path)
+    except OSError as e:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise RuntimeError(f"Failed to export database to CSV: {e}") from e
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser("import", help="load a CSV into the db")
+    import_parser.add_argument("csv_path")
+    import_parser.add_argument("db_path")
+    export_parser = subparsers.add_parser("export", help="write the db to a CSV")
+    export_parser.add_argument("db_path")
+    export_parser.add_argument("csv_path")
+    args = parser.parse_args()
+    if args.command == "import":
+        count = import_csv(args.csv_path, args.db_path)
+        print(f"Imported {count} new entries into {args.db_path}")
+    else:
+        export_csv(args.db_path, args.csv_path)
+        print(f"Items Successfully saved to {args.csv_path}")
@@ -0,0 +1,242 @@
+"""
+File `autocomplete.py` suggests company names, title words and locations for
+    slash-command autocomplete, which Discord expects within three seconds.
+
+Each kind of suggestion keeps its lower-cased values in a sorted list, so the
+    values starting with a prefix form one contiguous range found with two
+    binary searches. The best `SUGGESTION_LIMIT` values of a range, by the
+    number of listings holding them, are memoized per prefix.
+
+When the listings reload, only the listings that were added or removed are
+    tokenized: the counts of the previous snapshot are copied and adjusted, so
+    the previous snapshot's suggestions stay valid for its readers.
+"""
+
+import bisect
+import heapq
+from collections import Counter
+from collections.abc import Iterable
+
+from data_collections.locations import parse_locations
+from data_processing.listing import Listing
+from data_processing.spelling import words
+
+# Discord shows at most 25 autocomplete choices
+SUGGESTION_LIMIT = 25
+# Upper bound on memoized prefixes per suggestion index
+SUGGESTION_CACHE_SIZE = 512
+# Title words shorter than this are not suggested
+MIN_TITLE_WORD_LENGTH = 3
+# Above this many new or dropped values the sorted list is rebuilt
+BULK_UPDATE_SIZE = 64
+
+SUGGESTION_FIELDS = ("company", "title", "location")
+
+
+def suggestion_values(listing: Listing) -> dict[str, list[str]]:
+    """
+    Returns the values a listing contributes to each kind of suggestion.
+
+    Args:
+        listing (Listing): Listing to read.
+
+    Returns:
+        dict[str, list[str]]: Suggestion field to the listing's distinct
+            values for it.
+    """
+    company = (listing.get("Company") or "").strip()
+    title_words = {
+        word
+        for word in words((listing.get("Title") or "").lower())
+        if len(word) >= MIN_TITLE_WORD_LENGTH
+    }
+    return {
+        "company": [company] if company else [],
+        "title": sorted(title_words),
+        "location": list(dict.fromkeys(parse_locations(listing.get("Location")))),
+    }
+
+
+class SuggestionIndex:
+    """
+    Values of one kind, sorted for prefix search and weighted by frequency.
+
+    Attributes:
+        counts (dict[str, int]): Lower-cased value to the number of listings
+            holding it.
+        labels (dict[str, str]): Lower-cased value to the form shown to users,
+            the first one seen.
+        keys (list[str]): Lower-cased values, sorted.
+    """
+
+    def __init__(self, values: Iterable[str] | Counter = ()):
+        """
+        Args:
+            values (Iterable[str] | Counter): Values to index, one per
+                listing holding them, or a Counter of them.
+        """
+        self.counts: dict[str, int] = {}
+        self.labels: dict[str, str] = {}
+        self.keys: list[str] = []
+        self._cache: dict[str, list[str]] = {}
+        self._apply(Counter(values), Counter())
+
+    def _apply(self, added: Counter, removed: Counter) -> None:
+        """
+        Adds and removes occurrences of values, keeping `keys` sorted.
+        """
+        new_keys: list[str] = []
+        for value, count in added.items():
+            key = value.lower()
+            if key not in self.counts:
+                self.counts[key] = 0
+                self.labels[key] = value
+                new_keys.append(key)
+            self.counts[key] += count
+        dropped_keys: set[str] = set()
+        for value, count in removed.items():
+            key = value.lower()
+            if key not in self.counts:
+                continue
+            self.counts[key] -= count
+            if self.counts[key] <= 0:
+                del self.counts[key]
+                del self.labels[key]
+                dropped_keys.add(key)
+        # A value both added and dropped here was never in `keys`
+        dropped_keys.difference_update(new_keys)
+        if len(new_keys) + len(dropped_keys) > BULK_UPDATE_SIZE:
+            self.keys = sorted(self.counts)
+        else:
+            for key in dropped_keys:
+                del self.keys[bisect.bisect_left(self.keys, key)]
+            for key in new_keys:
+                if key in self.counts:
+                    bisect.insort(self.keys, key)
+        self._cache = {}
+
+    def updated(self, added: Counter, removed: Counter) -> "SuggestionIndex":
+        """
+        Returns a copy of the index with occurrences added and removed. The
+            index itself is left unchanged.
+
+        Args:
+            added (Counter): Value to the number of new listings holding it.
+            removed (Counter): Value to the number of dropped listings holding
+                it.
+
+        Returns:
+            SuggestionIndex: The updated copy.
+        """
+        copy = SuggestionIndex()
+        copy.counts = dict(self.counts)
+        copy.labels = dict(self.labels)
+        copy.keys = list(self.keys)
+        copy._apply(added, removed)
+        return copy
+
+    def suggest(self, prefix: str, limit: int = SUGGESTION_LIMIT) -> list[str]:
+        """
+        Returns the most frequent values starting with a prefix.
+
+        Args:
+            prefix (str): Text typed so far. Case is ignored.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            list[str]: Up to `limit` values, most frequent first, ties in
+                alphabetical order.
+        """
+        prefix = prefix.strip().lower()
+        cached = self._cache.get(prefix)
+        if cached is None:
+            low = bisect.bisect_left(self.keys, prefix)
+            high = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo=low)
+            best = heapq.nsmallest(
+                SUGGESTION_LIMIT,
+                self.keys[low:high],
+                key=lambda key: (-self.counts[key], key),
+            )
+            cached = [self.labels[key] for key in best]
+            if len(self._cache) >= SUGGESTION_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[prefix] = cached
+        return cached[:limit]
+
+
+class AutocompleteIndex:
+    """
+    Company, title word and location suggestions for a list of listings.
+
+    Attributes:
+        fields (dict[str, SuggestionIndex]): Suggestion field to its index.
+    """
+
+    def __init__(self, listings: list[Listing] = ()):
+        """
+        Args:
+            listings (list[Listing]): Listings to index.
+        """
+        counters = self._count(listings)
+        self.fields = {
+            field: SuggestionIndex(counters[field]) for field in SUGGESTION_FIELDS
+        }
+
+    @staticmethod
+    def _count(listings: Iterable[Listing]) -> dict[str, Counter]:
+        """
+        Counts the suggestion values of listings per field.
+        """
+        counters = {field: Counter() for field in SUGGESTION_FIELDS}
+        for listing in listings:
+            for field, values in suggestion_values(listing).items():
+                counters[field].update(values)
+        return counters
+
+    def updated(
+        self, old_listings: list[Listing], new_listings: list[Listing]
+    ) -> "AutocompleteIndex":
+        """
+        Returns the index of `new_listings`, derived from this index of
+            `old_listings` by only counting the listings that changed.
+
+        Args:
+            old_listings (list[Listing]): Listings this index was built from.
+            new_listings (list[Listing]): Listings after the reload.
+
+        Returns:
+            AutocompleteIndex: Index of `new_listings`.
+        """
+        old_counts = Counter(old_listings)
+        new_counts = Counter(new_listings)
+        added = self._count((new_counts - old_counts).elements())
+        removed = self._count((old_counts - new_counts).elements())
+        result = AutocompleteIndex()
+        result.fields = {
+            field: (
+                index.updated(added[field], removed[field])
+                if added[field] or removed[field]
+                else index
+            )
+            for field, index in self.fields.items()
+        }
+        return result
+
+    def suggest(
+        self, field: str, prefix: str, limit: int = SUGGESTION_LIMIT
+    ) -> list[str]:
+        """
+        Returns the most frequent values of a field starting with a prefix.
+
+        Args:
+            field (str): One of SUGGESTION_FIELDS.
+            prefix (str): Text typed so far. Case is ignored.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            list[str]: Up to `limit` suggestions, most frequent first.
+
+        Raises:
+            KeyError: If `field` is not a suggestion field.
+        """
+        return self.fields[field].suggest(prefix, limit)
@@ -0,0 +1,55 @@
+"""
+File `bitmap.py` converts between sets of listing IDs and bitmaps, Python
+    ints whose bit `i` is set when listing `i` is included.
+
+Boolean search operators combine posting lists with `&`, `|` and `~`, which
+    work a machine word at a time instead of one listing at a time.
+"""
+
+from collections.abc import Iterable
+
+
+def from_ids(listing_ids: Iterable[int]) -> int:
+    """
+    Builds the bitmap of a set of listing IDs.
+
+    Args:
+        listing_ids (Iterable[int]): Listing IDs.
+
+    Returns:
+        int: Bitmap with the bits of the IDs set.
+    """
+    listing_ids = list(listing_ids)
+    if not listing_ids:
+        return 0
+    buffer = bytearray(max(listing_ids) // 8 + 1)
+    for listing_id in listing_ids:
+        buffer[listing_id >> 3] |= 1 << (listing_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def to_ids(bitmap: int) -> list[int]:
+    """
+    Returns the listing IDs whose bits are set, in increasing order.
+
+    Args:
+        bitmap (int): Non-negative bitmap.
+
+    Returns:
+        list[int]: Listing IDs.
+    """
+    listing_ids = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        while byte:
+            lowest = byte & -byte
+            listing_ids.append(offset * 8 + lowest.bit_length() - 1)
+            byte ^= lowest
+    return listing_ids
+
+
+def full(size: int) -> int:
+    """
+    Returns the bitmap of every listing ID below `size`.
+    """
+    return (1 << size) - 1
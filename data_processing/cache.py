@@ -0,0 +1,113 @@
+"""
+File `cache.py` provides a small thread-safe LRU cache with optional
+    time-to-live, used to memoize search results between Discord messages.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries optionally expire after a delay.
+
+    Attributes:
+        max_size (int): Maximum number of entries. A size of 0 disables it.
+        ttl (float | None): Seconds an entry stays valid, or None for forever.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found nothing usable.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float | None = None):
+        """
+        Args:
+            max_size (int): Maximum number of entries kept.
+            ttl (float | None): Seconds before an entry expires. Entries never
+                expire when None.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key and marks it recently used.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any): Value returned on a miss.
+
+        Returns:
+            Any: The cached value, or `default` if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entries if full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Removes an entry, if present.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry. The hit and miss counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the cache's size and hit/miss counters.
+
+        Returns:
+            dict[str, int]: "size", "max_size", "hits" and "misses".
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
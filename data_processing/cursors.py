@@ -0,0 +1,173 @@
+"""
+File `cursors.py` keeps the full ranking of recent searches server-side, so
+    the Previous and Next buttons of a reply page through it without running
+    the search again.
+
+Each reply opens a cursor named by a random token. A cursor expires `ttl`
+    seconds after it was last read, and the least recently used cursors are
+    closed once more than `max_cursors` are open or their rankings take more
+    than `max_bytes` in total. An open cursor keeps the snapshot its results
+    refer to alive, which is why both bounds matter after a reload. Results
+    shared by several cursors, such as a cached search sent by many members,
+    are counted once.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from data_processing.facets import FacetedResult
+
+DEFAULT_MAX_CURSORS = 1024
+DEFAULT_CURSOR_TTL = 900
+DEFAULT_CURSOR_MAX_BYTES = 16 * 1024 * 1024
+
+
+class CursorStore:
+    """
+    Least-recently-used store of open result cursors with a memory budget.
+
+    Attributes:
+        max_cursors (int): Maximum number of open cursors.
+        ttl (float): Seconds a cursor stays open after its last read.
+        max_bytes (int): Memory budget of the open cursors' rankings.
+        memory_bytes (int): Memory held by the open cursors' rankings, each
+            result counted once however many cursors share it.
+        opened (int): Number of cursors opened.
+        expired (int): Number of cursors closed by their TTL.
+        evicted (int): Number of cursors closed to stay within the bounds.
+    """
+
+    def __init__(
+        self,
+        max_cursors: int = DEFAULT_MAX_CURSORS,
+        ttl: float = DEFAULT_CURSOR_TTL,
+        max_bytes: int = DEFAULT_CURSOR_MAX_BYTES,
+    ):
+        """
+        Args:
+            max_cursors (int): Maximum number of open cursors.
+            ttl (float): Seconds a cursor stays open after its last read.
+            max_bytes (int): Memory budget of the open cursors, in bytes. The
+                newest cursor is always kept, even alone over budget.
+        """
+        self.max_cursors = max_cursors
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_bytes = 0
+        self.opened = 0
+        self.expired = 0
+        self.evicted = 0
+        self._cursors: OrderedDict[str, tuple[float, FacetedResult]] = OrderedDict()
+        # Number of open cursors sharing each result, by id(result)
+        self._refs: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def _drop(self, cursor_id: str) -> None:
+        """
+        Closes a cursor and releases its memory. Callers hold the lock.
+        """
+        _, result = self._cursors.pop(cursor_id)
+        refs = self._refs.pop(id(result)) - 1
+        if refs:
+            self._refs[id(result)] = refs
+        else:
+            self.memory_bytes -= result.nbytes
+
+    def _drop_expired(self, now: float) -> None:
+        """
+        Closes the expired cursors, which are the least recently used ones.
+        """
+        while self._cursors:
+            cursor_id, (expires_at, _) = next(iter(self._cursors.items()))
+            if expires_at > now:
+                break
+            self._drop(cursor_id)
+            self.expired += 1
+
+    def open(self, result: FacetedResult) -> str:
+        """
+        Opens a cursor over a result set.
+
+        Args:
+            result (FacetedResult): Results to page through.
+
+        Returns:
+            str: Token naming the cursor.
+        """
+        cursor_id = secrets.token_urlsafe(12)
+        now = time.monotonic()
+        with self._lock:
+            self._drop_expired(now)
+            self._cursors[cursor_id] = (now + self.ttl, result)
+            refs = self._refs.get(id(result), 0)
+            if not refs:
+                self.memory_bytes += result.nbytes
+            self._refs[id(result)] = refs + 1
+            self.opened += 1
+            while len(self._cursors) > 1 and (
+                len(self._cursors) > self.max_cursors
+                or self.memory_bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._cursors)))
+                self.evicted += 1
+        return cursor_id
+
+    def get(self, cursor_id: str) -> FacetedResult | None:
+        """
+        Returns a cursor's results and extends its TTL.
+
+        Args:
+            cursor_id (str): Token returned by `open`.
+
+        Returns:
+            FacetedResult | None: The results, or None if the cursor was
+                closed or has expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cursors.get(cursor_id)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= now:
+                self._drop(cursor_id)
+                self.expired += 1
+                return None
+            self._cursors[cursor_id] = (now + self.ttl, result)
+            self._cursors.move_to_end(cursor_id)
+            return result
+
+    def close(self, cursor_id: str) -> None:
+        """
+        Closes a cursor, if still open.
+
+        Args:
+            cursor_id (str): Token returned by `open`.
+        """
+        with self._lock:
+            if cursor_id in self._cursors:
+                self._drop(cursor_id)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the number of open cursors, their memory and the counters.
+
+        Returns:
+            dict[str, int]: "size", "max_cursors", "memory_bytes",
+                "max_bytes", "opened", "expired" and "evicted".
+        """
+        with self._lock:
+            return {
+                "size": len(self._cursors),
+                "max_cursors": self.max_cursors,
+                "memory_bytes": self.memory_bytes,
+                "max_bytes": self.max_bytes,
+                "opened": self.opened,
+                "expired": self.expired,
+                "evicted": self.evicted,
+            }
@@ -0,0 +1,323 @@
+"""
+File `data_access.py` is the async entry point used by bot.py to load and
+    search listings without blocking the Discord event loop.
+
+Loading the CSV, filtering and sorting all run in a bounded thread pool. The
+    number of workers and the number of requests allowed to wait for them are
+    configurable through the `LISTING_WORKERS` and `LISTING_MAX_PENDING`
+    environment variables or the constructor.
+
+Past events and expired jobs are left out of results. Search results are
+    cached by normalized query, snapshot generation and day, so a reload of
+    the CSV or a new day invalidates them without any explicit flush. The cache
+    is sized by `QUERY_CACHE_SIZE` entries and `QUERY_CACHE_TTL` seconds.
+    Identical searches sent while one is running share its result instead of
+    each taking a worker.
+
+Replies page through the full results of their search with cursors, bounded
+    by `CURSOR_MAX_OPEN` cursors, `CURSOR_TTL` seconds since their last use and
+    `CURSOR_MAX_BYTES` bytes of rankings.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from data_processing.autocomplete import SUGGESTION_LIMIT
+from data_processing.cache import TTLCache
+from data_processing.cursors import (
+    DEFAULT_CURSOR_MAX_BYTES,
+    DEFAULT_CURSOR_TTL,
+    DEFAULT_MAX_CURSORS,
+    CursorStore,
+)
+from data_processing.date_index import start_of_day
+from data_processing.facets import FacetedResult, faceted_search
+from data_processing.listing_store import ListingStore
+from data_processing.search_index import normalize_query
+from data_processing.single_flight import SingleFlight
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 32
+DEFAULT_QUERY_CACHE_SIZE = 256
+DEFAULT_QUERY_CACHE_TTL = 600
+
+T = TypeVar("T")
+
+
+class DataAccessBusyError(RuntimeError):
+    """
+    Raised when too many requests are already waiting for a worker.
+    """
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Reads a positive integer from the environment, falling back to a default.
+
+    Args:
+        name (str): Environment variable name.
+        default (int): Value used when the variable is unset or invalid.
+
+    Returns:
+        int: The configured value.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        print(f"❌ Ignoring invalid {name}={value!r}, using {default}")
+        return default
+    return parsed if parsed > 0 else default
+
+
+class ListingDataAccess:
+    """
+    Runs listing loads and searches in a bounded worker pool.
+    """
+
+    def __init__(
+        self,
+        store: ListingStore,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        query_cache: TTLCache | None = None,
+        cursors: CursorStore | None = None,
+    ):
+        """
+        Args:
+            store (ListingStore): Store the listings are read from.
+            max_workers (int | None): Worker threads. Defaults to
+                `LISTING_WORKERS` or DEFAULT_WORKERS.
+            max_pending (int | None): Requests allowed in flight, running or
+                queued, before new ones are rejected. Defaults to
+                `LISTING_MAX_PENDING` or DEFAULT_MAX_PENDING.
+            query_cache (TTLCache | None): Cache for search results. Defaults
+                to one sized by `QUERY_CACHE_SIZE` and `QUERY_CACHE_TTL`.
+            cursors (CursorStore | None): Open result cursors. Defaults to one
+                bounded by `CURSOR_MAX_OPEN`, `CURSOR_TTL` and
+                `CURSOR_MAX_BYTES`.
+        """
+        self.store = store
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._query_cache = query_cache
+        self._cursors = cursors
+        self.single_flight = SingleFlight()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Number of worker threads, read from the environment on first use so
+            values loaded by `load_dotenv` are honored.
+        """
+        if self._max_workers is None:
+            self._max_workers = _env_int("LISTING_WORKERS", DEFAULT_WORKERS)
+        return self._max_workers
+
+    @property
+    def max_pending(self) -> int:
+        """
+        Maximum number of requests running or queued at once.
+        """
+        if self._max_pending is None:
+            self._max_pending = _env_int("LISTING_MAX_PENDING", DEFAULT_MAX_PENDING)
+        return self._max_pending
+
+    @property
+    def query_cache(self) -> TTLCache:
+        """
+        Cache of search results, created on first use.
+        """
+        if self._query_cache is None:
+            self._query_cache = TTLCache(
+                max_size=_env_int("QUERY_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE),
+                ttl=_env_int("QUERY_CACHE_TTL", DEFAULT_QUERY_CACHE_TTL),
+            )
+        return self._query_cache
+
+    @property
+    def cursors(self) -> CursorStore:
+        """
+        Cursors paging through search results, created on first use.
+        """
+        if self._cursors is None:
+            self._cursors = CursorStore(
+                max_cursors=_env_int("CURSOR_MAX_OPEN", DEFAULT_MAX_CURSORS),
+                ttl=_env_int("CURSOR_TTL", DEFAULT_CURSOR_TTL),
+                max_bytes=_env_int("CURSOR_MAX_BYTES", DEFAULT_CURSOR_MAX_BYTES),
+            )
+        return self._cursors
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of requests currently running or waiting for a worker.
+        """
+        return self._pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Creates the worker pool the first time it is needed.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="listing-data",
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs a blocking callable in the worker pool.
+
+        Args:
+            func (Callable[..., T]): Blocking function to run.
+            *args (Any): Positional arguments for the function.
+
+        Returns:
+            T: The function's return value.
+
+        Raises:
+            DataAccessBusyError: If `max_pending` requests are already in flight.
+        """
+        if self._pending >= self.max_pending:
+            raise DataAccessBusyError(
+                f"{self._pending} listing requests already pending"
+            )
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args)
+            )
+        finally:
+            self._pending -= 1
+
+    async def _coalesce(
+        self,
+        operation: Hashable,
+        kind: str,
+        _filters: str,
+        func: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """
+        Runs a search in the worker pool, or waits for an identical one that
+            is already running.
+
+        Queries are compared normalized against the snapshot loaded last, so
+            the key is computed without touching the file.
+
+        Args:
+            operation (Hashable): Names the search and its options.
+            kind (str): "events" or "jobs", whose locations normalize the query.
+            _filters (str): Filter criteria as a string.
+            func (Callable[..., T]): Blocking search to run.
+            *args (Any): Positional arguments for the search.
+
+        Returns:
+            T: The search's result.
+        """
+        snapshot = self.store.current
+        if snapshot is None:
+            query = " ".join(_filters.split())
+        else:
+            index = snapshot.events_index if kind == "events" else snapshot.jobs_index
+            query = normalize_query(_filters, index.locations)
+        return await self.single_flight.run(
+            (operation, query), functools.partial(self.run, func, *args)
+        )
+
+    def _facet_search(self, kind: str, _filters: str) -> FacetedResult:
+        snapshot = self.store.snapshot()
+        cutoff = start_of_day()
+        if kind == "events":
+            listings, index = snapshot.events, snapshot.events_index
+            dates, facets = snapshot.events_by_date, snapshot.events_facets
+        else:
+            listings, index = snapshot.jobs, snapshot.jobs_index
+            dates, facets = snapshot.jobs_by_date, snapshot.jobs_facets
+        key = (
+            "facets",
+            kind,
+            normalize_query(_filters, index.locations),
+            snapshot.generation,
+            cutoff,
+        )
+        result = self.query_cache.get(key)
+        if result is None:
+            result = faceted_search(
+                listings,
+                _filters,
+                index,
+                dates,
+                facets,
+                cutoff,
+                upcoming_first=kind == "events",
+            )
+            result.key = key
+            self.query_cache.put(key, result)
+        return result
+
+    async def facet_search(self, kind: str, _filters: str) -> FacetedResult:
+        """
+        Ranks every listing matching the filters so the results can be
+            narrowed by facet without searching again.
+
+        Args:
+            kind (str): "events" or "jobs".
+            _filters (str): Filter criteria as a string.
+
+        Returns:
+            FacetedResult: Every matching listing with its facet counts.
+        """
+        return await self._coalesce(
+            ("facets", kind), kind, _filters, self._facet_search, kind, _filters
+        )
+
+    def _suggest(self, kind: str, field: str, prefix: str, limit: int) -> list[str]:
+        snapshot = self.store.snapshot()
+        suggestions = (
+            snapshot.events_suggestions
+            if kind == "events"
+            else snapshot.jobs_suggestions
+        )
+        return suggestions.suggest(field, prefix, limit)
+
+    async def suggest(
+        self, kind: str, field: str, prefix: str, limit: int = SUGGESTION_LIMIT
+    ) -> list[str]:
+        """
+        Returns autocomplete suggestions for a slash-command option.
+
+        Args:
+            kind (str): "events" or "jobs".
+            field (str): "company", "title" or "location".
+            prefix (str): Text typed so far.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            list[str]: Up to `limit` suggestions, most frequent first.
+        """
+        return await self.run(self._suggest, kind, field, prefix, limit)
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool without waiting for running requests.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
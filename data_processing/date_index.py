@@ -0,0 +1,164 @@
+"""
+File `date_index.py` keeps listings sorted by their normalized `whenDate` so
+    date-based queries are binary searches instead of scans.
+
+For events `whenDate` is the day of the event; for jobs and internships it is
+    the day the posting expires. Either way a listing whose date is before
+    today is in the past and is left out of results. Listings without a
+    parseable date are kept separately and never treated as past.
+
+Listing dates are the club's local wall-clock times stored as if they were
+    UTC, so "today" is the current day in `LISTING_TIMEZONE` expressed the
+    same way.
+"""
+
+import bisect
+import heapq
+import time
+from array import array
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from data_processing.listing import Listing
+
+DAY_SECONDS = 24 * 60 * 60
+# Column holding the normalized `whenDate`
+DATE_FIELD = "whenTimestamp"
+# Timezone the listings' dates and times are written in
+LISTING_TIMEZONE = ZoneInfo("America/New_York")
+
+
+def start_of_day(now: float | None = None, tz: ZoneInfo = LISTING_TIMEZONE) -> int:
+    """
+    Returns the start of the current day in `tz`, as epoch seconds of the
+        same wall-clock time in UTC like the listings' dates.
+
+    Listings dated earlier than this are in the past, so events happening and
+        postings expiring today are still shown until local midnight.
+
+    Args:
+        now (float | None): Current time in epoch seconds. Defaults to the
+            system clock.
+        tz (ZoneInfo): Timezone the listings' dates are written in.
+
+    Returns:
+        int: Start of the local day containing `now`.
+    """
+    if now is None:
+        now = time.time()
+    wall_clock = datetime.fromtimestamp(now, tz).replace(tzinfo=timezone.utc)
+    return int(wall_clock.timestamp() // DAY_SECONDS * DAY_SECONDS)
+
+
+class DateIndex:
+    """
+    Listing IDs sorted by date, with the date of each listing by ID.
+
+    Attributes:
+        timestamps (array): Sorted dates of the dated listings.
+        ids (array): Listing IDs in the same order as `timestamps`. Listings
+            with the same date keep their original order.
+        undated (list[int]): IDs of listings without a date, in order.
+    """
+
+    def __init__(self, listings: list[Listing], field: str = DATE_FIELD):
+        """
+        Args:
+            listings (list[Listing]): Listings to index. A listing's ID is its
+                position in this list.
+            field (str): Column holding each listing's date in epoch seconds.
+        """
+        dated: list[tuple[int, int]] = []
+        self.undated: list[int] = []
+        self._dates: list[Any] = []
+        for listing_id, listing in enumerate(listings):
+            value = listing.get(field)
+            self._dates.append(value)
+            if value is None or value == "":
+                self.undated.append(listing_id)
+            else:
+                dated.append((int(value), listing_id))
+        dated.sort()
+        self.timestamps = array("q", (timestamp for timestamp, _ in dated))
+        self.ids = array("I", (listing_id for _, listing_id in dated))
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def is_past(self, listing_id: int, cutoff: int) -> bool:
+        """
+        Returns whether a listing is dated before the cutoff.
+
+        Args:
+            listing_id (int): Listing ID.
+            cutoff (int): Epoch seconds, usually `start_of_day()`.
+
+        Returns:
+            bool: True if the listing has a date earlier than `cutoff`.
+        """
+        value = self._dates[listing_id]
+        return value is not None and value != "" and int(value) < cutoff
+
+    def between(self, start: int, end: int) -> list[int]:
+        """
+        Returns the IDs of listings dated in [start, end), earliest first.
+
+        Args:
+            start (int): Inclusive lower bound in epoch seconds.
+            end (int): Exclusive upper bound in epoch seconds.
+
+        Returns:
+            list[int]: Matching listing IDs.
+        """
+        low = bisect.bisect_left(self.timestamps, start)
+        high = bisect.bisect_left(self.timestamps, end, lo=low)
+        return list(self.ids[low:high])
+
+    def upcoming(
+        self, cutoff: int, k: int | None = None, include_undated: bool = True
+    ) -> tuple[list[int], int]:
+        """
+        Returns the listings dated on or after the cutoff, earliest first,
+            followed by the undated listings.
+
+        Args:
+            cutoff (int): Epoch seconds, usually `start_of_day()`.
+            k (int | None): Number of IDs to return. Returns all when None.
+            include_undated (bool): Append listings without a date.
+
+        Returns:
+            tuple[list[int], int]: Up to `k` listing IDs and the total number
+                of upcoming listings.
+        """
+        low = bisect.bisect_left(self.timestamps, cutoff)
+        total = len(self.timestamps) - low
+        high = len(self.timestamps) if k is None else min(low + k, len(self.ids))
+        result = list(self.ids[low:high])
+        if include_undated:
+            total += len(self.undated)
+            remaining = None if k is None else k - len(result)
+            result.extend(self.undated[:remaining])
+        return result, total
+
+    def current(self, cutoff: int, k: int | None = None) -> tuple[list[int], int]:
+        """
+        Returns the listings not dated before the cutoff, in their original
+            order. Only the listings dated on or after the cutoff and the
+            undated ones are visited, so past listings cost nothing.
+
+        Args:
+            cutoff (int): Epoch seconds, usually `start_of_day()`.
+            k (int | None): Number of IDs to return. Returns all when None.
+
+        Returns:
+            tuple[list[int], int]: Up to `k` listing IDs, lowest first, and
+                the total number of current listings.
+        """
+        low = bisect.bisect_left(self.timestamps, cutoff)
+        candidates = chain(self.ids[low:], self.undated)
+        total = len(self.timestamps) - low + len(self.undated)
+        if k is None:
+            return sorted(candidates), total
+        return heapq.nsmallest(k, candidates), total
@@ -3,118 +3,196 @@ events that match the inputted criteria or
 returns 5 upcoming events if no criteria is specified.
 """
 
-from typing import Any
+import functools
 
+from data_processing.date_index import DateIndex, start_of_day
 from data_processing.get_type_data import (
-    get_type_data,
+    get_types_data,
 )
+from data_processing.listing import Listing, ScoredListing, render_fragment
+from data_processing.ranking import SearchResult, rank_with_correction
+from data_processing.search_index import SearchIndex
+
+EVENT_TYPES = ("Event",)
+# Number of events rendered in a single !events reply
+EVENTS_PER_MESSAGE = 5
+# Key of the rendered event cached on each listing
+EVENT_FRAGMENT = "event"
+
+
+def search_events(
+    events: list[Listing],
+    _filters: str,
+    k: int | None = EVENTS_PER_MESSAGE,
+    index: SearchIndex | None = None,
+    dates: DateIndex | None = None,
+    cutoff: int | None = None,
+) -> SearchResult:
+    """
+    Finds the `k` most relevant events for the provided arguments.
+
+    When a date index is given, past events are skipped and, without
+        criteria, the soonest upcoming events are returned first. When no
+        event matches, misspelled terms are corrected and searched for instead.
 
+    Args:
+        events (list[Listing]): List of event listings.
+        _filters (str): Filter criteria as a string.
+        k (int | None): Number of events to return. Returns all when None.
+        index (SearchIndex | None): Index built from `events`. Built on the
+            fly when not provided.
+        dates (DateIndex | None): Index of the events' dates. Past events
+            are kept and file order is used when not provided.
+        cutoff (int | None): Events dated before this epoch time are past.
+            Defaults to the start of today.
 
-def filter_events(events: list[dict[str, Any]], _filters: str) -> list[dict[str, Any]]:
+    Returns:
+        SearchResult: Up to `k` events, most relevant first, each referenced
+            with its BM25 relevance score under "confidence", the total
+            number of matches and the corrected query, if any.
+    """
+    exclude = None
+    if dates is not None:
+        if cutoff is None:
+            cutoff = start_of_day()
+        exclude = functools.partial(dates.is_past, cutoff=cutoff)
+    if not _filters:
+        # Without criteria only the first few events are ever listed
+        limit = EVENTS_PER_MESSAGE if k is None else k
+        if dates is None:
+            return SearchResult(events[:limit], len(events))
+        upcoming, total = dates.upcoming(cutoff, limit)
+        return SearchResult([events[event_id] for event_id in upcoming], total)
+    if index is None:
+        index = SearchIndex(events)
+    ranked, total, corrected = rank_with_correction(index, _filters, k, exclude)
+    return SearchResult(
+        [
+            ScoredListing(events[event_id], confidence)
+            for event_id, confidence in ranked
+        ],
+        total,
+        corrected,
+    )
+
+
+def filter_events(
+    events: list[Listing],
+    _filters: str,
+    index: SearchIndex | None = None,
+) -> list[ScoredListing]:
     """
     Filters events based on the provided arguments.
 
     Args:
-        events (list[dict[str, Any]]): List of event dictionaries.
+        events (list[Listing]): List of event listings.
         _filters (str): Filter criteria as a string.
+        index (SearchIndex | None): Index built from `events`. Built on the
+            fly when not provided.
 
     Returns:
-        list[dict[str, Any]]: Filtered list of events.
+        list[ScoredListing]: Filtered list of events, most relevant first,
+            each referenced with its BM25 relevance score under "confidence".
     """
-    if not _filters:
-        return events[:5]
-    filtered_events = []
-    for event in events:
-        include_event = False
-        confidence = 0
-        search_terms = _filters.lower().split()
-        searchable_fields = [
-            event.get("Title", ""),
-            event.get("subType", ""),
-            event.get("Company", ""),
-            event.get("Description", ""),
-            event.get("Location", ""),
-            event.get("whenDate", ""),
-            event.get("pubDate", ""),
-        ]
-        for term in search_terms:
-            for field in searchable_fields:
-                if not field:
-                    break
-                if term in field.lower():
-                    include_event = True
-                    confidence += 1
-                    break
-        if include_event:
-            event.update({"confidence": confidence})
-            filtered_events.append(event)
-    filtered_events.sort(key=lambda x: x["confidence"], reverse=True)
-    return filtered_events
-
-
-def format_event_message(events: list[dict[str, Any]], _filters: str) -> str:
+    return search_events(events, _filters, None, index).listings
+
+
+def render_event(event: Listing | ScoredListing) -> str:
+    """
+    Renders one event as it appears in an !events reply.
+
+    Args:
+        event (Listing | ScoredListing): Event to render.
+
+    Returns:
+        str: The event's lines, followed by a blank line.
+    """
+    title = event.get("Title", "Unknown Event")
+    event_type = event.get("subType", "")
+    company = event.get("Company", "")
+    location = event.get("Location", "")
+    when_date = event.get("whenDate", "")
+
+    # Loaded listings hold their locations as a tuple
+    if isinstance(location, tuple):
+        location = ", ".join(location)
+
+    description = event.get("Description", "No description available.")
+    round_description = (
+        description[:80] + "..." if len(description) > 80 else description
+    )
+    link = event.get("link", "No link available.")
+
+    event_text = f"**{title}**\n"
+    if event_type:
+        event_text += f"**Type:** {event_type}\n"
+    if company:
+        event_text += f"Company: {company}\n"
+    if location:
+        event_text += f"Location: {location}\n"
+    if when_date:
+        event_text += f"Date: {when_date}\n"
+    event_text += f"Description: {round_description}\n"
+    event_text += f"[More Info]({link})\n\n"
+    return event_text
+
+
+def format_event_message(
+    events: list[Listing] | list[ScoredListing],
+    _filters: str,
+    total: int | None = None,
+    corrected: str | None = None,
+    offset: int | None = None,
+) -> str:
     """
     Formats a message listing the events which follows Discord message
         conventions.
 
     Args:
-        events (list[dict[str, Any]]): List of event dictionaries.
+        events (list[Listing] | list[ScoredListing]): List of events.
         _filters (str): Filter criteria as a string.
+        total (int | None): Number of events that matched, when `events` only
+            holds the top results. Defaults to len(events).
+        corrected (str | None): Spelling-corrected filters the events were
+            found with, announced as "did you mean".
+        offset (int | None): Position of the first event among all results
+            when the message is one page of them, shown in place of the
+            top-results note.
 
     Returns:
         str: Formatted message with event details.
     """
     if not events:
         return "No events found matching your criteria."
+    if total is None:
+        total = len(events)
     filter_events = f" (Filters: {_filters.strip()})" if _filters else ""
-    message = "**📅 Upcoming Events:**\n"
-    limited_events = events[:5]
-    for event in limited_events:
-        title = event.get("Title", "Unknown Event")
-        event_type = event.get("subType", "")
-        company = event.get("Company", "")
-        location = event.get("Location", "")
-        when_date = event.get("whenDate", "")
-
-        if (
-            isinstance(location, str)
-            and location.startswith("[")
-            and location.endswith("]")
-        ):
-            location = location[1:-1]
-
-        description = event.get("Description", "No description available.")
-        round_description = (
-            description[:80] + "..." if len(description) > 80 else description
-        )
-        link = event.get("link", "No link available.")
-
-        event_text = f"**{title}**\n"
-        if event_type:
-            event_text += f"**Type:** {event_type}\n"
-        if company:
-            event_text += f"Company: {company}\n"
-        if location:
-            event_text += f"Location: {location}\n"
-        if when_date:
-            event_text += f"Date: {when_date}\n"
-        event_text += f"Description: {round_description}\n"
-        event_text += f"[More Info]({link})\n\n"
-        message += event_text
-    message += f"Total events found: {len(events)}{filter_events}"
-    if len(events) > 5:
+    message = ""
+    if corrected:
+        message = f"🔎 Did you mean **{corrected}**? Showing results for it.\n\n"
+        filter_events = f" (Filters: {corrected})"
+    message += "**📅 Upcoming Events:**\n"
+    limited_events = events[:EVENTS_PER_MESSAGE]
+    message += "".join(
+        render_fragment(event, EVENT_FRAGMENT, render_event) for event in limited_events
+    )
+    message += f"Total events found: {total}{filter_events}"
+    if offset is not None:
+        last = offset + len(limited_events)
+        message += f"\nShowing events {offset + 1}-{last} of {total}."
+    elif total > EVENTS_PER_MESSAGE:
         message += "\n\nNote: Only the top 5 events are displayed based on relevance."
     return message
 
 
-def get_events(csv_file_path: str) -> list[dict[str, Any]]:
+def get_events(csv_file_path: str) -> list[Listing]:
     """
-    Retrieves events from a CSV file and returns them as a list of dictionaries.
+    Retrieves events from a CSV file and returns them as a list of listings.
 
     Args:
         csv_file_path (str): Path to the CSV file containing event data.
 
     Returns:
-        list[dict[str, Any]]: List of event dictionaries.
+        list[Listing]: List of event listings.
     """
-    return get_type_data(csv_file_path, "Event")
+    return get_types_data(csv_file_path, EVENT_TYPES)["Event"]
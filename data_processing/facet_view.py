@@ -0,0 +1,213 @@
+"""
+File `facet_view.py` builds the Discord components attached to `!events` and
+    `!jobs` replies: select menus narrowing the results by facet and buttons
+    paging through them.
+"""
+
+import contextlib
+import functools
+from collections.abc import Callable
+
+import discord
+
+from data_processing.cursors import CursorStore
+from data_processing.facets import FacetedResult
+
+# Seconds a reply's menus and buttons stay usable after the last interaction
+FACET_VIEW_TIMEOUT = 300
+# Discord option labels hold at most 100 characters
+MAX_LABEL_LENGTH = 100
+# Discord messages hold five rows of components; the last one holds the page
+# buttons when there is more than one page
+MAX_MENUS = 4
+EXPIRED_MESSAGE = "These results have expired. Please run the command again."
+NOT_AUTHOR_MESSAGE = "Only the member who ran this command can use these menus."
+
+
+def describe_filters(_filters: str, selections: tuple[tuple[str, str], ...]) -> str:
+    """
+    Describes the search terms and the facet values picked so far.
+
+    Args:
+        _filters (str): Filter criteria as a string.
+        selections (tuple[tuple[str, str], ...]): (facet, value) pairs picked.
+
+    Returns:
+        str: Text such as "python Company: Google".
+    """
+    picked = [f"{facet}: {value}" for facet, value in selections]
+    return " ".join([_filters.strip(), *picked]).strip()
+
+
+def option_label(value: str, count: int) -> str:
+    """
+    Labels a facet value with its count, shortening the value to fit.
+    """
+    suffix = f" ({count})"
+    limit = MAX_LABEL_LENGTH - len(suffix)
+    if len(value) > limit:
+        value = value[: limit - 1] + "…"
+    return value + suffix
+
+
+class FacetView(discord.ui.View):
+    """
+    Select menus that narrow a search reply by Type, subType, Company, State
+        and Remote/Hybrid, and buttons paging through it. Each option shows
+        how many results hold it, and picking one or paging edits the reply in
+        place.
+
+    The results stay in a server-side cursor; the view only holds its token
+        and the page shown, so neither paging nor narrowing searches again.
+
+    Attributes:
+        cursors (CursorStore): Store holding the results.
+        cursor_id (str): Token of the cursor over the results shown.
+        render (Callable[[FacetedResult, int], str]): Formats a page of results
+            as a message.
+        page_size (int): Results per page.
+        author_id (int | None): ID of the member who ran the command, the
+            only one allowed to use the controls. Anyone may when None.
+        page (int): Page shown, starting at 0.
+        message (discord.Message | None): Reply the view is attached to, set
+            by the sender so the controls can be removed on timeout.
+    """
+
+    def __init__(
+        self,
+        result: FacetedResult,
+        cursors: CursorStore,
+        render: Callable[[FacetedResult, int], str],
+        page_size: int,
+        author_id: int | None = None,
+        timeout: float | None = FACET_VIEW_TIMEOUT,
+    ):
+        """
+        Args:
+            result (FacetedResult): Results of the search being replied to.
+            cursors (CursorStore): Store to open the results' cursor in.
+            render (Callable[[FacetedResult, int], str]): Formats a page of
+                results as the reply's content.
+            page_size (int): Results per page.
+            author_id (int | None): ID of the member who ran the command.
+            timeout (float | None): Seconds of inactivity before the menus
+                and buttons stop responding.
+        """
+        super().__init__(timeout=timeout)
+        self.cursors = cursors
+        self.cursor_id = cursors.open(result)
+        self.render = render
+        self.page_size = page_size
+        self.author_id = author_id
+        self.page = 0
+        self.message: discord.Message | None = None
+        self._add_items(result)
+
+    def content(self) -> str:
+        """
+        Returns the reply's content for the page shown.
+        """
+        result = self.cursors.get(self.cursor_id)
+        if result is None:
+            return EXPIRED_MESSAGE
+        return self.render(result, self.page)
+
+    def _add_items(self, result: FacetedResult) -> None:
+        """
+        Replaces the menus with one per facet that can still narrow the
+            results, followed by the page buttons.
+        """
+        self.clear_items()
+        pages = result.page_count(self.page_size)
+        # A value every result holds cannot narrow them
+        facets = [
+            (facet, counts)
+            for facet, counts in result.counts().items()
+            if counts and not (len(counts) == 1 and counts[0][1] == result.total)
+        ]
+        # Without page buttons, their row can hold one more menu
+        for facet, counts in facets[: MAX_MENUS if pages > 1 else MAX_MENUS + 1]:
+            select = discord.ui.Select(
+                placeholder=f"Filter by {facet}",
+                options=[
+                    discord.SelectOption(
+                        label=option_label(value, count), value=str(position)
+                    )
+                    for position, (value, count) in enumerate(counts)
+                ],
+            )
+            values = [value for value, _ in counts]
+            select.callback = functools.partial(self._on_select, facet, select, values)
+            self.add_item(select)
+        if pages > 1:
+            for label, step, disabled in (
+                ("◀ Prev", -1, self.page == 0),
+                ("Next ▶", 1, self.page >= pages - 1),
+            ):
+                button = discord.ui.Button(label=label, disabled=disabled)
+                button.callback = functools.partial(self._on_page, step)
+                self.add_item(button)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """
+        Lets only the member who ran the command narrow or page the reply.
+        """
+        if self.author_id is None or interaction.user.id == self.author_id:
+            return True
+        await interaction.response.send_message(NOT_AUTHOR_MESSAGE, ephemeral=True)
+        return False
+
+    async def _expire(self, interaction: discord.Interaction) -> None:
+        """
+        Tells the user the results expired and removes the controls.
+        """
+        self.stop()
+        await interaction.response.edit_message(content=EXPIRED_MESSAGE, view=None)
+
+    async def _on_select(
+        self,
+        facet: str,
+        select: discord.ui.Select,
+        values: list[str],
+        interaction: discord.Interaction,
+    ) -> None:
+        """
+        Narrows the results to the picked value and shows their first page.
+        """
+        result = self.cursors.get(self.cursor_id)
+        if result is None:
+            await self._expire(interaction)
+            return
+        result = result.narrow(facet, values[int(select.values[0])])
+        self.cursors.close(self.cursor_id)
+        self.cursor_id = self.cursors.open(result)
+        self.page = 0
+        self._add_items(result)
+        await interaction.response.edit_message(
+            content=self.render(result, self.page), view=self
+        )
+
+    async def _on_page(self, step: int, interaction: discord.Interaction) -> None:
+        """
+        Shows the previous or next page of the results.
+        """
+        result = self.cursors.get(self.cursor_id)
+        if result is None:
+            await self._expire(interaction)
+            return
+        self.page = min(max(self.page + step, 0), result.page_count(self.page_size) - 1)
+        self._add_items(result)
+        await interaction.response.edit_message(
+            content=self.render(result, self.page), view=self
+        )
+
+    async def on_timeout(self) -> None:
+        """
+        Closes the cursor and removes the controls once they stop responding.
+        """
+        self.cursors.close(self.cursor_id)
+        if self.message is None:
+            return
+        # The reply may have been deleted or can no longer be edited
+        with contextlib.suppress(discord.HTTPException):
+            await self.message.edit(view=None)
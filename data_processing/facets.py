@@ -0,0 +1,302 @@
+"""
+File `facets.py` counts search results by Type, subType, Company, State and
+    Remote/Hybrid so replies can offer them as filters.
+
+Each snapshot precomputes a bitmap per facet value from the index's category
+    codes and location postings, along with how many listings hold it. The
+    count of a value among the results of a query is then the population
+    count of the intersection of two bitmaps, and picking a value narrows the
+    results with the same intersection, so the listings are never rescanned
+    and the query is never re-run.
+"""
+
+import functools
+from array import array
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from data_processing.bitmap import from_ids, to_ids
+from data_processing.date_index import DateIndex
+from data_processing.listing import Listing, ScoredListing
+from data_processing.ranking import rank_with_correction
+from data_processing.search_index import SearchIndex
+
+FACETS = ("Type", "subType", "Company", "State", "Remote/Hybrid")
+# Discord select menus hold at most 25 options
+MAX_FACET_VALUES = 25
+
+
+class FacetIndex:
+    """
+    Bitmaps of the listings holding each facet value.
+
+    Attributes:
+        postings (dict[str, dict[str, int]]): Facet to value to the bitmap of
+            the listings holding it.
+        counts (dict[str, dict[str, int]]): Facet to value to the number of
+            listings holding it.
+        all_bits (int): Bitmap of every listing.
+    """
+
+    def __init__(self, listings: list[Listing], index: SearchIndex):
+        """
+        Args:
+            listings (list[Listing]): Listings `index` was built from.
+            index (SearchIndex): Index of `listings`.
+        """
+        self.all_bits = index.all_bits
+        self.postings: dict[str, dict[str, int]] = {}
+        for field in FACETS[:3]:
+            values: dict[str, int] = {}
+            for listing_ids in index.category_postings[field].values():
+                # Codes fold case, so label a value as its first listing has it
+                label = str(listings[min(listing_ids)].get(field) or "").strip()
+                if label:
+                    values[label] = from_ids(listing_ids)
+            self.postings[field] = values
+        self.postings["State"] = {
+            state: from_ids(listing_ids)
+            for state, listing_ids in sorted(index.locations.states.items())
+        }
+        self.postings["Remote/Hybrid"] = {
+            flag.capitalize(): from_ids(listing_ids)
+            for flag, listing_ids in index.locations.flags.items()
+            if listing_ids
+        }
+        self.counts = {
+            facet: {value: bits.bit_count() for value, bits in values.items()}
+            for facet, values in self.postings.items()
+        }
+
+    def facet_counts(
+        self, bits: int, limit: int = MAX_FACET_VALUES
+    ) -> dict[str, list[tuple[str, int]]]:
+        """
+        Counts the listings of a result set per facet value.
+
+        Args:
+            bits (int): Bitmap of the result set.
+            limit (int): Maximum number of values per facet.
+
+        Returns:
+            dict[str, list[tuple[str, int]]]: Facet to (value, count) pairs,
+                most frequent first, leaving out values with no listings.
+        """
+        result = {}
+        for facet, values in self.postings.items():
+            if bits == self.all_bits:
+                counts = self.counts[facet].items()
+            else:
+                counts = (
+                    (value, (bits & value_bits).bit_count())
+                    for value, value_bits in values.items()
+                )
+            ranked = sorted(
+                ((value, count) for value, count in counts if count),
+                key=lambda pair: (-pair[1], pair[0]),
+            )
+            result[facet] = ranked[:limit]
+        return result
+
+
+class FacetedResult:
+    """
+    The full ranking of a query, narrowed by the facet values picked so far.
+
+    The ranking is kept as two flat arrays rather than a list of tuples, so a
+        result of thousands of listings costs a few bytes per listing while it
+        is cached or held open for paging.
+
+    Attributes:
+        listings (list[Listing]): Listings the ranking refers to.
+        facets (FacetIndex): Facet bitmaps of `listings`.
+        ids (array): Listing IDs, best first.
+        scores (array): Score of each listing in `ids`.
+        bits (int): Bitmap of the IDs in `ids`.
+        scored (bool): Whether results are returned with their score.
+        selections (tuple[tuple[str, str], ...]): (facet, value) pairs picked.
+        corrected (str | None): Spelling-corrected filters the results were
+            found with.
+        key (Hashable | None): Query cache key the results are stored under,
+            naming the kind, normalized query, snapshot generation and day.
+            None for results narrowed from them.
+    """
+
+    def __init__(
+        self,
+        listings: list[Listing],
+        facets: FacetIndex,
+        ranked: Iterable[tuple[int, float]],
+        scored: bool = True,
+        selections: tuple[tuple[str, str], ...] = (),
+        bits: int | None = None,
+        corrected: str | None = None,
+    ):
+        """
+        Args:
+            listings (list[Listing]): Listings the ranking refers to.
+            facets (FacetIndex): Facet bitmaps of `listings`.
+            ranked (Iterable[tuple[int, float]]): (listing ID, score) pairs,
+                best first.
+            scored (bool): Return results as ScoredListing.
+            selections (tuple[tuple[str, str], ...]): Facet values picked.
+            bits (int | None): Bitmap of the IDs in `ranked`, when known.
+            corrected (str | None): Spelling-corrected filters, if any.
+        """
+        self.listings = listings
+        self.facets = facets
+        self.ids = array("I")
+        self.scores = array("d")
+        for listing_id, score in ranked:
+            self.ids.append(listing_id)
+            self.scores.append(score)
+        if bits is None:
+            bits = from_ids(self.ids)
+        self.bits = bits
+        self.scored = scored
+        self.selections = selections
+        self.corrected = corrected
+        self.key: Hashable | None = None
+
+    @property
+    def ranked(self) -> list[tuple[int, float]]:
+        """
+        (listing ID, score) pairs, best first.
+        """
+        return list(zip(self.ids, self.scores))
+
+    @property
+    def total(self) -> int:
+        """
+        Number of listings in the result set.
+        """
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by the ranking and its bitmap, in bytes. The
+            listings and facets are shared with the snapshot and not counted.
+        """
+        return (
+            self.ids.itemsize * len(self.ids)
+            + self.scores.itemsize * len(self.scores)
+            + (self.bits.bit_length() + 7) // 8
+        )
+
+    def page(self, number: int, size: int) -> list[Any]:
+        """
+        Returns one page of the ranking.
+
+        Args:
+            number (int): Page number, starting at 0.
+            size (int): Number of listings per page.
+
+        Returns:
+            list[Listing] | list[ScoredListing]: Up to `size` listings.
+        """
+        start = max(number, 0) * size
+        ids = self.ids[start : start + size]
+        if not self.scored:
+            return [self.listings[listing_id] for listing_id in ids]
+        scores = self.scores[start : start + size]
+        return [
+            ScoredListing(self.listings[listing_id], score)
+            for listing_id, score in zip(ids, scores)
+        ]
+
+    def page_count(self, size: int) -> int:
+        """
+        Returns the number of pages of `size` listings, at least 1.
+        """
+        return max(1, -(-self.total // size))
+
+    def top(self, k: int) -> list[Any]:
+        """
+        Returns the best `k` listings.
+
+        Args:
+            k (int): Number of listings.
+
+        Returns:
+            list[Listing] | list[ScoredListing]: Up to `k` listings.
+        """
+        return self.page(0, k)
+
+    def counts(self) -> dict[str, list[tuple[str, int]]]:
+        """
+        Counts the result set per value of the facets not picked yet.
+
+        Returns:
+            dict[str, list[tuple[str, int]]]: Facet to (value, count) pairs.
+        """
+        picked = {facet for facet, _ in self.selections}
+        return {
+            facet: values
+            for facet, values in self.facets.facet_counts(self.bits).items()
+            if facet not in picked
+        }
+
+    def narrow(self, facet: str, value: str) -> "FacetedResult":
+        """
+        Returns the results holding a facet value, in the same order.
+
+        Args:
+            facet (str): One of FACETS.
+            value (str): Value of the facet.
+
+        Returns:
+            FacetedResult: The narrowed results.
+        """
+        bits = self.bits & self.facets.postings[facet].get(value, 0)
+        kept = set(to_ids(bits))
+        return FacetedResult(
+            self.listings,
+            self.facets,
+            (pair for pair in zip(self.ids, self.scores) if pair[0] in kept),
+            self.scored,
+            self.selections + ((facet, value),),
+            bits,
+            self.corrected,
+        )
+
+
+def faceted_search(
+    listings: list[Listing],
+    _filters: str,
+    index: SearchIndex,
+    dates: DateIndex,
+    facets: FacetIndex,
+    cutoff: int,
+    upcoming_first: bool = False,
+) -> FacetedResult:
+    """
+    Ranks every listing matching the filters, for narrowing by facets.
+
+    Past listings are left out and misspelled terms are corrected as in
+        `search_jobs` and `search_events`.
+
+    Args:
+        listings (list[Listing]): Listings to search.
+        _filters (str): Filter criteria as a string.
+        index (SearchIndex): Index of `listings`.
+        dates (DateIndex): Date index of `listings`.
+        facets (FacetIndex): Facet bitmaps of `listings`.
+        cutoff (int): Listings dated before this epoch time are past.
+        upcoming_first (bool): Without filters, order the listings by date
+            instead of keeping their order.
+
+    Returns:
+        FacetedResult: Every matching listing, best first.
+    """
+    if _filters.strip():
+        exclude = functools.partial(dates.is_past, cutoff=cutoff)
+        ranked, _, corrected = rank_with_correction(index, _filters, None, exclude)
+        return FacetedResult(listings, facets, ranked, corrected=corrected)
+    if upcoming_first:
+        listing_ids, _ = dates.upcoming(cutoff)
+    else:
+        listing_ids, _ = dates.current(cutoff)
+    return FacetedResult(
+        listings, facets, [(listing_id, 0.0) for listing_id in listing_ids], False
+    )
@@ -3,41 +3,50 @@ File `get_type_data.py` is responsible for retrieving specific types of data
     from a CSV file.
 """
 
-import datetime
-from typing import Any
+from collections.abc import Iterable
 
 from data_collections.csv_updater import (
     extract_entries_from_csv,
 )
+from data_processing.listing import Listing
 
 
-def get_type_data(csv_file_path: str, data_type: str) -> list[dict[str, Any]]:
+def get_types_data(
+    csv_file_path: str, data_types: Iterable[str] | None = None
+) -> dict[str, list[Listing]]:
+    """
+    Retrieves data of several types from a CSV file in a single pass and
+        returns it grouped by the `Type` column.
+
+    Args:
+        csv_file_path (str): Path to the CSV file containing data.
+        data_types (Iterable[str] | None): Types of data to retrieve
+            (e.g., {"Job", "Internship"}). Retrieves every type when None.
+
+    Returns:
+        dict[str, list[Listing]]: Lists of listings keyed by type. Every
+            requested type is present, even when it has no entries.
+    """
+    wanted = set(data_types) if data_types is not None else None
+    grouped: dict[str, list[Listing]] = {data_type: [] for data_type in wanted or ()}
+    for entry in extract_entries_from_csv(csv_file_path):
+        entry_type = entry.get("Type")
+        if wanted is not None and entry_type not in wanted:
+            continue
+        grouped.setdefault(entry_type, []).append(Listing.from_entry(entry))
+    return grouped
+
+
+def get_type_data(csv_file_path: str, data_type: str) -> list[Listing]:
     """
     Retrieves data of a specific type from a CSV file and returns it as a
-        list of dictionaries.
+        list of listings.
 
     Args:
         csv_file_path (str): Path to the CSV file containing data.
         data_type (str): Type of data to retrieve (e.g., "event").
 
     Returns:
-        list[dict[str, Any]]: List of dictionaries containing the specified
-            type of data.
+        list[Listing]: List of listings of the specified type.
     """
-    items = []
-    for entry in extract_entries_from_csv(csv_file_path):
-        if entry.get("Type") == data_type:
-            item = {
-                "Type": entry.get("Type", ""),
-                "subType": entry.get("subType", ""),
-                "Company": entry.get("Company", ""),
-                "Title": entry.get("Title", ""),
-                "Description": entry.get("Description", ""),
-                "whenDate": entry.get("whenDate", ""),
-                "pubDate": entry.get("pubDate", ""),
-                "Location": entry.get("Location", ""),
-                "link": entry.get("link", ""),
-                "entryDate": datetime.datetime.now(tz=datetime.timezone.utc),
-            }
-            items.append(item)
-    return items
+    return get_types_data(csv_file_path, {data_type})[data_type]
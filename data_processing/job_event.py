@@ -2,117 +2,193 @@
 jobs that match the inputted criteria.
 """
 
-from datetime import datetime
-from typing import Any
+import functools
+from datetime import datetime, timezone
 
+from data_collections.dates import parse_pub_date
+from data_processing.date_index import DateIndex, start_of_day
 from data_processing.get_type_data import (
-    get_type_data,
+    get_types_data,
 )
+from data_processing.listing import Listing, ScoredListing, render_fragment
+from data_processing.ranking import SearchResult, rank_with_correction
+from data_processing.search_index import SearchIndex
+
+JOB_TYPES = ("Job", "Internship")
+# Number of jobs rendered in a single !jobs reply
+JOBS_PER_MESSAGE = 5
+# Key of the rendered job cached on each listing
+JOB_FRAGMENT = "job"
+
+
+def search_jobs(
+    jobs: list[Listing],
+    _filters: str,
+    k: int | None = JOBS_PER_MESSAGE,
+    index: SearchIndex | None = None,
+    dates: DateIndex | None = None,
+    cutoff: int | None = None,
+) -> SearchResult:
+    """
+    Finds the `k` most relevant jobs for the provided criteria.
+
+    When a date index is given, jobs whose posting has expired are skipped.
+        When no job matches, misspelled terms are corrected and searched for
+        instead.
 
+    Args:
+        jobs (list): List of job listings
+        _filters (str): String of filter criteria
+        k (int, optional): Number of jobs to return. Returns all when None.
+        index (SearchIndex, optional): Index built from `jobs`. Built on the
+            fly when not provided.
+        dates (DateIndex, optional): Index of the jobs' expiry dates.
+            Expired jobs are kept when not provided.
+        cutoff (int, optional): Jobs expiring before this epoch time are
+            expired. Defaults to the start of today.
 
-def filter_jobs(jobs: list[dict[str, Any]], _filters: str) -> list[dict[str, Any]]:
+    Returns:
+        SearchResult: Up to `k` jobs, most relevant first, each referenced
+            with its BM25 relevance score under "confidence", the total
+            number of matches and the corrected query, if any
+    """
+    exclude = None
+    if dates is not None:
+        if cutoff is None:
+            cutoff = start_of_day()
+        exclude = functools.partial(dates.is_past, cutoff=cutoff)
+    if not _filters:
+        if exclude is None:
+            return SearchResult(jobs if k is None else jobs[:k], len(jobs))
+        current, total = dates.current(cutoff, k)
+        return SearchResult([jobs[job_id] for job_id in current], total)
+    if index is None:
+        index = SearchIndex(jobs)
+    ranked, total, corrected = rank_with_correction(index, _filters, k, exclude)
+    return SearchResult(
+        [ScoredListing(jobs[job_id], confidence) for job_id, confidence in ranked],
+        total,
+        corrected,
+    )
+
+
+def filter_jobs(
+    jobs: list[Listing],
+    _filters: str,
+    index: SearchIndex | None = None,
+) -> list[ScoredListing]:
     """
     Filters jobs based on provided criteria
 
     Args:
-        jobs (list): List of job dictionaries
+        jobs (list): List of job listings
         _filters (str): String of filter criteria
+        index (SearchIndex, optional): Index built from `jobs`. Built on the
+            fly when not provided.
 
     Returns:
-        list: Filtered list of jobs
+        list: Filtered list of jobs, most relevant first, each referenced with
+            its BM25 relevance score under "confidence"
     """
-    if not _filters:
-        return jobs
-    filtered_jobs = []
-    for job in jobs:
-        include_job = False
-        confidence = 0
-        search_terms = _filters.split()
-        searchable_fields = [
-            job.get("Title", ""),
-            job.get("subType", ""),
-            job.get("Company", ""),
-            job.get("Description", ""),
-            job.get("Location", ""),
-            job.get("whenDate", ""),
-            job.get("pubDate", ""),
-        ]
-        for term in search_terms:
-            for field in searchable_fields:
-                if term.lower() in field.lower():
-                    include_job = True
-                    confidence += 1
-                    break
-        if include_job:
-            filtered_jobs.append({**job, "confidence": confidence})
-    filtered_jobs = sorted(filtered_jobs, key=lambda x: x["confidence"], reverse=True)
-    return filtered_jobs
-
-
-def format_jobs_message(jobs: list[dict[str, Any]], _filters: str) -> str:
+    return search_jobs(jobs, _filters, None, index).listings
+
+
+def render_job(job: Listing | ScoredListing) -> str:
+    """
+    Renders one job as it appears in a !jobs reply.
+
+    Args:
+        job (Listing | ScoredListing): Job to render.
+
+    Returns:
+        str: The job's lines, followed by a blank line.
+    """
+    title = job.get("Title", "Untitled Position")
+    job_type = job.get("Type", "")
+    company_name = job.get("Company", "")
+    location = job.get("Location", "")
+    # Loaded listings hold their locations as a tuple
+    location_str = ", ".join(location) if isinstance(location, tuple) else str(location)
+
+    description = job.get("Description", "")
+    when_date = job.get("whenDate", "")
+    pub_date = job.get("pubDate", "")
+    pub_timestamp = job.get("pubTimestamp")
+    link = job.get("link", "")
+    formatted_pub_date = pub_date
+
+    # Dates are parsed once at ingest; rows without the column are parsed
+    # here, and unparseable dates are shown as is
+    if pub_timestamp in (None, "") and pub_date:
+        pub_timestamp = parse_pub_date(pub_date)
+    if pub_timestamp not in (None, ""):
+        formatted_pub_date = datetime.fromtimestamp(
+            pub_timestamp, timezone.utc
+        ).strftime("%b %d %Y")
+
+    job_text = f"**{title}**\n"
+    job_text += f"📝 {job_type}\n"
+    job_text += f"🏢 {company_name}\n"
+    if location_str.strip():
+        job_text += f"📍 {location_str}\n"
+    if when_date:
+        job_text += f"📅 Start Date: {when_date}\n"
+    if pub_date:
+        job_text += f"📅 Posted: {formatted_pub_date}\n"
+    if description:
+        job_text += f"📝 {description}\n"
+    if link:
+        job_text += f"🔗 [Apply Here](<{link}>)\n"
+    return job_text + "\n"
+
+
+def format_jobs_message(
+    jobs: list[Listing] | list[ScoredListing],
+    _filters: str,
+    total: int | None = None,
+    corrected: str | None = None,
+    offset: int | None = None,
+) -> str:
     """
     Formats job results into a Discord message.
 
     Args:
-        jobs (list): List of job dictionaries
+        jobs (list): List of job listings
         _filters (str, optional): Applied filters for context
+        total (int, optional): Number of jobs that matched, when `jobs` only
+            holds the top results. Defaults to len(jobs).
+        corrected (str, optional): Spelling-corrected filters the jobs were
+            found with, announced as "did you mean".
+        offset (int, optional): Position of the first job among all results
+            when the message is one page of them. The footer then shows the
+            range displayed instead of asking for narrower filters.
 
     Returns:
         str: Formatted message string
     """
     if not jobs:
         return "💼 No jobs found matching your criteria."
+    if total is None:
+        total = len(jobs)
     filter_text = f" (Filters: {_filters.strip()})" if _filters else ""
-    message = f"💼 **Found {len(jobs)} job(s):{filter_text}**\n\n"
-    limited_jobs = jobs[:5]
-    for job in limited_jobs:
-        title = job.get("Title", "Untitled Position")
-        job_type = job.get("Type", "")
-        company_name = job.get("Company", "")
-        location = job.get("Location", "")
-
-        if (
-            isinstance(location, str)
-            and location.startswith("[")
-            and location.endswith("]")
-        ):
-            location_str = location.replace("[", "").replace("]", "").replace("'", "")
-        else:
-            location_str = str(location)
-
-        description = job.get("Description", "")
-        when_date = job.get("whenDate", "")
-        pub_date = job.get("pubDate", "")
-        link = job.get("link", "")
-        formatted_pub_date = pub_date
-
-        if pub_date:
-            try:
-                dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %z")
-                formatted_pub_date = dt.strftime("%b %d %Y")
-            except Exception:
-                formatted_pub_date = pub_date
-
-        job_text = f"**{title}**\n"
-        job_text += f"📝 {job_type}\n"
-        job_text += f"🏢 {company_name}\n"
-        if location_str.strip():
-            job_text += f"📍 {location_str}\n"
-        if when_date:
-            job_text += f"📅 Start Date: {when_date}\n"
-        if pub_date:
-            job_text += f"📅 Posted: {formatted_pub_date}\n"
-        if description:
-            job_text += f"📝 {description}\n"
-        if link:
-            job_text += f"🔗 [Apply Here](<{link}>)\n"
-        message += job_text + "\n"
-    if len(jobs) > 5:
-        message += f"... and {len(jobs) - 5} more jobs. Use more specific filters to narrow results."  # noqa: E501
+    message = ""
+    if corrected:
+        message = f"🔎 Did you mean **{corrected}**? Showing results for it.\n\n"
+        filter_text = f" (Filters: {corrected})"
+    message += f"💼 **Found {total} job(s):{filter_text}**\n\n"
+    limited_jobs = jobs[:JOBS_PER_MESSAGE]
+    message += "".join(
+        render_fragment(job, JOB_FRAGMENT, render_job) for job in limited_jobs
+    )
+    if offset is not None:
+        last = offset + len(limited_jobs)
+        message += f"Showing jobs {offset + 1}-{last} of {total}."
+    elif total > JOBS_PER_MESSAGE:
+        message += f"... and {total - JOBS_PER_MESSAGE} more jobs. Use more specific filters to narrow results."  # noqa: E501
     return message
 
 
-def get_jobs(csv_file_path: str) -> list[dict[str, Any]]:
+def get_jobs(csv_file_path: str) -> list[Listing]:
     """
     Reads job and internship data from CSV file and filters based on command parameters.
 
@@ -120,12 +196,11 @@ def get_jobs(csv_file_path: str) -> list[dict[str, Any]]:
         csv_file_path (str): Path to the CSV file containing job data
 
     Returns:
-        list: List of job dictionaries matching the criteria
+        list: List of job listings matching the criteria
     """
     try:
-        jobs = get_type_data(csv_file_path, "Job")
-        _jobs = get_type_data(csv_file_path, "Internship")
-        jobs.extend(_jobs)
+        grouped = get_types_data(csv_file_path, JOB_TYPES)
+        jobs = [job for job_type in JOB_TYPES for job in grouped[job_type]]
     except RuntimeError:
         print("Error loading or filtering jobs from CSV")
         raise
@@ -0,0 +1,244 @@
+"""
+File `listing.py` defines the compact record types shared by the loaders,
+    filters and formatters.
+
+`Listing` replaces the per-row dictionaries previously built for every CSV
+    row: it stores its columns in `__slots__`, cannot be modified after it is
+    created, and still supports the `listing["Title"]` / `listing.get(...)`
+    access the formatters use. `ScoredListing` pairs a listing with a search
+    score without copying it.
+
+Values of the categorical columns, which repeat across many listings (the
+    same employer or location on dozens of postings), are interned so every
+    listing shares a single copy of each distinct string.
+
+`Location` is parsed into a tuple of individual locations when the listing
+    is created.
+
+The timestamp columns hold epoch seconds (or None) computed when the entry was
+    collected; for rows stored before those columns existed they are computed
+    once at load, so readers never parse date strings.
+
+Each listing also caches the text it is shown as in replies. The text is
+    rendered when the snapshot loads, so a reply only joins the texts of the
+    listings it shows.
+"""
+
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from data_collections.dates import TIMESTAMP_COLUMNS, add_timestamps
+from data_collections.locations import parse_locations
+
+FIELDS = (
+    "Type",
+    "subType",
+    "Company",
+    "Title",
+    "Description",
+    "whenDate",
+    "pubDate",
+    "Location",
+    "link",
+    "entryDate",
+    *TIMESTAMP_COLUMNS,
+)
+
+# Columns whose values repeat heavily across listings
+CATEGORICAL_FIELDS = ("Type", "subType", "Company", "Location")
+
+
+class Listing:
+    """
+    Immutable record for one event, job or internship.
+    """
+
+    __slots__ = (*FIELDS, "_fragments")
+
+    def __init__(self, **fields: Any):
+        """
+        Args:
+            **fields (Any): Column values keyed by column name. Missing
+                columns default to an empty string, or None for timestamps.
+                `Location` may be given in its stored form and is parsed into
+                a tuple.
+
+        Raises:
+            TypeError: If an unknown column is given.
+        """
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown listing fields: {', '.join(sorted(unknown))}")
+        for field in FIELDS:
+            value = fields.get(field, None if field in TIMESTAMP_COLUMNS else "")
+            if field == "Location":
+                value = tuple(
+                    sys.intern(location) for location in parse_locations(value)
+                )
+            elif field in CATEGORICAL_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, "_fragments", None)
+
+    @classmethod
+    def from_entry(cls, entry: Mapping[str, Any]) -> "Listing":
+        """
+        Builds a listing from a CSV row or database row, ignoring extra keys.
+
+        Timestamp columns are converted to integers, or computed from the date
+            columns when the row has none.
+
+        Args:
+            entry (Mapping[str, Any]): Row keyed by column name.
+
+        Returns:
+            Listing: The new listing.
+        """
+        fields = {field: entry.get(field, "") for field in FIELDS}
+        if any(column not in entry for column in TIMESTAMP_COLUMNS):
+            add_timestamps(fields)
+        for column in TIMESTAMP_COLUMNS:
+            value = fields[column]
+            fields[column] = None if value in (None, "") else int(value)
+        return cls(**fields)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Listing is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Listing is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns a column value, or `default` for unknown columns.
+        """
+        if key not in FIELDS:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> tuple[str, ...]:
+        return FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the listing as a plain dictionary.
+        """
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def fragment(self, kind: str, render: Callable[["Listing"], str]) -> str:
+        """
+        Returns the listing rendered for a kind of reply, rendering it on the
+            first call only. The listing cannot change, so the text stays
+            valid for as long as the listing exists.
+
+        Args:
+            kind (str): Name of the rendering, such as "job".
+            render (Callable[[Listing], str]): Renders the listing.
+
+        Returns:
+            str: The rendered text.
+        """
+        fragments = self._fragments
+        if fragments is None:
+            fragments = {}
+            object.__setattr__(self, "_fragments", fragments)
+        text = fragments.get(kind)
+        if text is None:
+            text = fragments[kind] = render(self)
+        return text
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Listing):
+            return self._values() == other._values()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return f"Listing(Type={self.Type!r}, Title={self.Title!r}, link={self.link!r})"
+
+
+class ScoredListing:
+    """
+    Reference to a listing together with its search relevance score.
+
+    Reads fall through to the listing, and the score is available as
+        `scored["confidence"]`, matching the dictionaries filters used to
+        return.
+    """
+
+    __slots__ = ("listing", "confidence")
+
+    def __init__(self, listing: Listing | Mapping[str, Any], confidence: float):
+        """
+        Args:
+            listing (Listing | Mapping[str, Any]): The matched listing.
+            confidence (float): Its relevance score.
+        """
+        self.listing = listing
+        self.confidence = confidence
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "confidence":
+            return self.confidence
+        return self.listing[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns a column value or the score, or `default` if absent.
+        """
+        if key == "confidence":
+            return self.confidence
+        return self.listing.get(key, default)
+
+    def keys(self) -> tuple[str, ...]:
+        return (*self.listing.keys(), "confidence")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ScoredListing):
+            return (self.listing, self.confidence) == (
+                other.listing,
+                other.confidence,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.listing, self.confidence))
+
+    def __repr__(self) -> str:
+        return f"ScoredListing({self.listing!r}, confidence={self.confidence!r})"
+
+
+def render_fragment(item: Any, kind: str, render: Callable[[Any], str]) -> str:
+    """
+    Renders a listing, scored listing or plain row, reusing the text cached on
+        the listing when there is one.
+
+    Args:
+        item (Any): Listing, ScoredListing or row mapping.
+        kind (str): Name of the rendering, such as "job".
+        render (Callable[[Any], str]): Renders a listing or row.
+
+    Returns:
+        str: The rendered text.
+    """
+    listing = item.listing if isinstance(item, ScoredListing) else item
+    if isinstance(listing, Listing):
+        return listing.fragment(kind, render)
+    return render(listing)
@@ -0,0 +1,200 @@
+"""
+File `listing_store.py` keeps a process-wide, in-memory copy of the listings
+    stored in `runningCSV.csv` so commands do not re-parse the file per message.
+    A SQLite database created by `data_collections.sqlite_store` (a path ending
+    in .db, .sqlite or .sqlite3) can be used as the source instead.
+
+The file is re-read only when its modification time or size changes. Each
+    reload builds a brand-new `Snapshot` and swaps it in with a single
+    reference assignment, so callers holding an older snapshot keep a complete,
+    consistent dataset until they are done with it.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+
+from data_collections.sqlite_store import fetch_types_data
+from data_processing.autocomplete import AutocompleteIndex
+from data_processing.date_index import DateIndex
+from data_processing.event_command import EVENT_FRAGMENT, EVENT_TYPES, render_event
+from data_processing.facets import FacetIndex
+from data_processing.get_type_data import get_types_data
+from data_processing.job_event import JOB_FRAGMENT, JOB_TYPES, render_job
+from data_processing.listing import Listing
+from data_processing.search_index import SearchIndex
+
+CSV_FILE_PATH = "data_collections/runningCSV.csv"
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Immutable view of the listings loaded from one version of the CSV file.
+
+    Attributes:
+        generation (int): Increases by one every time the file is reloaded.
+        signature (tuple[int, ...]): (mtime_ns, size) of the source file(s)
+            when loaded.
+        events (list[Listing]): Event listings.
+        jobs (list[Listing]): Job and internship listings.
+        events_index (SearchIndex): Inverted index over `events`.
+        jobs_index (SearchIndex): Inverted index over `jobs`.
+        events_by_date (DateIndex): `events` sorted by event date.
+        jobs_by_date (DateIndex): `jobs` sorted by expiry date.
+        events_suggestions (AutocompleteIndex): Autocomplete over `events`.
+        jobs_suggestions (AutocompleteIndex): Autocomplete over `jobs`.
+        events_facets (FacetIndex): Facet bitmaps of `events`.
+        jobs_facets (FacetIndex): Facet bitmaps of `jobs`.
+    """
+
+    generation: int
+    signature: tuple[int, ...]
+    events: list[Listing]
+    jobs: list[Listing]
+    events_index: SearchIndex
+    jobs_index: SearchIndex
+    events_by_date: DateIndex
+    jobs_by_date: DateIndex
+    events_suggestions: AutocompleteIndex
+    jobs_suggestions: AutocompleteIndex
+    events_facets: FacetIndex
+    jobs_facets: FacetIndex
+
+
+class ListingStore:
+    """
+    Loads listings from a CSV file once and hot-reloads them when it changes.
+    """
+
+    def __init__(self, csv_file_path: str = CSV_FILE_PATH):
+        """
+        Args:
+            csv_file_path (str): Path to the CSV file containing listing data,
+                or to a SQLite listings database.
+        """
+        self.csv_file_path = csv_file_path
+        self.is_sqlite = csv_file_path.endswith(SQLITE_SUFFIXES)
+        self._snapshot: Snapshot | None = None
+        self._reload_lock = threading.Lock()
+
+    def _file_signature(self) -> tuple[int, ...]:
+        """
+        Returns the (mtime_ns, size) values used to detect changes to the file.
+
+        A SQLite database in WAL mode commits to its `-wal` file first, so that
+            file is included when it exists.
+
+        Raises:
+            OSError: If the file cannot be stat'ed.
+        """
+        stat = os.stat(self.csv_file_path)
+        signature: tuple[int, ...] = (stat.st_mtime_ns, stat.st_size)
+        if self.is_sqlite:
+            try:
+                wal = os.stat(self.csv_file_path + "-wal")
+            except FileNotFoundError:
+                pass
+            else:
+                signature += (wal.st_mtime_ns, wal.st_size)
+        return signature
+
+    def _build_snapshot(self, signature: tuple[int, ...]) -> Snapshot:
+        """
+        Reads the listing file and builds a new snapshot from it.
+
+        Args:
+            signature (tuple[int, ...]): File signature taken before reading.
+
+        Returns:
+            Snapshot: Freshly loaded snapshot.
+        """
+        generation = self._snapshot.generation + 1 if self._snapshot else 1
+        if self.is_sqlite:
+            rows = fetch_types_data(self.csv_file_path, EVENT_TYPES + JOB_TYPES)
+            grouped = {
+                data_type: [Listing.from_entry(row) for row in entries]
+                for data_type, entries in rows.items()
+            }
+        else:
+            grouped = get_types_data(self.csv_file_path, EVENT_TYPES + JOB_TYPES)
+        events = [item for t in EVENT_TYPES for item in grouped[t]]
+        jobs = [item for t in JOB_TYPES for item in grouped[t]]
+        # Replies join the text rendered here instead of formatting listings
+        for event in events:
+            event.fragment(EVENT_FRAGMENT, render_event)
+        for job in jobs:
+            job.fragment(JOB_FRAGMENT, render_job)
+        previous = self._snapshot
+        # Autocomplete only recounts the listings that changed
+        if previous is None:
+            events_suggestions = AutocompleteIndex(events)
+            jobs_suggestions = AutocompleteIndex(jobs)
+        else:
+            events_suggestions = previous.events_suggestions.updated(
+                previous.events, events
+            )
+            jobs_suggestions = previous.jobs_suggestions.updated(previous.jobs, jobs)
+        events_index = SearchIndex(events)
+        jobs_index = SearchIndex(jobs)
+        return Snapshot(
+            generation=generation,
+            signature=signature,
+            events=events,
+            jobs=jobs,
+            events_index=events_index,
+            jobs_index=jobs_index,
+            events_by_date=DateIndex(events),
+            jobs_by_date=DateIndex(jobs),
+            events_suggestions=events_suggestions,
+            jobs_suggestions=jobs_suggestions,
+            events_facets=FacetIndex(events, events_index),
+            jobs_facets=FacetIndex(jobs, jobs_index),
+        )
+
+    @property
+    def current(self) -> Snapshot | None:
+        """
+        The snapshot loaded last, without checking the file for changes, or
+            None before the first load.
+        """
+        return self._snapshot
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns the current snapshot, reloading the file first if it changed.
+
+        If a reload fails but an older snapshot exists, the older snapshot is
+            served and the reload is retried on the next call.
+
+        Returns:
+            Snapshot: The most recent successfully loaded snapshot.
+
+        Raises:
+            OSError: If the file cannot be accessed and nothing is loaded yet.
+            RuntimeError: If the file cannot be parsed and nothing is loaded yet.
+        """
+        current = self._snapshot
+        try:
+            signature = self._file_signature()
+        except OSError:
+            if current is None:
+                raise
+            return current
+        if current is not None and current.signature == signature:
+            return current
+        with self._reload_lock:
+            # Another thread may have finished the reload while we waited.
+            current = self._snapshot
+            if current is not None and current.signature == signature:
+                return current
+            try:
+                fresh = self._build_snapshot(signature)
+            except (OSError, RuntimeError) as e:
+                if current is None:
+                    raise
+                print(f"❌ Failed to reload {self.csv_file_path}: {e}")
+                return current
+            self._snapshot = fresh
+            return fresh
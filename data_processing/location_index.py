@@ -0,0 +1,145 @@
+"""
+File `location_index.py` maps the locations of listings to listing IDs so
+    location criteria in a search select listings directly instead of being
+    substring-matched against every field.
+
+Each location of a listing is indexed as:
+    - a state code, from "City, ST" locations whose state is in VALID_STATES;
+    - a normalized city name, from the same locations;
+    - a Remote or Hybrid flag.
+
+In a query, an upper-case state code ("NY"), a capitalized known city
+    ("Syracuse", "San Francisco") or the word remote/hybrid in any case is
+    treated as a location. Requiring capitals keeps words such as "in", "or"
+    and "me" from being read as Indiana, Oregon or Maine.
+"""
+
+import re
+from typing import Any
+
+from data_collections.constants import VALID_STATES
+from data_collections.locations import parse_locations
+
+FLAGS = ("remote", "hybrid")
+# Longest city name, in words, looked for in a query
+MAX_CITY_WORDS = 3
+
+_CITY_STATE = re.compile(r"^(.+?),\s*([A-Z]{2})$")
+_FLAG_WORDS = {flag: re.compile(rf"\b{flag}\b", re.IGNORECASE) for flag in FLAGS}
+
+
+def normalize_city(city: str) -> str:
+    """
+    Normalizes a city name for lookups: lower-cased with single spaces.
+
+    Args:
+        city (str): City name.
+
+    Returns:
+        str: Normalized name.
+    """
+    return " ".join(city.lower().split())
+
+
+class LocationIndex:
+    """
+    Postings from states, cities and Remote/Hybrid flags to listing IDs.
+
+    Attributes:
+        states (dict[str, set[int]]): State code to listing IDs.
+        cities (dict[str, set[int]]): Normalized city to listing IDs.
+        flags (dict[str, set[int]]): "remote"/"hybrid" to listing IDs.
+    """
+
+    def __init__(self, listings: list[Any]):
+        """
+        Args:
+            listings (list[Listing]): Listings to index. A listing's ID is its
+                position in this list.
+        """
+        self.states: dict[str, set[int]] = {}
+        self.cities: dict[str, set[int]] = {}
+        self.flags: dict[str, set[int]] = {flag: set() for flag in FLAGS}
+        for listing_id, listing in enumerate(listings):
+            for location in parse_locations(listing.get("Location")):
+                match = _CITY_STATE.match(location)
+                if match and match.group(2) in VALID_STATES:
+                    city, state = match.groups()
+                    self.states.setdefault(state, set()).add(listing_id)
+                    self.cities.setdefault(normalize_city(city), set()).add(listing_id)
+                for flag, pattern in _FLAG_WORDS.items():
+                    if pattern.search(location):
+                        self.flags[flag].add(listing_id)
+
+    def lookup(self, term: str) -> tuple[str, set[int]] | None:
+        """
+        Returns the location criterion for a single query term, if any.
+
+        Args:
+            term (str): Query term.
+
+        Returns:
+            tuple[str, set[int]] | None: The criterion, such as "state:NY",
+                "city:syracuse" or "flag:remote", and its listing IDs. None if
+                the term is not a location.
+        """
+        if term.lower() in FLAGS:
+            return f"flag:{term.lower()}", self.flags[term.lower()]
+        if term in VALID_STATES:
+            return f"state:{term}", self.states.get(term, set())
+        city = normalize_city(term)
+        if term[:1].isupper() and city in self.cities:
+            return f"city:{city}", self.cities[city]
+        return None
+
+    def match(self, value: str) -> set[int] | None:
+        """
+        Returns the listings at a location named explicitly, as in a
+            `location:` qualifier, ignoring case.
+
+        Args:
+            value (str): State code, city name, "remote" or "hybrid".
+
+        Returns:
+            set[int] | None: Listing IDs, or None if the value is not a known
+                location.
+        """
+        if value.lower() in FLAGS:
+            return self.flags[value.lower()]
+        if value.upper() in VALID_STATES:
+            return self.states.get(value.upper(), set())
+        return self.cities.get(normalize_city(value))
+
+    def resolve(self, terms: list[str]) -> tuple[list[tuple[str, set[int]]], list[str]]:
+        """
+        Splits query terms into location criteria and the remaining terms.
+
+        Multi-word cities are matched greedily, longest first.
+
+        Args:
+            terms (list[str]): Whitespace-separated query terms.
+
+        Returns:
+            tuple[list[tuple[str, set[int]]], list[str]]: Each location
+                criterion found with its listing IDs, and the terms that are
+                not locations.
+        """
+        matches: list[tuple[str, set[int]]] = []
+        remaining: list[str] = []
+        position = 0
+        while position < len(terms):
+            for size in range(min(MAX_CITY_WORDS, len(terms) - position), 1, -1):
+                words = terms[position : position + size]
+                city = normalize_city(" ".join(words))
+                if words[0][:1].isupper() and city in self.cities:
+                    matches.append((f"city:{city}", self.cities[city]))
+                    position += size
+                    break
+            else:
+                match = self.lookup(terms[position])
+                if match is None:
+                    remaining.append(terms[position])
+                else:
+                    matches.append(match)
+                position += 1
+        return matches, remaining
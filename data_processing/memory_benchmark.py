@@ -0,0 +1,88 @@
+"""
+File `memory_benchmark.py` measures how much memory the loaded listings take,
+    comparing the per-row dictionaries the loaders used to build with the
+    `Listing` records they build now.
+
+The CSV is parsed once and both representations are built from the same
+    values, so only the per-listing container overhead and the copies made
+    for search results are compared.
+
+Usage:
+    python -m data_processing.memory_benchmark [csv path] [--copies N]
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from data_collections.csv_updater import extract_entries_from_csv
+from data_processing.listing import FIELDS, Listing, ScoredListing
+from data_processing.listing_store import CSV_FILE_PATH
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    """
+    Returns the number of bytes still allocated by the object `build` returns.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def measure(entries: list[dict[str, Any]]) -> dict[str, float]:
+    """
+    Measures the bytes used per listing by each representation.
+
+    Args:
+        entries (list[dict[str, Any]]): Rows read from the listings CSV.
+
+    Returns:
+        dict[str, float]: Bytes per listing for "dict" and "Listing" rows and
+            for a dict copy or a `ScoredListing` reference in search results.
+    """
+    rows = [[entry.get(field, "") for field in FIELDS] for entry in entries]
+    count = max(len(rows), 1)
+    dicts = [dict(zip(FIELDS, row, strict=True)) for row in rows]
+    listings = [Listing(**item) for item in dicts]
+    return {
+        "dict": _allocated(
+            lambda: [dict(zip(FIELDS, row, strict=True)) for row in rows]
+        )
+        / count,
+        "Listing": _allocated(
+            lambda: [Listing(**dict(zip(FIELDS, row, strict=True))) for row in rows]
+        )
+        / count,
+        "dict result": _allocated(
+            lambda: [{**item, "confidence": 1.0} for item in dicts]
+        )
+        / count,
+        "ScoredListing result": _allocated(
+            lambda: [ScoredListing(listing, 1.0) for listing in listings]
+        )
+        / count,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("csv_path", nargs="?", default=CSV_FILE_PATH)
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=50,
+        help="repeat the CSV rows to simulate a larger dataset",
+    )
+    args = parser.parse_args()
+    entries = extract_entries_from_csv(args.csv_path) * args.copies
+    results = measure(entries)
+    print(f"Listings measured: {len(entries)}")
+    for name, size in results.items():
+        print(f"{name:>22}: {size:8.1f} bytes per listing")
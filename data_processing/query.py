@@ -0,0 +1,192 @@
+"""
+File `query.py` parses the criteria of `!jobs` and `!events` into a query
+    plan of free terms, field qualifiers and boolean operators.
+
+A qualifier is written `name:value`, e.g. `company:google`, `location:remote`
+    or `type:internship`, and restricts results to listings whose field
+    matches the value. Values with spaces are quoted: `company:"sky high"`.
+    Every other term, including words with an unknown `name:` prefix such as
+    links, is a free term matched anywhere as before.
+
+A term or qualifier prefixed with `-` excludes the listings it matches, as in
+    `python -senior`. Without other operators the remaining free terms still
+    match any listing containing one of them.
+
+A query using `OR` or parentheses is a boolean expression instead, in which
+    terms side by side must all match: `(java OR kotlin) intern` matches
+    listings containing "intern" and either "java" or "kotlin". `OR` at the
+    start or end of a query is a plain term; use `location:OR` for Oregon.
+    A `-` before a group excludes its matches: `intern -(senior OR lead)`.
+
+Parsing does not depend on the listings, so plans are cached per query
+    string and shared across reloads.
+
+Expressions are nested tuples:
+    ("term", text), ("qualifier", name, value), ("not", node),
+    ("and", (node, ...)) and ("or", (node, ...)).
+"""
+
+import functools
+import re
+from typing import Any, NamedTuple
+
+# Qualifier name to the listing fields it matches
+QUALIFIERS = {
+    "company": ("Company",),
+    "location": ("Location",),
+    "type": ("Type", "subType"),
+}
+
+# Upper bound on cached query plans
+QUERY_PLAN_CACHE_SIZE = 1024
+
+OR_OPERATOR = "OR"
+
+_TOKEN = re.compile(r'(-?)(\w+):"([^"]*)"?|-?\(|\)|[^\s()]+')
+# Opens a group whose matches are excluded, as in `-(senior OR lead)`
+NEGATED_GROUP = "-("
+
+
+class QueryPlan(NamedTuple):
+    """
+    A parsed query.
+
+    Attributes:
+        terms (tuple[str, ...]): Free terms that are not negated, in query
+            order. They are the terms results are ranked by.
+        qualifiers (tuple[tuple[str, str], ...]): (qualifier name, value)
+            pairs every result must match, in query order. Names are
+            lower-case. Empty for boolean expressions.
+        excluded (tuple[tuple, ...]): Negated term and qualifier nodes whose
+            matches are left out. Empty for boolean expressions.
+        expression (tuple | None): Expression tree of a query using `OR` or
+            parentheses, or None for other queries.
+    """
+
+    terms: tuple[str, ...]
+    qualifiers: tuple[tuple[str, str], ...]
+    excluded: tuple[tuple, ...] = ()
+    expression: tuple | None = None
+
+
+def _tokenize(_filters: str) -> list[Any]:
+    """
+    Splits a query into "(", NEGATED_GROUP, ")", OR_OPERATOR and
+        (negated, node) pairs.
+    """
+    tokens: list[Any] = []
+    for match in _TOKEN.finditer(_filters):
+        text = match.group(0)
+        if text in ("(", NEGATED_GROUP, ")"):
+            tokens.append(text)
+            continue
+        if match.group(2) is not None:
+            negated, name, value = bool(match.group(1)), match.group(2), match.group(3)
+        else:
+            negated = text.startswith("-") and len(text) > 1
+            name, _, value = text[negated:].partition(":")
+        value = " ".join(value.split())
+        if name.lower() in QUALIFIERS and value:
+            tokens.append((negated, ("qualifier", name.lower(), value)))
+        elif text == OR_OPERATOR:
+            tokens.append(text)
+        else:
+            for word in text[negated:].split():
+                tokens.append((negated, ("term", word)))
+    # OR without an operand on one side is searched for as a word, lower-cased
+    # so it is not read as the Oregon state code
+    for position in (0, -1):
+        if tokens and tokens[position] == OR_OPERATOR:
+            tokens[position] = (False, ("term", OR_OPERATOR.lower()))
+    return tokens
+
+
+def _parse_expression(tokens: list[Any], position: int) -> tuple[tuple, int]:
+    """
+    Parses `and_expression (OR and_expression)*` starting at `position`.
+
+    Returns:
+        tuple[tuple, int]: The expression and the position after it.
+    """
+    alternatives = []
+    while True:
+        operands = []
+        while position < len(tokens) and tokens[position] not in (")", OR_OPERATOR):
+            token = tokens[position]
+            position += 1
+            if token in ("(", NEGATED_GROUP):
+                node, position = _parse_expression(tokens, position)
+                # A missing ")" closes at the end of the query
+                position += position < len(tokens) and tokens[position] == ")"
+                if node == ("and", ()):
+                    continue
+                if token == NEGATED_GROUP:
+                    node = ("not", node)
+            else:
+                negated, node = token
+                if negated:
+                    node = ("not", node)
+            operands.append(node)
+        if operands:
+            alternatives.append(
+                operands[0] if len(operands) == 1 else ("and", tuple(operands))
+            )
+        if position < len(tokens) and tokens[position] == OR_OPERATOR:
+            position += 1
+            continue
+        break
+    if not alternatives:
+        return ("and", ()), position
+    if len(alternatives) == 1:
+        return alternatives[0], position
+    return ("or", tuple(alternatives)), position
+
+
+def _positive_terms(node: tuple) -> list[str]:
+    """
+    Returns the free terms of an expression that are not under a "not".
+    """
+    if node[0] == "term":
+        return [node[1]]
+    if node[0] in ("and", "or"):
+        return [term for child in node[1] for term in _positive_terms(child)]
+    return []
+
+
+@functools.lru_cache(maxsize=QUERY_PLAN_CACHE_SIZE)
+def parse_query(_filters: str) -> QueryPlan:
+    """
+    Splits a query into free terms, field qualifiers and exclusions, or
+        parses it as a boolean expression when it uses `OR` or parentheses.
+
+    Args:
+        _filters (str): Filter criteria as a string.
+
+    Returns:
+        QueryPlan: The parsed query.
+    """
+    tokens = _tokenize(_filters)
+    if any(token in tokens for token in ("(", NEGATED_GROUP, ")", OR_OPERATOR)):
+        position = 0
+        operands = []
+        while position < len(tokens):
+            node, position = _parse_expression(tokens, position)
+            operands.append(node)
+            # Skip a ")" without a matching "("
+            position += 1
+        operands = [node for node in operands if node != ("and", ())]
+        if not operands:
+            return QueryPlan((), ())
+        expression = operands[0] if len(operands) == 1 else ("and", tuple(operands))
+        return QueryPlan(tuple(_positive_terms(expression)), (), (), expression)
+    terms: list[str] = []
+    qualifiers: list[tuple[str, str]] = []
+    excluded: list[tuple] = []
+    for negated, node in tokens:
+        if negated:
+            excluded.append(node)
+        elif node[0] == "qualifier":
+            qualifiers.append(node[1:])
+        else:
+            terms.append(node[1])
+    return QueryPlan(tuple(terms), tuple(qualifiers), tuple(excluded))
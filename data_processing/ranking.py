@@ -0,0 +1,251 @@
+"""
+File `ranking.py` scores `!jobs` and `!events` search results with BM25F.
+
+Term frequencies are combined across fields using per-field weights, so a
+    match in the Title counts more than one in the Description, before BM25's
+    saturation and inverse document frequency are applied. Only the listings
+    found in a term's postings are scored; the rest of the dataset is never
+    touched.
+
+Terms naming a location (a state code, a known city, remote or hybrid) are
+    resolved through the index's location postings instead: a listing must be
+    in at least one of the named locations, and each location it is in adds
+    the Location field weight to its score.
+
+Field qualifiers such as `company:google` do not score: every result must
+    match all of them, and none may match a negated term or qualifier
+    (`-senior`). A query made only of these returns its matches in listing
+    order. A boolean query (`(java OR kotlin) intern`) selects its matches by
+    evaluating the expression on bitmaps, and ranks them by the terms it
+    contains.
+
+When nothing matches, misspelled free terms are corrected with the index's
+    spelling dictionary and the corrected query is ranked instead.
+"""
+
+import heapq
+import math
+import re
+from collections.abc import Callable
+from typing import NamedTuple
+
+from data_processing.bitmap import to_ids
+from data_processing.listing import Listing, ScoredListing
+from data_processing.query import parse_query
+from data_processing.search_index import SearchIndex
+
+FIELD_WEIGHTS = {
+    "Title": 3.0,
+    "Company": 2.0,
+    "subType": 2.0,
+    "Location": 1.5,
+    "Description": 1.0,
+    "whenDate": 0.5,
+    "pubDate": 0.5,
+}
+
+# BM25 term-frequency saturation and length normalization parameters
+K1 = 1.2
+B = 0.75
+
+
+class SearchResult(NamedTuple):
+    """
+    The best matches of a search together with the total number of matches.
+
+    Attributes:
+        listings (list[Listing] | list[ScoredListing]): Up to `k` listings,
+            best first.
+        total (int): Number of listings that matched, including those cut off.
+        corrected (str | None): The spelling-corrected query the results are
+            for, or None if the query was used as is.
+    """
+
+    listings: list[Listing] | list[ScoredListing]
+    total: int
+    corrected: str | None = None
+
+
+def score_terms(
+    index: SearchIndex,
+    terms: list[str],
+    field_weights: dict[str, float] = FIELD_WEIGHTS,
+    k1: float = K1,
+    b: float = B,
+) -> dict[int, float]:
+    """
+    Computes BM25F scores for the listings matching at least one term.
+
+    Args:
+        index (SearchIndex): Index holding the per-field term statistics.
+        terms (list[str]): Search terms. A term matches every indexed token
+            that contains it.
+        field_weights (dict[str, float]): Weight of a match in each field.
+        k1 (float): Term-frequency saturation parameter.
+        b (float): Field-length normalization parameter.
+
+    Returns:
+        dict[int, float]: Listing ID to relevance score.
+    """
+    scores: dict[int, float] = {}
+    for term in terms:
+        tokens = index.expand(term)
+        if not tokens:
+            continue
+        doc_freq = len(index.lookup(term))
+        idf = math.log(1 + (index.size - doc_freq + 0.5) / (doc_freq + 0.5))
+        weighted_tf: dict[int, float] = {}
+        for field, weight in field_weights.items():
+            field_postings = index.field_postings[field]
+            lengths = index.field_lengths[field]
+            avg_length = index.avg_field_lengths[field]
+            for token in tokens:
+                for listing_id, tf in field_postings.get(token, {}).items():
+                    norm = 1 - b + b * lengths[listing_id] / avg_length
+                    weighted_tf[listing_id] = (
+                        weighted_tf.get(listing_id, 0.0) + weight * tf / norm
+                    )
+        for listing_id, tf in weighted_tf.items():
+            scores[listing_id] = scores.get(listing_id, 0.0) + (
+                idf * tf * (k1 + 1) / (k1 + tf)
+            )
+    return scores
+
+
+def _rank_order(item: tuple[int, float]) -> tuple[float, int]:
+    """
+    Sort key placing higher scores first and earlier listings first on ties.
+    """
+    return -item[1], item[0]
+
+
+def rank(
+    index: SearchIndex,
+    _filters: str,
+    k: int | None = None,
+    exclude: Callable[[int], bool] | None = None,
+) -> tuple[list[tuple[int, float]], int]:
+    """
+    Ranks the listings matching any of the whitespace-separated filter terms
+        and, when the filters name locations, in any of those locations.
+        Listings must also match every field qualifier and no exclusion.
+        Boolean queries return the listings matching the expression instead.
+
+    When `k` is given only the best `k` listings are selected, using a heap
+        instead of sorting every match, which costs O(n log k).
+
+    Args:
+        index (SearchIndex): Index built from the listings being searched.
+        _filters (str): Filter criteria as a string.
+        k (int | None): Number of results to return. Returns all when None.
+        exclude (Callable[[int], bool] | None): Predicate on listing IDs; the
+            matches it returns True for are dropped before ranking and are not
+            counted.
+
+    Returns:
+        tuple[list[tuple[int, float]], int]: (listing ID, score) pairs, best
+            first, and the total number of matching listings. Equal scores
+            keep the listings' original order.
+    """
+    plan = parse_query(_filters)
+    location_matches, terms = index.locations.resolve(list(plan.terms))
+    scores = score_terms(index, terms)
+    location_scores: dict[int, float] = {}
+    for _, listing_ids in location_matches:
+        for listing_id in listing_ids:
+            location_scores[listing_id] = (
+                location_scores.get(listing_id, 0.0) + FIELD_WEIGHTS["Location"]
+            )
+    if plan.expression is not None:
+        scores = {
+            listing_id: scores.get(listing_id, 0.0)
+            + location_scores.get(listing_id, 0.0)
+            for listing_id in to_ids(index.bitmap(plan.expression))
+        }
+    elif location_matches:
+        if terms:
+            scores = {
+                listing_id: score + location_scores[listing_id]
+                for listing_id, score in scores.items()
+                if listing_id in location_scores
+            }
+        else:
+            scores = location_scores
+    if plan.qualifiers or plan.excluded:
+        allowed = index.all_bits
+        for name, value in plan.qualifiers:
+            allowed &= index.bitmap(("qualifier", name, value))
+        for node in plan.excluded:
+            allowed &= ~index.bitmap(node)
+        if terms or location_matches:
+            allowed_ids = set(to_ids(allowed))
+            scores = {
+                listing_id: score
+                for listing_id, score in scores.items()
+                if listing_id in allowed_ids
+            }
+        else:
+            scores = dict.fromkeys(to_ids(allowed), 0.0)
+    if exclude is not None:
+        scores = {
+            listing_id: score
+            for listing_id, score in scores.items()
+            if not exclude(listing_id)
+        }
+    if k is None:
+        return sorted(scores.items(), key=_rank_order), len(scores)
+    return heapq.nsmallest(k, scores.items(), key=_rank_order), len(scores)
+
+
+def correct_query(index: SearchIndex, _filters: str) -> str | None:
+    """
+    Returns the query with its misspelled free terms corrected.
+
+    Args:
+        index (SearchIndex): Index built from the listings being searched.
+        _filters (str): Filter criteria as a string.
+
+    Returns:
+        str | None: The corrected query, or None if no term was corrected.
+    """
+    corrected = _filters
+    for term in dict.fromkeys(parse_query(_filters).terms):
+        correction = index.correct(term)
+        if correction is not None:
+            # Corrections are plain words, safe as a replacement string
+            corrected = re.sub(
+                rf"(?<![^\s(]){re.escape(term)}(?![^\s)])", correction, corrected
+            )
+    return None if corrected == _filters else corrected
+
+
+def rank_with_correction(
+    index: SearchIndex,
+    _filters: str,
+    k: int | None = None,
+    exclude: Callable[[int], bool] | None = None,
+) -> tuple[list[tuple[int, float]], int, str | None]:
+    """
+    Ranks the listings matching the filters, retrying with misspelled terms
+        corrected when nothing matches.
+
+    Args:
+        index (SearchIndex): Index built from the listings being searched.
+        _filters (str): Filter criteria as a string.
+        k (int | None): Number of results to return. Returns all when None.
+        exclude (Callable[[int], bool] | None): Predicate on listing IDs to
+            drop, as in `rank`.
+
+    Returns:
+        tuple[list[tuple[int, float]], int, str | None]: The results and
+            total as in `rank`, and the corrected query when the results are
+            for it.
+    """
+    ranked, total = rank(index, _filters, k, exclude)
+    if total:
+        return ranked, total, None
+    corrected = correct_query(index, _filters)
+    if corrected is None:
+        return ranked, total, None
+    ranked, total = rank(index, corrected, k, exclude)
+    return ranked, total, corrected if total else None
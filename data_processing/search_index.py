@@ -0,0 +1,352 @@
+"""
+File `search_index.py` builds an inverted index over listings so `!jobs` and
+    `!events` searches do not scan every field of every listing per term.
+
+Each searchable field is lower-cased and split on whitespace, and every token
+    maps to the IDs (list positions) of the listings containing it. A search
+    term matches a listing when it is a substring of one of its tokens, which
+    is exactly when it is a substring of the field itself, so results are the
+    same as the old per-field substring scan. Terms are resolved against the
+    vocabulary, which is far smaller than the listings times their fields,
+    and the resolved postings are memoized.
+
+The categorical columns are also encoded as small integer codes, one array
+    per column, so equality filters such as "this company" compare integers
+    instead of strings. Field qualifiers (`company:google`) are matched
+    against the distinct values of their column and then selected by code.
+
+Boolean queries are evaluated on bitmaps of the postings, see `bitmap.py`.
+    Misspelled terms are corrected against the words of the vocabulary, see
+    `spelling.py`.
+"""
+
+from array import array
+from typing import Any
+
+from data_processing.bitmap import from_ids, full
+from data_processing.listing import CATEGORICAL_FIELDS, Listing
+from data_processing.location_index import LocationIndex
+from data_processing.query import QUALIFIERS, parse_query
+from data_processing.spelling import SpellingDictionary, words
+
+SEARCHABLE_FIELDS = (
+    "Title",
+    "subType",
+    "Company",
+    "Description",
+    "Location",
+    "whenDate",
+    "pubDate",
+)
+
+# Upper bound on memoized term lookups kept per index
+TERM_CACHE_SIZE = 1024
+
+
+def tokenize(value: Any) -> list[str]:
+    """
+    Normalizes a field value into lower-case, whitespace-separated tokens.
+
+    Args:
+        value (Any): Field value, usually a string. The items of a tuple or
+            list, such as a listing's locations, are tokenized together.
+
+    Returns:
+        list[str]: Tokens of the value.
+    """
+    if not value:
+        return []
+    if isinstance(value, (tuple, list)):
+        value = " ".join(map(str, value))
+    return str(value).lower().split()
+
+
+def normalize_query(_filters: str, locations: LocationIndex | None = None) -> str:
+    """
+    Normalizes a query so that equivalent queries compare equal: terms are
+        lower-cased, whitespace is collapsed and the terms are sorted.
+
+    Field qualifiers are kept as `name:value` and exclusions as `-node`.
+        Boolean expressions are kept whole. Location terms are
+        case-sensitive ("NY" is a state, "ny" is not), so when `locations` is
+        given they are first replaced by their criteria.
+
+    Args:
+        _filters (str): Filter criteria as a string.
+        locations (LocationIndex | None): Index the query will be run against.
+
+    Returns:
+        str: Normalized query.
+    """
+    plan = parse_query(_filters)
+    if plan.expression is not None:
+        return repr(plan.expression)
+    terms = list(plan.terms)
+    criteria = sorted(
+        f"{name}:{fold_category(value)}" for name, value in plan.qualifiers
+    )
+    if locations is not None:
+        matches, terms = locations.resolve(terms)
+        criteria += sorted(criterion for criterion, _ in matches)
+    criteria += sorted(f"-{node!r}" for node in plan.excluded)
+    return " ".join(sorted(tokenize(" ".join(terms))) + criteria)
+
+
+def fold_category(value: Any) -> str:
+    """
+    Normalizes a categorical value so that equality ignores case and
+        surrounding whitespace.
+
+    Args:
+        value (Any): Field value, usually a string. A tuple or list, such as
+            a listing's locations, folds to its items joined by "; ".
+
+    Returns:
+        str: Folded value. Empty values fold to "".
+    """
+    if not value:
+        return ""
+    if isinstance(value, (tuple, list)):
+        value = "; ".join(map(str, value))
+    return str(value).strip().lower()
+
+
+class SearchIndex:
+    """
+    Inverted index from normalized tokens to listing IDs, with the per-field
+        term statistics used for ranking.
+
+    Attributes:
+        size (int): Number of indexed listings.
+        postings (dict[str, set[int]]): Token to IDs of listings containing it
+            in any field.
+        field_postings (dict[str, dict[str, dict[int, int]]]): Field to token
+            to {listing ID: term frequency in that field}.
+        field_lengths (dict[str, list[int]]): Field to token count per listing.
+        avg_field_lengths (dict[str, float]): Field to mean token count.
+        category_values (dict[str, list[str]]): Categorical field to its
+            distinct folded values, indexed by category code.
+        category_codes (dict[str, array]): Categorical field to the category
+            code of each listing.
+        category_postings (dict[str, dict[int, frozenset[int]]]): Categorical
+            field to category code to the IDs of the listings holding it.
+        locations (LocationIndex): State, city and Remote/Hybrid postings.
+        all_bits (int): Bitmap of every listing.
+        spelling (SpellingDictionary): Words of the vocabulary, weighted by
+            the number of listings containing them.
+    """
+
+    def __init__(self, listings: list[Listing]):
+        """
+        Args:
+            listings (list[Listing]): Listings to index. A listing's ID
+                is its position in this list.
+        """
+        self.size = len(listings)
+        self.postings: dict[str, set[int]] = {}
+        self.field_postings: dict[str, dict[str, dict[int, int]]] = {
+            field: {} for field in SEARCHABLE_FIELDS
+        }
+        self.field_lengths: dict[str, list[int]] = {
+            field: [0] * self.size for field in SEARCHABLE_FIELDS
+        }
+        for listing_id, listing in enumerate(listings):
+            for field in SEARCHABLE_FIELDS:
+                tokens = tokenize(listing.get(field))
+                self.field_lengths[field][listing_id] = len(tokens)
+                field_postings = self.field_postings[field]
+                for token in tokens:
+                    frequencies = field_postings.setdefault(token, {})
+                    frequencies[listing_id] = frequencies.get(listing_id, 0) + 1
+                    self.postings.setdefault(token, set()).add(listing_id)
+        self.category_values: dict[str, list[str]] = {}
+        self.category_codes: dict[str, array] = {}
+        self.category_postings: dict[str, dict[int, frozenset[int]]] = {}
+        self._category_lookup: dict[str, dict[str, int]] = {}
+        for field in CATEGORICAL_FIELDS:
+            lookup: dict[str, int] = {}
+            codes = array("I")
+            ids_by_code: dict[int, list[int]] = {}
+            for listing_id, listing in enumerate(listings):
+                code = lookup.setdefault(fold_category(listing.get(field)), len(lookup))
+                codes.append(code)
+                ids_by_code.setdefault(code, []).append(listing_id)
+            self._category_lookup[field] = lookup
+            self.category_values[field] = list(lookup)
+            self.category_codes[field] = codes
+            self.category_postings[field] = {
+                code: frozenset(listing_ids)
+                for code, listing_ids in ids_by_code.items()
+            }
+        self.locations = LocationIndex(listings)
+        self.avg_field_lengths = {
+            field: (sum(lengths) / self.size if self.size else 0.0) or 1.0
+            for field, lengths in self.field_lengths.items()
+        }
+        self._term_cache: dict[str, tuple[tuple[str, ...], frozenset[int]]] = {}
+        self._qualifier_cache: dict[tuple[str, str], frozenset[int]] = {}
+        self._bitmap_cache: dict[tuple, int] = {}
+        self.all_bits = full(self.size)
+        word_ids: dict[str, set[int]] = {}
+        for token, listing_ids in self.postings.items():
+            for word in words(token):
+                word_ids.setdefault(word, set()).update(listing_ids)
+        self.spelling = SpellingDictionary(
+            {word: len(listing_ids) for word, listing_ids in word_ids.items()}
+        )
+
+    def _resolve(self, term: str) -> tuple[tuple[str, ...], frozenset[int]]:
+        """
+        Resolves a term to the vocabulary tokens containing it and the IDs of
+            the listings holding those tokens, memoizing the result.
+        """
+        term = term.lower()
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+        tokens = []
+        matches: set[int] = set()
+        for token, listing_ids in self.postings.items():
+            if term in token:
+                tokens.append(token)
+                matches |= listing_ids
+        result = (tuple(tokens), frozenset(matches))
+        if len(self._term_cache) >= TERM_CACHE_SIZE:
+            self._term_cache.clear()
+        self._term_cache[term] = result
+        return result
+
+    def expand(self, term: str) -> tuple[str, ...]:
+        """
+        Returns the vocabulary tokens that contain the term.
+
+        Args:
+            term (str): Search term without whitespace.
+
+        Returns:
+            tuple[str, ...]: Matching tokens.
+        """
+        return self._resolve(term)[0]
+
+    def lookup(self, term: str) -> frozenset[int]:
+        """
+        Returns the IDs of listings with a field containing the term.
+
+        Args:
+            term (str): Search term without whitespace.
+
+        Returns:
+            frozenset[int]: Matching listing IDs.
+        """
+        return self._resolve(term)[1]
+
+    def correct(self, term: str) -> str | None:
+        """
+        Returns the spelling correction of a term that matches no listing.
+
+        Args:
+            term (str): Search term without whitespace.
+
+        Returns:
+            str | None: The corrected term, or None if the term matches a
+                listing or a location, or no close word is known.
+        """
+        if self.lookup(term) or self.locations.lookup(term) is not None:
+            return None
+        return self.spelling.correct(term.lower())
+
+    def category_code(self, field: str, value: Any) -> int | None:
+        """
+        Returns the category code of a value of a categorical field.
+
+        Args:
+            field (str): One of the categorical fields.
+            value (Any): Value to look up. Case and surrounding whitespace
+                are ignored.
+
+        Returns:
+            int | None: The code, or None if no listing has that value.
+        """
+        return self._category_lookup[field].get(fold_category(value))
+
+    def qualifier_ids(self, name: str, value: str) -> frozenset[int]:
+        """
+        Returns the IDs of listings matching a field qualifier such as
+            `company:google`, memoizing the result.
+
+        A `location:` value naming a state, city or Remote/Hybrid uses the
+            location postings. Otherwise a listing matches when one of the
+            qualifier's fields contains the value, which is tested once per
+            distinct value of the field, and the listings holding the
+            matching values are read from the category postings.
+
+        Args:
+            name (str): Qualifier name, a key of QUALIFIERS.
+            value (str): Qualifier value. Case is ignored.
+
+        Returns:
+            frozenset[int]: Matching listing IDs.
+        """
+        folded = fold_category(value)
+        cached = self._qualifier_cache.get((name, folded))
+        if cached is not None:
+            return cached
+        located = self.locations.match(value) if name == "location" else None
+        if located is not None:
+            result = frozenset(located)
+        else:
+            matches: set[int] = set()
+            for field in QUALIFIERS[name]:
+                postings = self.category_postings[field]
+                for code, category in enumerate(self.category_values[field]):
+                    if folded in category:
+                        matches.update(postings[code])
+            result = frozenset(matches)
+        if len(self._qualifier_cache) >= TERM_CACHE_SIZE:
+            self._qualifier_cache.clear()
+        self._qualifier_cache[(name, folded)] = result
+        return result
+
+    def bitmap(self, node: tuple) -> int:
+        """
+        Evaluates a query expression from `query.py` to the bitmap of the
+            listings matching it.
+
+        A term naming a location uses the location postings, any other term
+            matches as in `lookup`. The bitmaps of terms and qualifiers are
+            memoized.
+
+        Args:
+            node (tuple): Expression node.
+
+        Returns:
+            int: Bitmap of the matching listing IDs.
+        """
+        kind = node[0]
+        if kind == "not":
+            return self.all_bits & ~self.bitmap(node[1])
+        if kind == "and":
+            result = self.all_bits
+            for child in node[1]:
+                result &= self.bitmap(child)
+                if not result:
+                    break
+            return result
+        if kind == "or":
+            result = 0
+            for child in node[1]:
+                result |= self.bitmap(child)
+            return result
+        cached = self._bitmap_cache.get(node)
+        if cached is not None:
+            return cached
+        if kind == "qualifier":
+            result = from_ids(self.qualifier_ids(node[1], node[2]))
+        else:
+            location = self.locations.lookup(node[1])
+            listing_ids = location[1] if location is not None else self.lookup(node[1])
+            result = from_ids(listing_ids)
+        if len(self._bitmap_cache) >= TERM_CACHE_SIZE:
+            self._bitmap_cache.clear()
+        self._bitmap_cache[node] = result
+        return result
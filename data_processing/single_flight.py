@@ -0,0 +1,87 @@
+"""
+File `single_flight.py` coalesces identical requests that arrive while one
+    is already being computed.
+
+When an event is announced, many members send the same command within
+    seconds, before the first result reaches the query cache. The first
+    request for a key starts the computation and the others await the same
+    future instead of each taking a worker, so the work is done once.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Shares one in-flight computation between concurrent callers of a key.
+
+    Must be used from a single event loop.
+
+    Attributes:
+        calls (int): Number of computations started.
+        coalesced (int): Number of requests that awaited a computation
+            started by another request.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns the result of `func`, or of the computation already running
+            for `key`.
+
+        A caller that is cancelled stops waiting without cancelling the
+            computation the other callers share.
+
+        Args:
+            key (Hashable): Identifies equivalent requests.
+            func (Callable[[], Awaitable[T]]): Starts the computation.
+
+        Returns:
+            T: The computation's result.
+
+        Raises:
+            Exception: Whatever the computation raised, in every caller.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        """
+        Forgets a finished computation so later requests start a new one.
+        """
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the error as seen in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the number of computations in flight and the counters.
+
+        Returns:
+            dict[str, int]: "in_flight", "calls" and "coalesced".
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,152 @@
+"""
+File `spelling.py` corrects misspelled search terms with a symmetric delete
+    (SymSpell) dictionary built from the words of the listings.
+
+Every word is stored under each string obtained by deleting up to
+    `max_distance` characters from its prefix. A misspelled term generates its
+    own deletes and looks them up, so the candidates are found with a few
+    dictionary lookups whose number does not depend on the vocabulary size.
+    Candidates are then checked with the edit distance, and the closest, most
+    frequent word wins.
+"""
+
+import re
+from itertools import combinations
+
+# Maximum number of edits between a term and its correction
+MAX_EDIT_DISTANCE = 2
+# Only the start of a word is used to generate deletes
+PREFIX_LENGTH = 7
+# Shorter terms are never corrected, as too many words are close to them
+MIN_TERM_LENGTH = 4
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+def words(text: str) -> list[str]:
+    """
+    Splits lower-case text into words, dropping punctuation.
+
+    Args:
+        text (str): Text such as an index token.
+
+    Returns:
+        list[str]: Words of the text.
+    """
+    return _WORD.findall(text)
+
+
+def edit_distance(source: str, target: str, limit: int) -> int:
+    """
+    Returns the optimal string alignment distance between two strings: the
+        number of insertions, deletions, substitutions and transpositions of
+        adjacent characters needed to turn one into the other.
+
+    Args:
+        source (str): First string.
+        target (str): Second string.
+        limit (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or `limit + 1` if it exceeds `limit`.
+    """
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+    two_rows_up: list[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i]
+        for j in range(1, len(target) + 1):
+            cost = source[i - 1] != target[j - 1]
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                i > 1
+                and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                distance = min(distance, two_rows_up[j - 2] + 1)
+            current.append(distance)
+        if min(current) > limit:
+            return limit + 1
+        two_rows_up, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def deletes(word: str, max_distance: int) -> set[str]:
+    """
+    Returns the strings obtained by deleting up to `max_distance` characters
+        from a word, including the word itself.
+
+    Args:
+        word (str): Word, usually truncated to PREFIX_LENGTH.
+        max_distance (int): Maximum number of deleted characters.
+
+    Returns:
+        set[str]: The deletes.
+    """
+    result = {word}
+    for count in range(1, min(max_distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), count):
+            result.add("".join(c for i, c in enumerate(word) if i not in positions))
+    return result
+
+
+class SpellingDictionary:
+    """
+    Symmetric delete dictionary over a vocabulary of words.
+
+    Attributes:
+        frequencies (dict[str, int]): Word to the number of listings
+            containing it.
+        max_distance (int): Maximum number of edits of a correction.
+    """
+
+    def __init__(
+        self,
+        frequencies: dict[str, int],
+        max_distance: int = MAX_EDIT_DISTANCE,
+    ):
+        """
+        Args:
+            frequencies (dict[str, int]): Word to its frequency.
+            max_distance (int): Maximum number of edits of a correction.
+        """
+        self.frequencies = frequencies
+        self.max_distance = max_distance
+        self._deletes: dict[str, list[str]] = {}
+        for word in frequencies:
+            if len(word) < MIN_TERM_LENGTH - max_distance:
+                continue
+            for delete in deletes(word[:PREFIX_LENGTH], max_distance):
+                self._deletes.setdefault(delete, []).append(word)
+
+    def correct(self, term: str) -> str | None:
+        """
+        Returns the known word closest to a term.
+
+        Ties are broken by frequency, then alphabetically.
+
+        Args:
+            term (str): Lower-case search term.
+
+        Returns:
+            str | None: The correction, or None when the term is known, too
+                short or has no word within `max_distance` edits.
+        """
+        if term in self.frequencies or len(term) < MIN_TERM_LENGTH:
+            return None
+        best: tuple[int, int, str] | None = None
+        seen: set[str] = set()
+        for delete in deletes(term[:PREFIX_LENGTH], self.max_distance):
+            for candidate in self._deletes.get(delete, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(term, candidate, self.max_distance)
+                if distance > self.max_distance:
+                    continue
+                key = (distance, -self.frequencies[candidate], candidate)
+                if best is None or key < best:
+                    best = key
+        return None if best is None else best[2]
@@ -0,0 +1,105 @@
+"""Unittests for autocomplete.py"""
+
+import unittest
+
+from data_processing.autocomplete import (
+    AutocompleteIndex,
+    SuggestionIndex,
+    suggestion_values,
+)
+from data_processing.listing import Listing
+
+
+def _listing(title, company, location):
+    return Listing(Title=title, Company=company, Location=location)
+
+
+class TestAutocomplete(unittest.TestCase):
+    """
+    Tests for the autocomplete indexes
+    """
+
+    def setUp(self):
+        self.listings = [
+            _listing("Software Engineer", "Google", "Remote; Mountain View, CA"),
+            _listing("Software Intern", "Google", "New York, NY"),
+            _listing("Data Engineer", "Goldman Sachs", "New York, NY"),
+            _listing("Designer", "Figma", "Remote"),
+        ]
+        self.index = AutocompleteIndex(self.listings)
+
+    def test_suggestion_values(self):
+        """
+        Test that companies, title words and locations are extracted
+        """
+        self.assertEqual(
+            suggestion_values(self.listings[0]),
+            {
+                "company": ["Google"],
+                "title": ["engineer", "software"],
+                "location": ["Remote", "Mountain View, CA"],
+            },
+        )
+
+    def test_prefix_ranked_by_frequency(self):
+        """
+        Test that values starting with the prefix come most frequent first
+        """
+        self.assertEqual(
+            self.index.suggest("company", "go"), ["Google", "Goldman Sachs"]
+        )
+        self.assertEqual(self.index.suggest("title", "ENG"), ["engineer"])
+        self.assertEqual(
+            self.index.suggest("location", ""),
+            ["New York, NY", "Remote", "Mountain View, CA"],
+        )
+
+    def test_limit(self):
+        """
+        Test that at most `limit` suggestions are returned
+        """
+        self.assertEqual(
+            self.index.suggest("title", "", limit=2), ["engineer", "software"]
+        )
+        index = SuggestionIndex(f"value {number:02}" for number in range(40))
+        self.assertEqual(len(index.suggest("val")), 25)
+
+    def test_no_match(self):
+        """
+        Test that an unknown prefix returns nothing
+        """
+        self.assertEqual(self.index.suggest("company", "zzz"), [])
+
+    def test_updated_matches_full_rebuild(self):
+        """
+        Test that an incremental update equals building from scratch and
+            leaves the previous index unchanged
+        """
+        new_listings = self.listings[1:] + [
+            _listing("Golang Developer", "Gopher Co", "Remote")
+        ]
+        updated = self.index.updated(self.listings, new_listings)
+        rebuilt = AutocompleteIndex(new_listings)
+        for field, index in rebuilt.fields.items():
+            self.assertEqual(updated.fields[field].counts, index.counts)
+            self.assertEqual(updated.fields[field].keys, index.keys)
+        self.assertEqual(
+            updated.suggest("company", "go"), ["Goldman Sachs", "Google", "Gopher Co"]
+        )
+        self.assertEqual(
+            self.index.suggest("company", "go"), ["Google", "Goldman Sachs"]
+        )
+
+    def test_updated_reuses_unchanged_fields(self):
+        """
+        Test that fields without changes are shared with the new index
+        """
+        moved = self.listings + [_listing("Intern", "Google", "Remote")]
+        updated = self.index.updated(self.listings, moved)
+        self.assertIsNot(updated.fields["title"], self.index.fields["title"])
+        same = self.index.updated(self.listings, list(reversed(self.listings)))
+        self.assertIs(same.fields["company"], self.index.fields["company"])
+
+
+if __name__ == "__main__":
+    unittest.main()
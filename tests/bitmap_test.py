@@ -0,0 +1,44 @@
+"""Unittests for bitmap.py"""
+
+import unittest
+
+from data_processing.bitmap import from_ids, full, to_ids
+
+
+class TestBitmap(unittest.TestCase):
+    """
+    Tests for the bitmap helpers
+    """
+
+    def test_round_trip(self):
+        """
+        Test that IDs survive a conversion to a bitmap and back, sorted
+        """
+        self.assertEqual(to_ids(from_ids([9, 0, 3, 64])), [0, 3, 9, 64])
+
+    def test_from_ids_sets_bits(self):
+        """
+        Test that bit i is set for listing i
+        """
+        self.assertEqual(from_ids([0, 2]), 0b101)
+        self.assertEqual(from_ids([]), 0)
+
+    def test_full(self):
+        """
+        Test that the full bitmap covers exactly the first `size` IDs
+        """
+        self.assertEqual(to_ids(full(5)), [0, 1, 2, 3, 4])
+        self.assertEqual(full(0), 0)
+
+    def test_operators(self):
+        """
+        Test that set operations map to bitwise operators
+        """
+        left, right = from_ids([1, 2, 3]), from_ids([2, 3, 4])
+        self.assertEqual(to_ids(left & right), [2, 3])
+        self.assertEqual(to_ids(left | right), [1, 2, 3, 4])
+        self.assertEqual(to_ids(full(6) & ~left), [0, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
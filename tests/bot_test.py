@@ -8,7 +8,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 
-from bot import bot, run_bot  # Import the bot instance directly
+from bot import bot, response_cache, run_bot  # Import the bot instance directly
+from data_processing.cursors import CursorStore
+from data_processing.facet_view import FacetView
+from data_processing.facets import FacetedResult, FacetIndex
+from data_processing.listing import Listing
+from data_processing.search_index import SearchIndex
 
 
 class TestCSClubBot(unittest.IsolatedAsyncioTestCase):
@@ -100,23 +105,93 @@ class TestCSClubBot(unittest.IsolatedAsyncioTestCase):
 
     async def test_jobs_success_path(self):
         """jobs command sends formatted message on success."""
-        with patch("bot.get_jobs", return_value=[{"id": 1}]) as mock_get, \
-            patch("bot.filter_jobs", side_effect=lambda jobs, args: jobs) as mock_filter, \
+        jobs = [Listing.from_entry({"Title": "Python Developer", "Type": "Job"})]
+        faceted = FacetedResult(
+            jobs, FacetIndex(jobs, SearchIndex(jobs)), [(0, 1.0)]
+        )
+        with patch("bot.listing_data") as mock_data, \
             patch("bot.format_jobs_message", return_value="formatted") as mock_format:
-            await bot.get_command("jobs").callback(self.ctx, args="python remote")
-            mock_get.assert_called_once()
-            mock_filter.assert_called_once()
-            mock_format.assert_called_once()
-            self.ctx.send.assert_called_once_with("formatted")
+            mock_data.facet_search = AsyncMock(return_value=faceted)
+            mock_data.cursors = CursorStore()
+            await bot.get_command("jobs").callback(self.ctx, args=" python remote ")
+            mock_data.facet_search.assert_awaited_once_with("jobs", "python remote")
+            mock_format.assert_called_once_with(
+                faceted.top(5), "python remote", 1, None, offset=0
+            )
+            self.ctx.send.assert_called_once()
+            self.assertEqual(self.ctx.send.call_args.args[0], "formatted")
+
+    async def test_jobs_attaches_facet_menus(self):
+        """jobs command attaches facet select menus when there are results."""
+        jobs = [
+            Listing.from_entry(
+                {"Title": f"Python Role {number}", "Type": "Job", "Company": "Acme"}
+            )
+            for number in range(4)
+        ] + [
+            Listing.from_entry(
+                {"Title": "Python Intern", "Type": "Internship", "Company": "Acme"}
+            ),
+            Listing.from_entry(
+                {"Title": "Python Developer", "Type": "Job", "Company": "Acme"}
+            ),
+        ]
+        index = SearchIndex(jobs)
+        faceted = FacetedResult(
+            jobs,
+            FacetIndex(jobs, index),
+            [(listing_id, 1.0) for listing_id in range(len(jobs))],
+        )
+        with patch("bot.listing_data") as mock_data:
+            mock_data.facet_search = AsyncMock(return_value=faceted)
+            mock_data.cursors = CursorStore()
+            await bot.get_command("jobs").callback(self.ctx, args="python")
+            mock_data.facet_search.assert_awaited_once_with("jobs", "python")
+            message = self.ctx.send.call_args.args[0]
+            self.assertIn("Found 6 job(s)", message)
+            self.assertIn("Showing jobs 1-5 of 6.", message)
+            view = self.ctx.send.call_args.kwargs["view"]
+            self.assertIsInstance(view, FacetView)
+            self.assertEqual(view.author_id, self.ctx.author.id)
+            self.assertIs(view.message, self.ctx.send.return_value)
+            # Every job is at Acme, so Company cannot narrow them
+            menus, buttons = view.children[:-2], view.children[-2:]
+            self.assertEqual([menu.placeholder for menu in menus], ["Filter by Type"])
+            self.assertEqual([button.label for button in buttons], ["◀ Prev", "Next ▶"])
+
+    async def test_jobs_no_results_searches_once(self):
+        """jobs command replies from the faceted search when nothing matches."""
+        jobs = [Listing.from_entry({"Title": "Java Developer", "Type": "Job"})]
+        faceted = FacetedResult(jobs, FacetIndex(jobs, SearchIndex(jobs)), [])
+        with patch("bot.listing_data") as mock_data:
+            mock_data.facet_search = AsyncMock(return_value=faceted)
+            await bot.get_command("jobs").callback(self.ctx, args="cobol")
+            mock_data.facet_search.assert_awaited_once()
+            self.ctx.send.assert_called_once_with(
+                "💼 No jobs found matching your criteria.", view=None
+            )
 
     async def test_jobs_error_path(self):
-        """jobs command reports error message on exceptions from get_jobs."""
-        with patch("bot.get_jobs", side_effect=OSError("boom")) as mock_get:
+        """jobs command reports error message on exceptions from the data layer."""
+        with patch("bot.listing_data") as mock_data:
+            mock_data.facet_search = AsyncMock(side_effect=OSError("boom"))
             await bot.get_command("jobs").callback(self.ctx, args="anything")
-            mock_get.assert_called_once()
+            mock_data.facet_search.assert_awaited_once()
+            mock_data.search_jobs.assert_not_called()
             self.ctx.send.assert_called_once()
             self.assertIn("there was an error", self.ctx.send.call_args[0][0])
 
+    async def test_events_busy_path(self):
+        """events command reports busy data layer without searching again."""
+        with patch("bot.listing_data") as mock_data:
+            mock_data.facet_search = AsyncMock(side_effect=RuntimeError("busy"))
+            await bot.get_command("events").callback(self.ctx, args="")
+            mock_data.facet_search.assert_awaited_once_with("events", "")
+            mock_data.search_events.assert_not_called()
+            self.ctx.send.assert_called_once_with(
+                "Error retrieving events. Please try again later"
+            )
+
     async def test_on_member_join_success(self):
         """Test on_member_join event sends welcome message successfully."""
         mock_member = MagicMock(spec=discord.Member)
@@ -233,6 +308,48 @@ class TestCSClubBot(unittest.IsolatedAsyncioTestCase):
             f"❌ Error sending welcome message for {mock_member.display_name}: Test error"  # noqa: E501
         )
 
+    async def test_welcome_text_cached_per_guild(self):
+        """Test on_member_join looks up channels once per guild until they change."""
+        guild = MagicMock(spec=discord.Guild)
+        guild.name = "Test Server"
+        welcome_channel = MagicMock(spec=discord.TextChannel)
+        welcome_channel.name = "welcome"
+        welcome_channel.send = AsyncMock()
+        channels = MagicMock()
+        channels.__iter__.side_effect = lambda: iter([welcome_channel])
+        guild.text_channels = channels
+
+        for mention in ("<@1>", "<@2>"):
+            member = MagicMock(spec=discord.Member)
+            member.mention = mention
+            member.display_name = "TestUser"
+            member.guild = guild
+            bot.dispatch("member_join", member)
+            await asyncio.sleep(0)
+
+        self.assertEqual(channels.__iter__.call_count, 2)
+        self.assertIn("<@2>!", welcome_channel.send.call_args[0][0])
+        channel = MagicMock(spec=discord.TextChannel)
+        channel.guild = guild
+        bot.dispatch("guild_channel_create", channel)
+        await asyncio.sleep(0)
+        self.assertIsNone(response_cache.get(("welcome", guild.id)))
+
+    async def test_first_page_is_cached(self):
+        """Repeated searches reuse the formatted first page of a cached result."""
+        jobs = [Listing.from_entry({"Title": "Python Intern", "Type": "Job"})]
+        faceted = FacetedResult(jobs, FacetIndex(jobs, SearchIndex(jobs)), [(0, 1.0)])
+        faceted.key = ("facets", "jobs", "python", 1, 0)
+        with patch("bot.listing_data") as mock_data, patch(
+            "bot.format_jobs_message", return_value="formatted"
+        ) as mock_format:
+            mock_data.facet_search = AsyncMock(return_value=faceted)
+            mock_data.cursors = CursorStore()
+            await bot.get_command("jobs").callback(self.ctx, args="python")
+            await bot.get_command("jobs").callback(self.ctx, args="python")
+        mock_format.assert_called_once()
+        self.assertEqual(self.ctx.send.call_args_list[1].args, ("formatted",))
+
 
 if __name__ == "__main__":
     # Run the tests when the file is executed directly
@@ -0,0 +1,83 @@
+"""Unittests for cache.py"""
+
+import unittest
+from unittest.mock import patch
+
+from data_processing.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """
+    Tests for the TTLCache class
+    """
+
+    def test_hit_and_miss_counters(self):
+        """
+        Test that lookups are counted as hits or misses
+        """
+        cache = TTLCache(max_size=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(
+            cache.stats(), {"size": 1, "max_size": 2, "hits": 1, "misses": 1}
+        )
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the least recently used entry is evicted when full
+        """
+        cache = TTLCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_entries_expire_after_ttl(self):
+        """
+        Test that entries older than the TTL are treated as misses
+        """
+        cache = TTLCache(max_size=2, ttl=10)
+        with patch("data_processing.cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("data_processing.cache.time.monotonic", return_value=105.0):
+            self.assertEqual(cache.get("a"), 1)
+        with patch("data_processing.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_zero_size_disables_cache(self):
+        """
+        Test that a cache of size 0 never stores anything
+        """
+        cache = TTLCache(max_size=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_discard(self):
+        """
+        Test that a discarded entry misses and unknown keys are ignored
+        """
+        cache = TTLCache(max_size=2)
+        cache.put("a", 1)
+        cache.discard("a")
+        cache.discard("missing")
+        self.assertIsNone(cache.get("a"))
+
+    def test_clear_keeps_counters(self):
+        """
+        Test that clearing drops entries but not statistics
+        """
+        cache = TTLCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,10 +6,14 @@ from unittest.mock import mock_open, patch
 import pandas as pd
 
 from data_collections.csv_updater import (
+    add_timestamp_columns,
+    append_items_to_csv,
+    compact_csv,
     extract_entries_from_csv,
     items_to_csv,
     remove_duplicates,
 )
+from data_collections.link_index import LinkIndex
 
 FAKE_CSV = """Type,Title,Description,whenDate,pubDate,Location,link,entryDate
 Event,dummy_Title,dummy_Description,dummy_whenDate,dummy_pubDate,dummy_Location,dummy_Link,dummy_entryDate
@@ -310,3 +314,120 @@ class TestItemsToCSV(unittest.TestCase):
                 ),
                 result_df.sort_values(list(expected_df.columns)).reset_index(drop=True),
             )
+
+
+class TestRemoveDuplicatesWithIndex(unittest.TestCase):
+    """Testing suite for remove_duplicates() with a persisted link index"""
+
+    def test_drops_links_already_indexed(self):
+        data = [{"link": "dummy_Link"}, {"link": "new_Link"}, {"link": "new_Link"}]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.csv")
+            with open(path, "w", encoding="utf8") as file:
+                file.write(FAKE_CSV)
+            with LinkIndex(path) as index:
+                result = remove_duplicates(data, index)
+        self.assertEqual(result, [{"link": "new_Link"}])
+
+
+class TestAppendItemsToCSV(unittest.TestCase):
+    """Testing suite for the append_items_to_csv() and compact_csv() methods"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "test.csv")
+        with open(self.path, "w", encoding="utf8") as file:
+            file.write(FAKE_CSV)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_missing_file(self):
+        with self.assertRaises(RuntimeError) as context:
+            append_items_to_csv([{"link": "x"}], "missing.csv")
+        self.assertIn("path_to_csv not found", str(context.exception))
+
+    def test_no_data(self):
+        self.assertEqual(append_items_to_csv([], self.path), 0)
+
+    def test_appends_only_new_links(self):
+        incoming = [
+            {"Type": "Event", "Title": "old", "link": "dummy_Link"},
+            {"Type": "Event", "Title": "new", "link": "new_Link", "extra": "x"},
+            {"Type": "Event", "Title": "new again", "link": "new_Link"},
+        ]
+        with patch("builtins.print"):
+            self.assertEqual(append_items_to_csv(incoming, self.path), 1)
+            self.assertEqual(append_items_to_csv(incoming, self.path), 0)
+        entries = extract_entries_from_csv(self.path)
+        self.assertEqual(
+            [entry["link"] for entry in entries],
+            ["dummy_Link", "test_Link", "new_Link"],
+        )
+        self.assertEqual(entries[-1]["Title"], "new")
+        self.assertEqual(entries[-1]["Description"], "")
+        self.assertNotIn("extra", entries[-1])
+
+    def test_existing_rows_are_not_read(self):
+        with (
+            patch("builtins.print"),
+            patch(
+                "data_collections.csv_updater.extract_entries_from_csv"
+            ) as mock_extract,
+        ):
+            append_items_to_csv([{"Type": "Event", "link": "a"}], self.path)
+            append_items_to_csv([{"Type": "Event", "link": "b"}], self.path)
+        mock_extract.assert_not_called()
+
+    def test_compact_removes_duplicates(self):
+        with open(self.path, "a", encoding="utf8") as file:
+            file.write(FAKE_CSV.splitlines()[1] + "\n")
+        self.assertEqual(compact_csv(self.path), 1)
+        entries = extract_entries_from_csv(self.path)
+        self.assertEqual(
+            [entry["link"] for entry in entries], ["dummy_Link", "test_Link"]
+        )
+        with patch("builtins.print"):
+            self.assertEqual(
+                append_items_to_csv([{"link": "dummy_Link"}], self.path), 0
+            )
+
+    def test_compact_rewrites_legacy_locations(self):
+        with open(self.path, "a", encoding="utf8") as file:
+            file.write("Job,t,d,w,p,\"['Remote', 'Boston, MA']\",loc_Link,e\n")
+        compact_csv(self.path)
+        entries = extract_entries_from_csv(self.path)
+        self.assertEqual(entries[-1]["Location"], "Remote; Boston, MA")
+
+    def test_add_timestamp_columns(self):
+        with open(self.path, "a", encoding="utf8") as file:
+            file.write("Job,t,d,07/31/2025,2023-09-30,l,dated_Link,2023-10-01\n")
+        self.assertTrue(add_timestamp_columns(self.path))
+        self.assertFalse(add_timestamp_columns(self.path))
+        entries = extract_entries_from_csv(self.path)
+        self.assertEqual(entries[0]["pubTimestamp"], "")
+        self.assertEqual(entries[-1]["pubTimestamp"], "1696032000")
+        self.assertEqual(entries[-1]["whenTimestamp"], "1753920000")
+        self.assertEqual(entries[-1]["entryTimestamp"], "1696118400")
+
+    def test_append_upgrades_header_for_timestamps(self):
+        incoming = [
+            {
+                "Type": "Event",
+                "link": "new_Link",
+                "pubTimestamp": 1,
+                "whenTimestamp": None,
+                "entryTimestamp": 2,
+            }
+        ]
+        with patch("builtins.print"):
+            self.assertEqual(append_items_to_csv(incoming, self.path), 1)
+            self.assertEqual(append_items_to_csv(incoming, self.path), 0)
+        entries = extract_entries_from_csv(self.path)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(entries[-1]["pubTimestamp"], "1")
+        self.assertEqual(entries[-1]["whenTimestamp"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
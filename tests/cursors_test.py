@@ -0,0 +1,120 @@
+"""Unittests for cursors.py"""
+
+import unittest
+from unittest.mock import patch
+
+from data_processing.cursors import CursorStore
+from data_processing.facets import FacetedResult, FacetIndex
+from data_processing.listing import Listing
+from data_processing.search_index import SearchIndex
+
+
+class TestCursorStore(unittest.TestCase):
+    """
+    Tests for the store of result cursors
+    """
+
+    def setUp(self):
+        listings = [Listing.from_entry({"Title": f"Job {n}"}) for n in range(8)]
+        self.facets = FacetIndex(listings, SearchIndex(listings))
+        self.listings = listings
+
+    def _result(self, size):
+        return FacetedResult(
+            self.listings,
+            self.facets,
+            [(listing_id, 1.0) for listing_id in range(size)],
+        )
+
+    def test_open_and_get(self):
+        """
+        Test that a cursor returns its results and accounts for their memory
+        """
+        store = CursorStore()
+        result = self._result(4)
+        cursor_id = store.open(result)
+        self.assertIs(store.get(cursor_id), result)
+        self.assertEqual(store.memory_bytes, result.nbytes)
+        self.assertIsNone(store.get("unknown"))
+
+    def test_close_releases_memory(self):
+        """
+        Test that closing a cursor forgets it and its memory
+        """
+        store = CursorStore()
+        cursor_id = store.open(self._result(4))
+        store.close(cursor_id)
+        store.close(cursor_id)
+        self.assertIsNone(store.get(cursor_id))
+        self.assertEqual(store.memory_bytes, 0)
+        self.assertEqual(len(store), 0)
+
+    def test_shared_result_counted_once(self):
+        """
+        Test that cursors over the same results account for their memory once
+        """
+        store = CursorStore()
+        result = self._result(4)
+        first = store.open(result)
+        second = store.open(result)
+        self.assertEqual(store.memory_bytes, result.nbytes)
+        store.close(first)
+        self.assertEqual(store.memory_bytes, result.nbytes)
+        self.assertIs(store.get(second), result)
+        store.close(second)
+        self.assertEqual(store.memory_bytes, 0)
+
+    def test_lru_eviction_by_count(self):
+        """
+        Test that the least recently read cursor is closed first
+        """
+        store = CursorStore(max_cursors=2)
+        first = store.open(self._result(1))
+        second = store.open(self._result(1))
+        store.get(first)
+        third = store.open(self._result(1))
+        self.assertIsNone(store.get(second))
+        self.assertIsNotNone(store.get(first))
+        self.assertIsNotNone(store.get(third))
+        self.assertEqual(store.stats()["evicted"], 1)
+
+    def test_eviction_by_memory(self):
+        """
+        Test that cursors are closed to stay within the memory budget, but
+        the newest is kept even alone over it
+        """
+        size = self._result(8).nbytes
+        store = CursorStore(max_bytes=size + 1)
+        first = store.open(self._result(8))
+        second = store.open(self._result(8))
+        self.assertIsNone(store.get(first))
+        self.assertIsNotNone(store.get(second))
+        self.assertEqual(store.memory_bytes, size)
+        store.max_bytes = 1
+        third = store.open(self._result(8))
+        self.assertIsNotNone(store.get(third))
+        self.assertEqual(len(store), 1)
+
+    def test_ttl_extends_on_read(self):
+        """
+        Test that cursors expire after their TTL since the last read
+        """
+        store = CursorStore(ttl=10)
+        with patch("data_processing.cursors.time.monotonic", return_value=100):
+            cursor_id = store.open(self._result(2))
+            other = store.open(self._result(2))
+        with patch("data_processing.cursors.time.monotonic", return_value=108):
+            self.assertIsNotNone(store.get(cursor_id))
+        with patch("data_processing.cursors.time.monotonic", return_value=115):
+            self.assertIsNotNone(store.get(cursor_id))
+            self.assertIsNone(store.get(other))
+        with patch("data_processing.cursors.time.monotonic", return_value=200):
+            store.open(self._result(2))
+        stats = store.stats()
+        self.assertEqual(stats["expired"], 2)
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["opened"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
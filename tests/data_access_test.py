@@ -0,0 +1,202 @@
+"""Unittests for data_access.py"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from data_processing.autocomplete import AutocompleteIndex
+from data_processing.data_access import (
+    DEFAULT_WORKERS,
+    DataAccessBusyError,
+    ListingDataAccess,
+)
+from data_processing.date_index import DateIndex
+from data_processing.facets import FacetedResult, FacetIndex, faceted_search
+from data_processing.search_index import SearchIndex
+
+
+class TestListingDataAccess(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the ListingDataAccess class
+    """
+
+    async def asyncSetUp(self):
+        self.store = MagicMock()
+        jobs = [{"Title": "Python Intern"}, {"Title": "Java Developer"}]
+        events = [{"Title": "Git Workshop"}]
+        jobs_index = SearchIndex(jobs)
+        events_index = SearchIndex(events)
+        self.store.snapshot.return_value = MagicMock(
+            jobs=jobs,
+            events=events,
+            jobs_index=jobs_index,
+            events_index=events_index,
+            jobs_by_date=DateIndex(jobs),
+            events_by_date=DateIndex(events),
+            jobs_suggestions=AutocompleteIndex(jobs),
+            events_suggestions=AutocompleteIndex(events),
+            jobs_facets=FacetIndex(jobs, jobs_index),
+            events_facets=FacetIndex(events, events_index),
+        )
+        self.store.current = self.store.snapshot.return_value
+        self.data = ListingDataAccess(self.store, max_workers=2, max_pending=2)
+
+    async def asyncTearDown(self):
+        self.data.close()
+
+    async def test_search_runs_off_event_loop(self):
+        """
+        Test that searches run on a worker thread, not the event loop thread
+        """
+        threads = []
+
+        def record_thread():
+            threads.append(threading.current_thread())
+            return self.store.snapshot.return_value
+
+        self.store.snapshot.side_effect = record_thread
+        result = await self.data.facet_search("jobs", "python")
+        self.assertEqual([job["Title"] for job in result.top(5)], ["Python Intern"])
+        self.assertEqual(result.total, 1)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    async def test_expired_jobs_are_excluded(self):
+        """
+        Test that jobs whose expiry date has passed are not returned
+        """
+        jobs = [
+            {"Title": "Python Intern", "whenTimestamp": 0},
+            {"Title": "Python Developer", "whenTimestamp": None},
+        ]
+        snapshot = self.store.snapshot.return_value
+        snapshot.jobs = jobs
+        snapshot.jobs_index = SearchIndex(jobs)
+        snapshot.jobs_by_date = DateIndex(jobs)
+        snapshot.jobs_facets = FacetIndex(jobs, snapshot.jobs_index)
+        result = await self.data.facet_search("jobs", "python")
+        self.assertEqual([job["Title"] for job in result.top(5)], ["Python Developer"])
+        self.assertEqual(result.total, 1)
+
+    async def test_facet_search_is_cached(self):
+        """
+        Test that the full ranking behind facet menus is computed once
+        """
+        self.store.snapshot.return_value.generation = 1
+        first = await self.data.facet_search("jobs", "python")
+        second = await self.data.facet_search("jobs", "python ")
+        self.assertIs(first, second)
+        self.assertEqual(first.total, 1)
+        events = await self.data.facet_search("events", "")
+        self.assertEqual(events.top(5), [{"Title": "Git Workshop"}])
+
+    async def test_suggest(self):
+        """
+        Test that autocomplete suggestions come from the requested listings
+        """
+        self.assertEqual(await self.data.suggest("jobs", "title", "ja"), ["java"])
+        self.assertEqual(await self.data.suggest("events", "title", "w"), ["workshop"])
+
+    async def test_repeated_queries_hit_the_cache(self):
+        """
+        Test that equivalent queries are answered from the query cache
+        """
+        self.store.snapshot.return_value.generation = 1
+        with patch(
+            "data_processing.data_access.faceted_search",
+            wraps=faceted_search,
+        ) as mock_search:
+            first = await self.data.facet_search("jobs", "Python  intern")
+            second = await self.data.facet_search("jobs", "intern python")
+        mock_search.assert_called_once()
+        self.assertIs(first, second)
+        self.assertEqual(self.data.query_cache.hits, 1)
+        self.assertEqual(self.data.query_cache.misses, 1)
+
+    async def test_new_generation_misses_the_cache(self):
+        """
+        Test that a reloaded snapshot is searched again
+        """
+        self.store.snapshot.return_value.generation = 1
+        await self.data.facet_search("jobs", "python")
+        self.store.snapshot.return_value.generation = 2
+        await self.data.facet_search("jobs", "python")
+        self.assertEqual(self.data.query_cache.hits, 0)
+        self.assertEqual(self.data.query_cache.misses, 2)
+
+    async def test_rejects_when_queue_is_full(self):
+        """
+        Test that requests beyond max_pending are rejected immediately
+        """
+        release = threading.Event()
+        started = [asyncio.create_task(self.data.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.data.pending, 2)
+        with self.assertRaises(DataAccessBusyError):
+            await self.data.run(release.wait)
+        release.set()
+        await asyncio.gather(*started)
+        self.assertEqual(self.data.pending, 0)
+
+    async def test_concurrent_identical_searches_coalesce(self):
+        """
+        Test that equivalent searches in flight share one worker run
+        """
+        release = threading.Event()
+        calls = []
+
+        def slow_search(kind, _filters):
+            calls.append(_filters)
+            release.wait()
+            return FacetedResult([], None, [])
+
+        with patch.object(self.data, "_facet_search", side_effect=slow_search):
+            tasks = [
+                asyncio.create_task(self.data.facet_search("jobs", query))
+                for query in ("python", " Python ", "java")
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+        self.assertEqual(sorted(calls), ["java", "python"])
+        self.assertIs(results[0], results[1])
+        self.assertEqual(
+            self.data.single_flight.stats(),
+            {"in_flight": 0, "calls": 2, "coalesced": 1},
+        )
+
+    async def test_errors_propagate(self):
+        """
+        Test that load errors reach the caller and free the pending slot
+        """
+        self.store.snapshot.side_effect = OSError("missing")
+        with self.assertRaises(OSError):
+            await self.data.facet_search("jobs", "python")
+        self.assertEqual(self.data.pending, 0)
+
+    async def test_worker_count_from_environment(self):
+        """
+        Test that worker settings fall back to the environment and defaults
+        """
+        with patch.dict("os.environ", {"LISTING_WORKERS": "7"}):
+            self.assertEqual(ListingDataAccess(self.store).max_workers, 7)
+        with patch.dict("os.environ", {"LISTING_WORKERS": "many"}), patch(
+            "builtins.print"
+        ):
+            self.assertEqual(ListingDataAccess(self.store).max_workers, DEFAULT_WORKERS)
+
+    async def test_cursor_bounds_from_environment(self):
+        """
+        Test that the cursor store is bounded by the environment
+        """
+        with patch.dict(
+            "os.environ", {"CURSOR_MAX_OPEN": "3", "CURSOR_MAX_BYTES": "4096"}
+        ):
+            cursors = ListingDataAccess(self.store).cursors
+        self.assertEqual(cursors.max_cursors, 3)
+        self.assertEqual(cursors.max_bytes, 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Unittests for date_index.py"""
+
+import unittest
+from zoneinfo import ZoneInfo
+
+from data_processing.date_index import DAY_SECONDS, DateIndex, start_of_day
+
+TODAY = 1_750_000_000 // DAY_SECONDS * DAY_SECONDS
+
+
+class TestDateIndex(unittest.TestCase):
+    """
+    Tests for the DateIndex class
+    """
+
+    def setUp(self):
+        self.listings = [
+            {"Title": "Next week", "whenTimestamp": TODAY + 8 * DAY_SECONDS},
+            {"Title": "Yesterday", "whenTimestamp": TODAY - DAY_SECONDS},
+            {"Title": "Undated", "whenTimestamp": None},
+            {"Title": "Tonight", "whenTimestamp": TODAY + 18 * 60 * 60},
+            {"Title": "In three days", "whenTimestamp": TODAY + 3 * DAY_SECONDS},
+        ]
+        self.index = DateIndex(self.listings)
+
+    def test_start_of_day(self):
+        """
+        Test that times are truncated to the start of their day
+        """
+        utc = ZoneInfo("UTC")
+        self.assertEqual(start_of_day(TODAY + 12345, utc), TODAY)
+        self.assertEqual(start_of_day(TODAY, utc), TODAY)
+
+    def test_start_of_day_is_local(self):
+        """
+        Test that the day ends at local midnight, not UTC midnight
+        """
+        # 8 PM on June 15 2025 in New York (EDT) is midnight UTC on June 16
+        evening = TODAY + 24 * 60 * 60
+        self.assertEqual(start_of_day(evening), TODAY)
+        self.assertFalse(self.index.is_past(3, start_of_day(evening)))
+        # 8 PM on January 15 2025 (EST) is 1 AM UTC on January 16
+        winter = 1_736_899_200
+        self.assertEqual(start_of_day(winter + 25 * 60 * 60), winter)
+
+    def test_sorted_by_date(self):
+        """
+        Test that dated listings are kept sorted and undated ones aside
+        """
+        self.assertEqual(list(self.index.ids), [1, 3, 4, 0])
+        self.assertEqual(self.index.undated, [2])
+
+    def test_upcoming(self):
+        """
+        Test that upcoming listings start at the cutoff, undated last
+        """
+        self.assertEqual(self.index.upcoming(TODAY, k=2), ([3, 4], 4))
+        self.assertEqual(self.index.upcoming(TODAY), ([3, 4, 0, 2], 4))
+        self.assertEqual(
+            self.index.upcoming(TODAY, include_undated=False), ([3, 4, 0], 3)
+        )
+
+    def test_current(self):
+        """
+        Test that current listings keep their original order
+        """
+        self.assertEqual(self.index.current(TODAY), ([0, 2, 3, 4], 4))
+        self.assertEqual(self.index.current(TODAY, k=2), ([0, 2], 4))
+        self.assertEqual(self.index.current(TODAY + 9 * DAY_SECONDS), ([2], 1))
+
+    def test_is_past(self):
+        """
+        Test that only listings dated before the cutoff are past
+        """
+        self.assertTrue(self.index.is_past(1, TODAY))
+        self.assertFalse(self.index.is_past(3, TODAY))
+        self.assertFalse(self.index.is_past(2, TODAY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Unittests for dates.py"""
+
+import datetime
+import unittest
+
+from data_collections.dates import (
+    add_timestamps,
+    parse_entry_date,
+    parse_pub_date,
+    parse_when_date,
+)
+
+
+def _epoch(*args) -> int:
+    return int(datetime.datetime(*args, tzinfo=datetime.timezone.utc).timestamp())
+
+
+class TestParseDates(unittest.TestCase):
+    """Testing suite for the date normalization helpers"""
+
+    def test_parse_pub_date_rfc_2822(self):
+        self.assertEqual(
+            parse_pub_date("Wed, 29 Jan 2025 20:13:44 +0000"),
+            _epoch(2025, 1, 29, 20, 13, 44),
+        )
+
+    def test_parse_pub_date_iso(self):
+        self.assertEqual(parse_pub_date("2023-09-30"), _epoch(2023, 9, 30))
+
+    def test_parse_pub_date_invalid(self):
+        self.assertIsNone(parse_pub_date("yesterday"))
+        self.assertIsNone(parse_pub_date(""))
+
+    def test_parse_when_date_expiry(self):
+        self.assertEqual(parse_when_date("07/31/2025"), _epoch(2025, 7, 31))
+
+    def test_parse_when_date_event_text(self):
+        self.assertEqual(
+            parse_when_date("Monday, July 28, 2025, 5:00 PM – 6:00 PM"),
+            _epoch(2025, 7, 28, 17, 0),
+        )
+        self.assertEqual(parse_when_date("Sept 3rd 2025"), _epoch(2025, 9, 3))
+
+    def test_parse_when_date_without_date(self):
+        self.assertIsNone(parse_when_date("Summer 2025"))
+        self.assertIsNone(parse_when_date("Unknown"))
+        self.assertIsNone(parse_when_date("02/30/2025"))
+
+    def test_parse_entry_date(self):
+        self.assertEqual(
+            parse_entry_date("2025-07-28 04:38:29.555110+00:00"),
+            _epoch(2025, 7, 28, 4, 38, 29),
+        )
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.assertEqual(parse_entry_date(now), int(now.timestamp()))
+
+    def test_add_timestamps(self):
+        entry = add_timestamps(
+            {"pubDate": "2023-09-30", "whenDate": "", "entryDate": "2023-10-01"}
+        )
+        self.assertEqual(entry["pubTimestamp"], _epoch(2023, 9, 30))
+        self.assertIsNone(entry["whenTimestamp"])
+        self.assertEqual(entry["entryTimestamp"], _epoch(2023, 10, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,11 @@
 
 import unittest
 
+from data_processing.date_index import DateIndex
 from data_processing.event_command import (
     filter_events,
     format_event_message,
+    search_events,
 )
 
 
@@ -77,3 +79,56 @@ class TestEventCommand(unittest.TestCase):
         self.assertIn("LeetCode Challenge Night", result)
         self.assertIn("Final Meeting + Pizza", result)
         self.assertIn("Total events found: 3 (Filters: Workshop)", result)
+
+    def test_search_events_returns_top_k_and_total(self):
+        """
+        Test that search_events keeps only the top k events but counts all
+        """
+        result = search_events(self.sample_events, "room", k=2)
+        self.assertEqual(len(result.listings), 2)
+        self.assertEqual(result.total, 3)
+
+    def test_format_event_message_uses_total(self):
+        """
+        Test that the total count and top-5 note come from the total
+        """
+        result = format_event_message(self.sample_events, "room", total=8)
+        self.assertIn("Total events found: 8 (Filters: room)", result)
+        self.assertIn("Only the top 5 events are displayed", result)
+
+    def test_format_event_message_page(self):
+        """
+        Test that a page of results shows its range instead of the top-5 note
+        """
+        result = format_event_message(self.sample_events, "", total=8, offset=5)
+        self.assertIn(f"Showing events 6-{5 + len(self.sample_events)} of 8.", result)
+        self.assertNotIn("Only the top 5", result)
+
+    def test_search_events_upcoming_first(self):
+        """
+        Test that without criteria the soonest upcoming events come first
+        """
+        cutoff = 1_750_000_000
+        events = [
+            {**self.sample_events[0], "whenTimestamp": cutoff - 1},
+            {**self.sample_events[1], "whenTimestamp": cutoff + 200},
+            {**self.sample_events[2], "whenTimestamp": cutoff + 100},
+        ]
+        dates = DateIndex(events)
+        result = search_events(events, "", dates=dates, cutoff=cutoff)
+        self.assertEqual(result.listings, [events[2], events[1]])
+        self.assertEqual(result.total, 2)
+        result = search_events(events, "git", dates=dates, cutoff=cutoff)
+        self.assertEqual(result.total, 0)
+
+    def test_search_events_corrects_misspelled_terms(self):
+        """
+        Test that a misspelled query is searched for with its correction
+        """
+        result = search_events(self.sample_events, "worksop")
+        self.assertEqual(result.corrected, "workshop")
+        self.assertEqual(result.listings[0]["Title"], "Git Workshop")
+        message = format_event_message(
+            result.listings, "worksop", result.total, result.corrected
+        )
+        self.assertTrue(message.startswith("🔎 Did you mean **workshop**?"))
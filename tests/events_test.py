@@ -102,3 +102,12 @@ class TestGetEvents(unittest.TestCase):
         mock_parse.return_value = sample_return
         result = getEvents("http://valid-url.com/rss", "MOCK_TASK")
         self.assertIn("entryDate", result[0])
+
+    # Test that the dates are normalized into timestamps at ingest
+    @patch("feedparser.parse")
+    def test_timestamps_recorded(self, mock_parse):
+        mock_parse.return_value = sample_return
+        result = getEvents("http://valid-url.com/rss", "MOCK_TASK")
+        self.assertEqual(result[0]["pubTimestamp"], 1696032000)
+        self.assertEqual(result[0]["whenTimestamp"], 1696118400)
+        self.assertIsInstance(result[0]["entryTimestamp"], int)
@@ -0,0 +1,224 @@
+"""Unittests for facet_view.py"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from data_processing.cursors import CursorStore
+from data_processing.facet_view import (
+    EXPIRED_MESSAGE,
+    NOT_AUTHOR_MESSAGE,
+    FacetView,
+    describe_filters,
+    option_label,
+)
+from data_processing.facets import FacetedResult, FacetIndex
+from data_processing.listing import Listing
+from data_processing.search_index import SearchIndex
+
+
+class TestFacetView(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the facet select menus
+    """
+
+    async def asyncSetUp(self):
+        self.listings = [
+            Listing.from_entry({"Title": "Intern", "Type": "Internship"}),
+            Listing.from_entry({"Title": "Developer", "Type": "Job"}),
+            Listing.from_entry({"Title": "Analyst", "Type": "Job"}),
+        ]
+        index = SearchIndex(self.listings)
+        self.result = FacetedResult(
+            self.listings,
+            FacetIndex(self.listings, index),
+            [(0, 0.0), (1, 0.0), (2, 0.0)],
+            scored=False,
+        )
+        self.cursors = CursorStore()
+        self.view = FacetView(
+            self.result,
+            self.cursors,
+            lambda result, page: f"page {page + 1} of {result.total} result(s)",
+            page_size=2,
+            author_id=42,
+            timeout=None,
+        )
+
+    def test_describe_filters(self):
+        """
+        Test that picked facet values follow the search terms
+        """
+        self.assertEqual(
+            describe_filters(" python ", (("Type", "Job"),)), "python Type: Job"
+        )
+        self.assertEqual(describe_filters("", ()), "")
+
+    def test_option_label(self):
+        """
+        Test that long values are shortened but keep their count
+        """
+        self.assertEqual(option_label("Job", 2), "Job (2)")
+        label = option_label("x" * 200, 12)
+        self.assertEqual(len(label), 100)
+        self.assertTrue(label.endswith("… (12)"))
+
+    async def test_menus_show_counts(self):
+        """
+        Test that each facet with values gets a menu with counted options
+        """
+        select, previous, following = self.view.children
+        self.assertEqual(select.placeholder, "Filter by Type")
+        self.assertEqual(
+            [option.label for option in select.options],
+            ["Job (2)", "Internship (1)"],
+        )
+        self.assertTrue(previous.disabled)
+        self.assertFalse(following.disabled)
+        self.assertEqual(self.view.content(), "page 1 of 3 result(s)")
+
+    async def test_events_offer_remote_hybrid(self):
+        """
+        Test that a facet every result shares gets no menu, leaving room for
+        Remote/Hybrid
+        """
+        events = [
+            Listing.from_entry(
+                {
+                    "Title": f"Event {n}",
+                    "Type": "Event",
+                    "subType": ("Workshop", "Talk")[n % 2],
+                    "Company": ("Acme", "Globex")[n % 2],
+                    "Location": ("Remote", "Hybrid; Albany, NY", "Austin, TX")[n % 3],
+                }
+            )
+            for n in range(6)
+        ]
+        result = FacetedResult(
+            events,
+            FacetIndex(events, SearchIndex(events)),
+            [(n, 0.0) for n in range(6)],
+            scored=False,
+        )
+        for page_size, buttons in ((2, 2), (10, 0)):
+            view = FacetView(
+                result, CursorStore(), lambda *_: "", page_size, timeout=None
+            )
+            self.assertEqual(
+                [item.placeholder for item in view.children[:4]],
+                [
+                    "Filter by subType",
+                    "Filter by Company",
+                    "Filter by State",
+                    "Filter by Remote/Hybrid",
+                ],
+            )
+            self.assertEqual(len(view.children), 4 + buttons)
+
+    async def test_fifth_menu_without_page_buttons(self):
+        """
+        Test that a single page of results can show five menus
+        """
+        listings = [
+            Listing.from_entry(
+                {
+                    "Title": f"Listing {n}",
+                    "Type": ("Job", "Internship")[n % 2],
+                    "subType": ("Workshop", "Talk")[n % 2],
+                    "Company": ("Acme", "Globex")[n % 2],
+                    "Location": ("Remote; Albany, NY", "Austin, TX")[n % 2],
+                }
+            )
+            for n in range(2)
+        ]
+        result = FacetedResult(
+            listings,
+            FacetIndex(listings, SearchIndex(listings)),
+            [(0, 0.0), (1, 0.0)],
+            scored=False,
+        )
+        view = FacetView(result, CursorStore(), lambda *_: "", 5, timeout=None)
+        self.assertEqual(len(view.children), 5)
+        self.assertTrue(
+            all(isinstance(item, discord.ui.Select) for item in view.children)
+        )
+
+    async def test_select_narrows_and_edits_reply(self):
+        """
+        Test that picking a value narrows the cursor's results in place
+        """
+        select = self.view.children[0]
+        select._values = ["0"]
+        first_cursor = self.view.cursor_id
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+        await select.callback(interaction)
+        self.assertNotEqual(self.view.cursor_id, first_cursor)
+        self.assertIsNone(self.cursors.get(first_cursor))
+        self.assertEqual(self.view.children, [])
+        interaction.response.edit_message.assert_awaited_once_with(
+            content="page 1 of 2 result(s)", view=self.view
+        )
+
+    async def test_buttons_page_through_cursor(self):
+        """
+        Test that Next and Prev move between pages of the open cursor
+        """
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+        await self.view.children[2].callback(interaction)
+        self.assertEqual(self.view.page, 1)
+        interaction.response.edit_message.assert_awaited_once_with(
+            content="page 2 of 3 result(s)", view=self.view
+        )
+        previous, following = self.view.children[1:]
+        self.assertFalse(previous.disabled)
+        self.assertTrue(following.disabled)
+        await previous.callback(interaction)
+        self.assertEqual(self.view.page, 0)
+
+    async def test_expired_cursor(self):
+        """
+        Test that paging a closed cursor removes the controls
+        """
+        self.cursors.close(self.view.cursor_id)
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+        await self.view.children[2].callback(interaction)
+        interaction.response.edit_message.assert_awaited_once_with(
+            content=EXPIRED_MESSAGE, view=None
+        )
+        self.assertTrue(self.view.is_finished())
+
+    async def test_only_author_can_interact(self):
+        """
+        Test that other members get an ephemeral notice instead of control
+        """
+        interaction = MagicMock()
+        interaction.user.id = 42
+        self.assertTrue(await self.view.interaction_check(interaction))
+        interaction.user.id = 7
+        interaction.response.send_message = AsyncMock()
+        self.assertFalse(await self.view.interaction_check(interaction))
+        interaction.response.send_message.assert_awaited_once_with(
+            NOT_AUTHOR_MESSAGE, ephemeral=True
+        )
+
+    async def test_timeout_removes_controls(self):
+        """
+        Test that a timed-out reply loses its controls and closes its cursor
+        """
+        self.view.message = MagicMock()
+        self.view.message.edit = AsyncMock()
+        await self.view.on_timeout()
+        self.view.message.edit.assert_awaited_once_with(view=None)
+        self.assertIsNone(self.cursors.get(self.view.cursor_id))
+        self.view.message.edit.side_effect = discord.NotFound(
+            MagicMock(status=404), "Unknown Message"
+        )
+        await self.view.on_timeout()
+
+
+if __name__ == "__main__":
+    unittest.main()
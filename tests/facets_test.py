@@ -0,0 +1,106 @@
+"""Unittests for facets.py"""
+
+import unittest
+
+from data_processing.date_index import DateIndex
+from data_processing.facets import FacetedResult, FacetIndex, faceted_search
+from data_processing.listing import Listing
+from data_processing.search_index import SearchIndex
+
+
+def _listing(title, type_, company, location, when=None):
+    return Listing.from_entry(
+        {
+            "Title": title,
+            "Type": type_,
+            "Company": company,
+            "Location": location,
+            "pubTimestamp": None,
+            "whenTimestamp": when,
+            "entryTimestamp": None,
+        }
+    )
+
+
+class TestFacets(unittest.TestCase):
+    """
+    Tests for facet counts and narrowing
+    """
+
+    def setUp(self):
+        self.listings = [
+            _listing("Python Intern", "Internship", "Acme", "Remote; Albany, NY"),
+            _listing("Python Developer", "Job", "acme", "Austin, TX"),
+            _listing("Java Intern", "Internship", "Globex", "Hybrid; Buffalo, NY"),
+            _listing("Designer", "Job", "Globex", "Remote", when=0),
+        ]
+        self.index = SearchIndex(self.listings)
+        self.facets = FacetIndex(self.listings, self.index)
+        self.dates = DateIndex(self.listings)
+
+    def test_precomputed_counts(self):
+        """
+        Test that every facet value is counted once per listing
+        """
+        self.assertEqual(self.facets.counts["Type"], {"Internship": 2, "Job": 2})
+        self.assertEqual(self.facets.counts["Company"], {"Acme": 2, "Globex": 2})
+        self.assertEqual(self.facets.counts["State"], {"NY": 2, "TX": 1})
+        self.assertEqual(
+            self.facets.counts["Remote/Hybrid"], {"Remote": 2, "Hybrid": 1}
+        )
+        self.assertEqual(self.facets.counts["subType"], {})
+
+    def test_facet_counts_of_result_set(self):
+        """
+        Test that counts are restricted to the result set, largest first
+        """
+        counts = self.facets.facet_counts(0b0111)
+        self.assertEqual(counts["Type"], [("Internship", 2), ("Job", 1)])
+        self.assertEqual(counts["Remote/Hybrid"], [("Hybrid", 1), ("Remote", 1)])
+
+    def test_narrow_keeps_ranking(self):
+        """
+        Test that narrowing keeps the original order and scores
+        """
+        result = FacetedResult(
+            self.listings, self.facets, [(2, 3.0), (1, 2.0), (0, 1.0)]
+        )
+        narrowed = result.narrow("State", "NY")
+        self.assertEqual(narrowed.ranked, [(2, 3.0), (0, 1.0)])
+        self.assertEqual(narrowed.total, 2)
+        self.assertEqual(narrowed.selections, (("State", "NY"),))
+        self.assertEqual(narrowed.top(1)[0]["confidence"], 3.0)
+        self.assertNotIn("State", narrowed.counts())
+        self.assertEqual(result.total, 3)
+
+    def test_pages(self):
+        """
+        Test that pages slice the ranking and count partial pages
+        """
+        result = FacetedResult(
+            self.listings, self.facets, [(3, 4.0), (2, 3.0), (1, 2.0)]
+        )
+        self.assertEqual(result.page_count(2), 2)
+        self.assertEqual(
+            [listing["Title"] for listing in result.page(1, 2)], ["Python Developer"]
+        )
+        self.assertEqual(result.page(5, 2), [])
+        self.assertEqual(result.nbytes, 3 * 4 + 3 * 8 + 1)
+        self.assertEqual(FacetedResult(self.listings, self.facets, []).page_count(2), 1)
+
+    def test_faceted_search(self):
+        """
+        Test that the full ranking leaves out past listings
+        """
+        result = faceted_search(
+            self.listings, "intern", self.index, self.dates, self.facets, cutoff=1
+        )
+        self.assertCountEqual([i for i, _ in result.ranked], [0, 2])
+        result = faceted_search(
+            self.listings, "", self.index, self.dates, self.facets, cutoff=1
+        )
+        self.assertEqual(result.top(5), self.listings[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
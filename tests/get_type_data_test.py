@@ -3,7 +3,8 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
-from data_processing.get_type_data import get_type_data
+from data_collections.csv_updater import extract_entries_from_csv
+from data_processing.get_type_data import get_type_data, get_types_data
 
 
 class TestGetTypeData(unittest.TestCase):
@@ -115,3 +116,62 @@ class TestGetTypeData(unittest.TestCase):
         ]
         results = get_type_data(self.temp_file_path, "Internship")
         self.assertEqual(len(results), 1)
+
+
+class TestGetTypesData(unittest.TestCase):
+    def setUp(self):
+        """
+        Create a temporary CSV file with several types for testing
+        """
+        with tempfile.NamedTemporaryFile(
+            delete=False, mode="w", suffix=".csv", encoding="utf8"
+        ) as temp_file:
+            temp_file.write(
+                "Type,subType,Title,Description,Company,Location,whenDate,pubDate,link,entryDate\n"  # noqa: E501
+                "Internship,,Pizza Intern,,Cheesy Dreams Inc,Italy,,,http://a.com,\n"
+                "Job,,Pizza Chef,,Cheesy Dreams Inc,Italy,,,http://b.com,\n"
+                "Event,workshop,Git Workshop,,,Room 101,,,http://c.com,\n"
+                "Internship,,Cloud Intern,,Sky High,Denver,,,http://d.com,\n"
+            )
+            self.temp_file_path = temp_file.name
+
+    def tearDown(self):
+        """
+        Remove the temporary file after tests
+        """
+        try:  # noqa: SIM105
+            os.remove(self.temp_file_path)
+        except OSError:
+            pass
+
+    def test_get_types_data_groups_requested_types(self):
+        """
+        Test that requested types are grouped in file order from one read
+        """
+        with patch(
+            "data_processing.get_type_data.extract_entries_from_csv",
+            wraps=extract_entries_from_csv,
+        ) as mock_extract:
+            results = get_types_data(self.temp_file_path, {"Job", "Internship"})
+        mock_extract.assert_called_once()
+        self.assertEqual(set(results), {"Job", "Internship"})
+        self.assertEqual(
+            [item["Title"] for item in results["Internship"]],
+            ["Pizza Intern", "Cloud Intern"],
+        )
+        self.assertEqual([item["Title"] for item in results["Job"]], ["Pizza Chef"])
+
+    def test_get_types_data_all_types(self):
+        """
+        Test that every type is returned when no types are requested
+        """
+        results = get_types_data(self.temp_file_path)
+        self.assertEqual(set(results), {"Job", "Internship", "Event"})
+
+    def test_get_types_data_missing_type_is_empty(self):
+        """
+        Test that a requested type with no rows maps to an empty list
+        """
+        results = get_types_data(self.temp_file_path, {"Event", "Webinar"})
+        self.assertEqual(results["Webinar"], [])
+        self.assertEqual(len(results["Event"]), 1)
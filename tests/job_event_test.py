@@ -5,11 +5,14 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
+from data_processing.date_index import DateIndex
 from data_processing.job_event import (  # noqa: E501
     filter_jobs,
     format_jobs_message,
     get_jobs,
+    search_jobs,
 )
+from data_processing.listing import Listing
 
 
 class TestJobEventFunctions(unittest.TestCase):
@@ -143,6 +146,72 @@ class TestJobEventFunctions(unittest.TestCase):
         for job in result:
             self.assertIn("Intern", job["Title"])
 
+    def test_search_jobs_returns_top_k_and_total(self):
+        """
+        Test that search_jobs keeps only the top k jobs but counts every match
+        """
+        result = search_jobs(self.sample_jobs, "intern", k=1)
+        self.assertEqual(result.total, 2)
+        self.assertEqual(len(result.listings), 1)
+        self.assertEqual(result.listings[0], filter_jobs(self.sample_jobs, "intern")[0])
+
+    def test_filter_jobs_references_listings(self):
+        """
+        Test that filtered jobs reference the original listings instead of copies
+        """
+        result = filter_jobs(self.sample_jobs, "intern")
+        for job in result:
+            self.assertTrue(any(job.listing is item for item in self.sample_jobs))
+
+    def test_search_jobs_skips_expired(self):
+        """
+        Test that jobs whose posting has expired are left out
+        """
+        cutoff = 1_750_000_000
+        jobs = [
+            {**job, "whenTimestamp": cutoff + (-1 if i % 2 else 1)}
+            for i, job in enumerate(self.sample_jobs)
+        ]
+        dates = DateIndex(jobs)
+        result = search_jobs(jobs, "intern", dates=dates, cutoff=cutoff)
+        self.assertCountEqual(
+            [job["Title"] for job in result.listings],
+            ["Pizza Quality Assurance Intern", "Cloud Whisperer Intern"],
+        )
+        self.assertEqual(result.total, 2)
+        # Without filters the date index is used, never a per-job check
+        with patch.object(dates, "is_past", side_effect=AssertionError):
+            result = search_jobs(jobs, "", k=5, dates=dates, cutoff=cutoff)
+        self.assertEqual(result.listings, [jobs[0], jobs[2], jobs[4]])
+        self.assertEqual(result.total, 3)
+
+    def test_search_jobs_no_filters(self):
+        """
+        Test that search_jobs without filters returns the first k jobs
+        """
+        result = search_jobs(self.sample_jobs, "", k=2)
+        self.assertEqual(result.listings, self.sample_jobs[:2])
+        self.assertEqual(result.total, 5)
+
+    def test_search_jobs_corrects_misspelled_terms(self):
+        """
+        Test that a misspelled query is searched for with its correction
+        """
+        result = search_jobs(self.sample_jobs, "whisprer")
+        self.assertEqual(result.corrected, "whisperer")
+        self.assertEqual(result.listings[0]["Title"], "Cloud Whisperer Intern")
+        self.assertIsNone(search_jobs(self.sample_jobs, "whisperer").corrected)
+
+    def test_format_jobs_message_did_you_mean(self):
+        """
+        Test that a corrected query is announced with "did you mean"
+        """
+        result = format_jobs_message(
+            [self.sample_jobs[4]], "whisprer", corrected="whisperer"
+        )
+        self.assertIn("Did you mean **whisperer**?", result)
+        self.assertIn("(Filters: whisperer)", result)
+
     def test_format_jobs_message_empty_list(self):
         """
         Test that given the input of no matching jobs,
@@ -165,6 +234,34 @@ class TestJobEventFunctions(unittest.TestCase):
         self.assertIn("Summer 2025", result)
         self.assertIn("http://cheesydreams.com/apply", result)
 
+    def test_format_jobs_message_location_tuple(self):
+        """
+        Test that a listing's parsed locations are rendered comma-separated
+        """
+        job = {**self.sample_jobs[0], "Location": ("Remote", "Syracuse, NY")}
+        result = format_jobs_message([job], "")
+        self.assertIn("📍 Remote, Syracuse, NY", result)
+
+    def test_format_jobs_message_uses_pub_timestamp(self):
+        """
+        Test that the posted date is rendered from the stored timestamp
+        """
+        job = {**self.sample_jobs[0], "pubTimestamp": 1738181624}
+        result = format_jobs_message([job], "")
+        self.assertIn("📅 Posted: Jan 29 2025", result)
+
+    def test_format_jobs_message_parses_missing_timestamp(self):
+        """
+        Test that rows and listings without a timestamp still format pubDate
+        """
+        pub_date = "Mon, 7 Oct 2024 11:27:15 +0000"
+        for job in (
+            Listing(Title="x", pubDate=pub_date),
+            {"Title": "x", "pubDate": pub_date},
+        ):
+            result = format_jobs_message([job], "")
+            self.assertIn("📅 Posted: Oct 07 2024", result)
+
     def test_format_jobs_message_multiple_jobs(self):
         """
         Test that given the input of multiple matching jobs,
@@ -206,6 +303,22 @@ class TestJobEventFunctions(unittest.TestCase):
         self.assertIn("💼 **Found 15 job(s):**", result)
         self.assertIn("... and 10 more jobs", result)
 
+    def test_format_jobs_message_uses_total(self):
+        """
+        Test that the reported count comes from the total, not the page size
+        """
+        result = format_jobs_message(self.sample_jobs, "", total=42)
+        self.assertIn("💼 **Found 42 job(s):**", result)
+        self.assertIn("... and 37 more jobs", result)
+
+    def test_format_jobs_message_page(self):
+        """
+        Test that a page of results shows its range instead of the remainder
+        """
+        result = format_jobs_message(self.sample_jobs, "", total=42, offset=5)
+        self.assertIn(f"Showing jobs 6-{5 + len(self.sample_jobs)} of 42.", result)
+        self.assertNotIn("more jobs", result)
+
 
 class TestGetJobs(unittest.TestCase):
     """
@@ -231,7 +344,7 @@ class TestGetJobs(unittest.TestCase):
         """
         Remove the temporary file after tests
         """
-        try: #noqa: SIM105
+        try:  # noqa: SIM105
             os.remove(self.temp_file_path)
         except OSError:
             pass
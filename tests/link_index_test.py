@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from data_collections.link_index import (
+    BloomFilter,
+    LinkIndex,
+    hash_link,
+    read_csv_links,
+)
+
+FAKE_CSV = """Type,Title,link
+Event,first,first_Link
+Event,second,second_Link
+Event,no link,
+Event,first again,first_Link
+"""
+
+
+class TestLinkIndex(unittest.TestCase):
+    """Testing suite for the LinkIndex class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "test.csv")
+        with open(self.path, "w", encoding="utf8") as file:
+            file.write(FAKE_CSV)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _append(self, text):
+        with open(self.path, "a", encoding="utf8") as file:
+            file.write(text)
+
+    def test_read_csv_links(self):
+        self.assertEqual(
+            read_csv_links(self.path), ["first_Link", "second_Link", "first_Link"]
+        )
+
+    def test_read_csv_links_from_offset(self):
+        offset = len(FAKE_CSV.encode("utf8"))
+        self._append('Event,"multi\nline",third_Link\n')
+        self.assertEqual(read_csv_links(self.path, offset), ["third_Link"])
+
+    def test_read_csv_links_missing_file(self):
+        with self.assertRaises(RuntimeError):
+            read_csv_links(os.path.join(self.temp_dir.name, "missing.csv"))
+
+    def test_builds_from_csv_when_missing(self):
+        with LinkIndex(self.path) as index:
+            self.assertIn("first_Link", index)
+            self.assertNotIn("other_Link", index)
+            self.assertEqual(len(index), 2)
+        self.assertTrue(os.path.isfile(index.path))
+
+    def test_added_links_persist_without_reading_csv(self):
+        with LinkIndex(self.path) as index:
+            self.assertEqual(len(index), 2)
+            self._append("Event,third,third_Link\n")
+            index.add_many(["third_Link"])
+        with (
+            patch("data_collections.link_index.read_csv_links") as mock_read,
+            LinkIndex(self.path) as reopened,
+        ):
+            self.assertIn("third_Link", reopened)
+            self.assertEqual(len(reopened), 3)
+        mock_read.assert_not_called()
+
+    def test_catches_up_after_crash(self):
+        with LinkIndex(self.path) as index:
+            self.assertEqual(len(index), 2)
+        # Rows appended but the index never updated
+        self._append("Event,third,third_Link\n")
+        with (
+            patch(
+                "data_collections.link_index.read_csv_links", wraps=read_csv_links
+            ) as mock_read,
+            LinkIndex(self.path) as reopened,
+        ):
+            self.assertIn("third_Link", reopened)
+        mock_read.assert_called_once_with(self.path, len(FAKE_CSV.encode("utf8")))
+
+    def test_rebuilds_after_rewrite(self):
+        with LinkIndex(self.path) as index:
+            self.assertEqual(len(index), 2)
+        with open(self.path, "w", encoding="utf8") as file:
+            file.write("Type,Title,link\nEvent,other,other_Link\n" + FAKE_CSV[16:])
+        with LinkIndex(self.path) as reopened:
+            self.assertIn("other_Link", reopened)
+            self.assertEqual(len(reopened), 3)
+
+    def test_rebuilds_corrupt_index(self):
+        with open(self.path + ".links.db", "wb") as file:
+            file.write(b"not a database" * 100)
+        with LinkIndex(self.path) as index:
+            self.assertIn("second_Link", index)
+
+    def test_without_bloom_filter(self):
+        with LinkIndex(self.path, use_bloom=False) as index:
+            self.assertIn("first_Link", index)
+            self.assertNotIn("other_Link", index)
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Testing suite for the BloomFilter class"""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(100)
+        keys = [hash_link(f"link_{i}") for i in range(100)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(hash_link(f"other_{i}") in bloom for i in range(1000))
+        self.assertLess(false_positives, 50)
+
+    def test_restores_saved_bits(self):
+        bloom = BloomFilter(10)
+        bloom.add(hash_link("a"))
+        self.assertIn(hash_link("a"), BloomFilter(10, bytes(bloom.bits)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""Unittests for listing_store.py"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from data_collections.sqlite_store import import_csv, insert_listings
+from data_processing.event_command import format_event_message
+from data_processing.job_event import format_jobs_message
+from data_processing.listing_store import ListingStore
+
+HEADER = "Type,subType,Company,Title,Description,whenDate,pubDate,Location,link,entryDate\n"  # noqa: E501
+JOB_ROW = "Job,,Test Co,Test Job,,07/31/2025,,['Remote'],http://test.com/job,2025-07-07\n"  # noqa: E501
+EVENT_ROW = "Event,workshop,,Git Workshop,Learn Git,Monday,,Room 101,http://test.com/event,2025-07-07\n"  # noqa: E501
+
+
+class TestListingStore(unittest.TestCase):
+    """
+    Tests for the ListingStore class
+    """
+
+    def setUp(self):
+        """
+        Create a temporary CSV file for testing
+        """
+        with tempfile.NamedTemporaryFile(
+            delete=False, mode="w", suffix=".csv", encoding="utf8"
+        ) as temp_file:
+            temp_file.write(HEADER + JOB_ROW + EVENT_ROW)
+            self.temp_file_path = temp_file.name
+        self.store = ListingStore(self.temp_file_path)
+
+    def tearDown(self):
+        """
+        Remove the temporary file after tests
+        """
+        try:  # noqa: SIM105
+            os.remove(self.temp_file_path)
+        except OSError:
+            pass
+
+    def _rewrite(self, content: str) -> None:
+        """
+        Rewrites the CSV file and bumps its mtime so the change is detected.
+        """
+        stat = os.stat(self.temp_file_path)
+        with open(self.temp_file_path, "w", encoding="utf8") as file:
+            file.write(content)
+        os.utime(
+            self.temp_file_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+
+    def test_snapshot_splits_events_and_jobs(self):
+        """
+        Test that the snapshot separates events from jobs
+        """
+        snapshot = self.store.snapshot()
+        self.assertEqual(snapshot.generation, 1)
+        self.assertEqual([job["Title"] for job in snapshot.jobs], ["Test Job"])
+        self.assertEqual([e["Title"] for e in snapshot.events], ["Git Workshop"])
+
+    def test_snapshot_prerenders_listings(self):
+        """
+        Test that listings are rendered once when the snapshot loads
+        """
+        snapshot = self.store.snapshot()
+        with patch(
+            "data_processing.job_event.render_job", side_effect=AssertionError
+        ), patch(
+            "data_processing.event_command.render_event", side_effect=AssertionError
+        ):
+            jobs_message = format_jobs_message(snapshot.jobs, "")
+            events_message = format_event_message(snapshot.events, "")
+        self.assertIn("**Test Job**", jobs_message)
+        self.assertIn("**Git Workshop**", events_message)
+
+    def test_current_does_not_load(self):
+        """
+        Test that the current snapshot is None until the first load
+        """
+        self.assertIsNone(self.store.current)
+        snapshot = self.store.snapshot()
+        self.assertIs(self.store.current, snapshot)
+
+    def test_snapshot_is_reused_when_file_unchanged(self):
+        """
+        Test that an unchanged file is not parsed again
+        """
+        first = self.store.snapshot()
+        with patch.object(self.store, "_build_snapshot") as mock_build:
+            second = self.store.snapshot()
+        mock_build.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_snapshot_reloads_when_file_changes(self):
+        """
+        Test that a modified file produces a new generation
+        """
+        first = self.store.snapshot()
+        self._rewrite(HEADER + JOB_ROW + JOB_ROW.replace("Test Job", "Other Job"))
+        second = self.store.snapshot()
+        self.assertEqual(second.generation, 2)
+        self.assertEqual(len(second.jobs), 2)
+        self.assertEqual(second.events, [])
+        # The old snapshot is left untouched for readers still holding it
+        self.assertEqual(len(first.jobs), 1)
+
+    def test_suggestions_follow_reloads(self):
+        """
+        Test that autocomplete suggestions are updated on reload
+        """
+        first = self.store.snapshot()
+        self.assertEqual(first.jobs_suggestions.suggest("company", "t"), ["Test Co"])
+        self._rewrite(HEADER + JOB_ROW.replace("Test Co", "Tide Inc") + EVENT_ROW)
+        second = self.store.snapshot()
+        self.assertEqual(second.jobs_suggestions.suggest("company", "t"), ["Tide Inc"])
+        self.assertIs(
+            second.events_suggestions.fields["title"],
+            first.events_suggestions.fields["title"],
+        )
+
+    def test_failed_reload_keeps_previous_snapshot(self):
+        """
+        Test that a failed reload keeps serving the last good snapshot
+        """
+        first = self.store.snapshot()
+        self._rewrite(HEADER)
+        with patch.object(
+            self.store, "_build_snapshot", side_effect=RuntimeError("boom")
+        ), patch("builtins.print"):
+            self.assertIs(self.store.snapshot(), first)
+
+    def test_sqlite_source(self):
+        """
+        Test that a SQLite database can be used instead of the CSV file
+        """
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        db_path = os.path.join(temp_dir.name, "listings.db")
+        import_csv(self.temp_file_path, db_path)
+        store = ListingStore(db_path)
+        first = store.snapshot()
+        self.assertEqual([job["Title"] for job in first.jobs], ["Test Job"])
+        self.assertEqual([e["Title"] for e in first.events], ["Git Workshop"])
+        self.assertIs(store.snapshot(), first)
+        insert_listings(db_path, [{"Type": "Job", "Title": "New", "link": "x"}])
+        self.assertEqual(len(store.snapshot().jobs), 2)
+
+    def test_missing_file_raises_without_snapshot(self):
+        """
+        Test that a missing file is reported when nothing is loaded yet
+        """
+        store = ListingStore("missing.csv")
+        with self.assertRaises(OSError):
+            store.snapshot()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Unittests for listing.py"""
+
+import unittest
+
+from data_processing.listing import FIELDS, Listing, ScoredListing, render_fragment
+from data_processing.memory_benchmark import measure
+
+
+class TestListing(unittest.TestCase):
+    """
+    Tests for the Listing record
+    """
+
+    def setUp(self):
+        self.listing = Listing(Type="Job", Title="Engineer", Company="Test Co")
+
+    def test_mapping_access(self):
+        """
+        Test that columns are readable like dictionary keys
+        """
+        self.assertEqual(self.listing["Title"], "Engineer")
+        self.assertEqual(self.listing.get("Company"), "Test Co")
+        self.assertEqual(self.listing.get("Location"), ())
+        self.assertEqual(self.listing.get("unknown", "default"), "default")
+        with self.assertRaises(KeyError):
+            self.listing["unknown"]  # noqa: B018
+
+    def test_immutable(self):
+        """
+        Test that a listing cannot be modified
+        """
+        with self.assertRaises(AttributeError):
+            self.listing.Title = "Other"
+        with self.assertRaises(AttributeError):
+            self.listing.extra = "value"
+
+    def test_unknown_field_rejected(self):
+        """
+        Test that unknown columns are rejected
+        """
+        with self.assertRaises(TypeError):
+            Listing(Title="Engineer", Salary="100")
+
+    def test_from_entry_ignores_extra_keys(self):
+        """
+        Test that extra keys in a row are ignored
+        """
+        listing = Listing.from_entry({"Title": "Engineer", "id": 7})
+        self.assertEqual(listing.to_dict()["Title"], "Engineer")
+        self.assertEqual(list(listing.to_dict()), list(FIELDS))
+
+    def test_location_parsed_into_tuple(self):
+        """
+        Test that stored and legacy locations are parsed into tuples
+        """
+        stored = Listing.from_entry({"Location": "Remote; Syracuse, NY"})
+        legacy = Listing.from_entry({"Location": "['Remote', 'Syracuse, NY']"})
+        self.assertEqual(stored.Location, ("Remote", "Syracuse, NY"))
+        self.assertEqual(legacy.Location, stored.Location)
+        self.assertIs(stored.Location[1], legacy.Location[1])
+
+    def test_from_entry_timestamps(self):
+        """
+        Test that stored timestamps are converted and missing ones computed
+        """
+        stored = Listing.from_entry(
+            {"pubTimestamp": "5", "whenTimestamp": "", "entryTimestamp": "7"}
+        )
+        self.assertEqual((stored.pubTimestamp, stored.whenTimestamp), (5, None))
+        computed = Listing.from_entry({"pubDate": "2023-09-30"})
+        self.assertEqual(computed.pubTimestamp, 1696032000)
+
+    def test_missing_timestamps_are_none(self):
+        """
+        Test that listings built directly have no timestamps, not empty strings
+        """
+        self.assertIsNone(self.listing.pubTimestamp)
+        self.assertIsNone(self.listing.whenTimestamp)
+        self.assertEqual(self.listing.pubDate, "")
+
+    def test_equality(self):
+        """
+        Test that listings with the same values are equal
+        """
+        same = Listing(Type="Job", Title="Engineer", Company="Test Co")
+        self.assertEqual(self.listing, same)
+        self.assertEqual(hash(self.listing), hash(same))
+        self.assertNotEqual(self.listing, Listing(Type="Job"))
+
+    def test_categorical_values_interned(self):
+        """
+        Test that repeated categorical values share one string object
+        """
+        company = "".join(["Test ", "Co"])
+        other = Listing(Company=company, Title="".join(["Engi", "neer"]))
+        self.assertIs(other.Company, self.listing.Company)
+        self.assertIsNot(other.Title, self.listing.Title)
+
+    def test_no_instance_dict(self):
+        """
+        Test that listings do not carry a per-instance dictionary
+        """
+        self.assertFalse(hasattr(self.listing, "__dict__"))
+
+    def test_fragment_rendered_once(self):
+        """
+        Test that a rendering is cached per kind and ignored by equality
+        """
+        calls = []
+
+        def render(listing):
+            calls.append(listing)
+            return f"**{listing['Title']}**"
+
+        self.assertEqual(self.listing.fragment("job", render), "**Engineer**")
+        self.assertEqual(self.listing.fragment("job", render), "**Engineer**")
+        self.assertEqual(len(calls), 1)
+        self.listing.fragment("event", render)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            self.listing, Listing(Type="Job", Title="Engineer", Company="Test Co")
+        )
+
+    def test_render_fragment(self):
+        """
+        Test that scored listings reuse their listing's text and rows do not
+        """
+        self.listing.fragment("job", lambda listing: "cached")
+        scored = ScoredListing(self.listing, 1.0)
+        self.assertEqual(render_fragment(scored, "job", lambda item: "new"), "cached")
+        self.assertEqual(
+            render_fragment({"Title": "Row"}, "job", lambda item: item["Title"]), "Row"
+        )
+
+
+class TestScoredListing(unittest.TestCase):
+    """
+    Tests for the ScoredListing reference
+    """
+
+    def test_reads_through_to_listing(self):
+        """
+        Test that fields come from the listing and the score from the reference
+        """
+        listing = Listing(Title="Engineer")
+        scored = ScoredListing(listing, 2.5)
+        self.assertIs(scored.listing, listing)
+        self.assertEqual(scored["Title"], "Engineer")
+        self.assertEqual(scored["confidence"], 2.5)
+        self.assertEqual(scored.get("confidence"), 2.5)
+        self.assertEqual(dict(scored)["confidence"], 2.5)
+        self.assertEqual({**scored}["Title"], "Engineer")
+
+    def test_equal_references_hash_equal(self):
+        """
+        Test that references to equal listings with the same score are equal
+        and hash the same
+        """
+        first = ScoredListing(Listing(Title="Engineer"), 1.0)
+        second = ScoredListing(Listing(Title="Engineer"), 1.0)
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    """
+    Tests for the listing memory benchmark
+    """
+
+    def test_listing_smaller_than_dict(self):
+        """
+        Test that listings and scored references use less memory than dicts
+        """
+        entries = [
+            {"Type": "Job", "Title": f"Job {i}", "link": f"http://test.com/{i}"}
+            for i in range(200)
+        ]
+        results = measure(entries)
+        self.assertLess(results["Listing"], results["dict"])
+        self.assertLess(results["ScoredListing result"], results["dict result"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Unittests for location_index.py"""
+
+import unittest
+
+from data_processing.location_index import LocationIndex, normalize_city
+
+
+class TestLocationIndex(unittest.TestCase):
+    """
+    Tests for the LocationIndex class
+    """
+
+    def setUp(self):
+        self.listings = [
+            {"Title": "Software Intern", "Location": "Remote; Syracuse, NY"},
+            {"Title": "Data Analyst", "Location": "San Francisco, CA"},
+            {"Title": "Designer", "Location": "['Hybrid', 'New York, NY']"},
+            {"Title": "Engineer", "Location": "Toronto, ON"},
+            {"Title": "Manager", "Location": ""},
+        ]
+        self.index = LocationIndex(self.listings)
+
+    def test_normalize_city(self):
+        """
+        Test that city names are lower-cased with single spaces
+        """
+        self.assertEqual(normalize_city("  San   Francisco "), "san francisco")
+
+    def test_postings(self):
+        """
+        Test that states, cities and flags map to the listings at them
+        """
+        self.assertEqual(self.index.states, {"NY": {0, 2}, "CA": {1}})
+        self.assertEqual(self.index.cities["syracuse"], {0})
+        self.assertEqual(self.index.cities["new york"], {2})
+        self.assertEqual(self.index.flags, {"remote": {0}, "hybrid": {2}})
+
+    def test_unknown_state_is_not_indexed(self):
+        """
+        Test that locations outside VALID_STATES are left out
+        """
+        self.assertNotIn("ON", self.index.states)
+        self.assertNotIn("toronto", self.index.cities)
+
+    def test_lookup(self):
+        """
+        Test that state codes, cities and flags are looked up
+        """
+        self.assertEqual(self.index.lookup("NY"), ("state:NY", {0, 2}))
+        self.assertEqual(self.index.lookup("Syracuse"), ("city:syracuse", {0}))
+        self.assertEqual(self.index.lookup("REMOTE"), ("flag:remote", {0}))
+        self.assertEqual(self.index.lookup("TX"), ("state:TX", set()))
+        self.assertIsNone(self.index.lookup("python"))
+
+    def test_lookup_requires_capitals(self):
+        """
+        Test that lower-case words are not read as states or cities
+        """
+        self.assertIsNone(self.index.lookup("ny"))
+        self.assertIsNone(self.index.lookup("in"))
+        self.assertIsNone(self.index.lookup("syracuse"))
+
+    def test_resolve(self):
+        """
+        Test that location terms are split from the rest of the query
+        """
+        matches, remaining = self.index.resolve(["python", "NY", "remote"])
+        self.assertEqual(matches, [("state:NY", {0, 2}), ("flag:remote", {0})])
+        self.assertEqual(remaining, ["python"])
+
+    def test_resolve_multi_word_city(self):
+        """
+        Test that multi-word cities are matched as one criterion
+        """
+        matches, remaining = self.index.resolve(["intern", "San", "Francisco"])
+        self.assertEqual(matches, [("city:san francisco", {1})])
+        self.assertEqual(remaining, ["intern"])
+        matches, remaining = self.index.resolve(["New", "York"])
+        self.assertEqual(matches, [("city:new york", {2})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Unittests for locations.py"""
+
+import unittest
+
+from data_collections.locations import join_locations, parse_locations
+
+
+class TestLocations(unittest.TestCase):
+    """Testing suite for the Location column encoding"""
+
+    def test_join_locations(self):
+        self.assertEqual(
+            join_locations(["Remote", "Syracuse, NY"]), "Remote; Syracuse, NY"
+        )
+        self.assertEqual(join_locations([]), "")
+        self.assertEqual(join_locations(None), "")
+
+    def test_join_locations_rewrites_legacy_form(self):
+        self.assertEqual(
+            join_locations("['Remote', 'Syracuse, NY']"), "Remote; Syracuse, NY"
+        )
+        self.assertEqual(join_locations("Room 101"), "Room 101")
+
+    def test_parse_locations(self):
+        self.assertEqual(
+            parse_locations("Remote; Syracuse, NY"), ("Remote", "Syracuse, NY")
+        )
+        self.assertEqual(
+            parse_locations("Hinds Hall, Room 101"), ("Hinds Hall, Room 101",)
+        )
+        self.assertEqual(parse_locations(""), ())
+        self.assertEqual(parse_locations(["Remote"]), ("Remote",))
+
+    def test_parse_legacy_locations(self):
+        self.assertEqual(
+            parse_locations("['Remote', 'Syracuse, NY']"), ("Remote", "Syracuse, NY")
+        )
+        self.assertEqual(parse_locations("['Unknown']"), ("Unknown",))
+        self.assertEqual(parse_locations("[Zoom]"), ("[Zoom]",))
+
+    def test_round_trip(self):
+        locations = ("Hybrid", "Boston, MA")
+        self.assertEqual(parse_locations(join_locations(locations)), locations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Unittests for query.py"""
+
+import unittest
+
+from data_processing.query import QueryPlan, parse_query
+
+
+class TestParseQuery(unittest.TestCase):
+    """
+    Tests for the parse_query function
+    """
+
+    def test_free_terms(self):
+        """
+        Test that unqualified terms are kept in order
+        """
+        self.assertEqual(
+            parse_query("software  engineer"), QueryPlan(("software", "engineer"), ())
+        )
+
+    def test_qualifiers(self):
+        """
+        Test that qualifiers are split from the free terms
+        """
+        plan = parse_query("company:google location:remote type:internship python")
+        self.assertEqual(plan.terms, ("python",))
+        self.assertEqual(
+            plan.qualifiers,
+            (("company", "google"), ("location", "remote"), ("type", "internship")),
+        )
+
+    def test_qualifier_names_ignore_case(self):
+        """
+        Test that qualifier names are lower-cased but values are kept
+        """
+        self.assertEqual(parse_query("Location:NY").qualifiers, (("location", "NY"),))
+
+    def test_quoted_value(self):
+        """
+        Test that a quoted value may contain spaces
+        """
+        plan = parse_query('company:"Sky  High" analyst')
+        self.assertEqual(plan.qualifiers, (("company", "Sky High"),))
+        self.assertEqual(plan.terms, ("analyst",))
+
+    def test_unknown_or_empty_qualifiers_are_terms(self):
+        """
+        Test that unknown names and empty values stay free terms
+        """
+        plan = parse_query("https://example.com company: c++:")
+        self.assertEqual(plan.terms, ("https://example.com", "company:", "c++:"))
+        self.assertEqual(plan.qualifiers, ())
+
+    def test_negation(self):
+        """
+        Test that negated terms and qualifiers are excluded, not ranked
+        """
+        plan = parse_query("python -senior -company:acme")
+        self.assertEqual(plan.terms, ("python",))
+        self.assertEqual(
+            plan.excluded, (("term", "senior"), ("qualifier", "company", "acme"))
+        )
+        self.assertIsNone(plan.expression)
+
+    def test_hyphenated_terms_are_not_negated(self):
+        """
+        Test that only a leading hyphen negates a term
+        """
+        plan = parse_query("full-time -")
+        self.assertEqual(plan.terms, ("full-time", "-"))
+        self.assertEqual(plan.excluded, ())
+
+    def test_boolean_expression(self):
+        """
+        Test that OR and parentheses build an expression joined by AND
+        """
+        plan = parse_query("(java OR kotlin) intern -senior")
+        self.assertEqual(
+            plan.expression,
+            (
+                "and",
+                (
+                    ("or", (("term", "java"), ("term", "kotlin"))),
+                    ("term", "intern"),
+                    ("not", ("term", "senior")),
+                ),
+            ),
+        )
+        self.assertEqual(plan.terms, ("java", "kotlin", "intern"))
+        self.assertEqual(plan.qualifiers, ())
+
+    def test_or_binds_looser_than_and(self):
+        """
+        Test that terms side by side group before OR
+        """
+        self.assertEqual(
+            parse_query("a b OR c").expression,
+            ("or", (("and", (("term", "a"), ("term", "b"))), ("term", "c"))),
+        )
+
+    def test_unbalanced_parentheses(self):
+        """
+        Test that a missing or extra parenthesis does not fail the query
+        """
+        self.assertEqual(
+            parse_query("(java OR kotlin").expression,
+            ("or", (("term", "java"), ("term", "kotlin"))),
+        )
+        self.assertEqual(parse_query("python )").expression, ("term", "python"))
+
+    def test_or_without_operand_is_a_term(self):
+        """
+        Test that OR at the start or end of a query is a plain term
+        """
+        plan = parse_query("jobs in OR")
+        self.assertEqual(plan.terms, ("jobs", "in", "or"))
+        self.assertIsNone(plan.expression)
+
+    def test_negated_group(self):
+        """
+        Test that a minus sign before a group excludes the whole group
+        """
+        self.assertEqual(
+            parse_query("intern -(senior OR lead)").expression,
+            (
+                "and",
+                (
+                    ("term", "intern"),
+                    ("not", ("or", (("term", "senior"), ("term", "lead")))),
+                ),
+            ),
+        )
+
+    def test_plans_are_cached(self):
+        """
+        Test that parsing the same query twice returns the cached plan
+        """
+        self.assertIs(parse_query("type:job python"), parse_query("type:job python"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,274 @@
+"""Unittests for ranking.py"""
+
+import unittest
+
+from data_processing.ranking import (
+    correct_query,
+    rank,
+    rank_with_correction,
+    score_terms,
+)
+from data_processing.search_index import SearchIndex, normalize_query
+
+
+class TestRanking(unittest.TestCase):
+    """
+    Tests for BM25F scoring and ranking
+    """
+
+    def setUp(self):
+        self.listings = [
+            {
+                "Title": "Data Analyst",
+                "Description": "Python scripting for our marketing team",
+            },
+            {
+                "Title": "Python Developer",
+                "Description": "Build services for our customers",
+            },
+            {
+                "Title": "Python Developer Intern",
+                "Company": "Python Software Foundation",
+                "Description": "Help maintain Python",
+            },
+            {
+                "Title": "Office Manager",
+                "Description": "Keep the office running",
+            },
+        ]
+        self.index = SearchIndex(self.listings)
+
+    def test_only_matching_listings_are_scored(self):
+        """
+        Test that listings without any matching term are not scored
+        """
+        scores = score_terms(self.index, ["python"])
+        self.assertEqual(set(scores), {0, 1, 2})
+        self.assertEqual(score_terms(self.index, ["nothing"]), {})
+
+    def test_title_match_outranks_description_match(self):
+        """
+        Test that field weights favor a Title match over a Description match
+        """
+        scores = score_terms(self.index, ["python"])
+        self.assertGreater(scores[1], scores[0])
+
+    def test_more_matches_rank_higher(self):
+        """
+        Test that a listing matching the term in several fields ranks first
+        """
+        results, total = rank(self.index, "python")
+        self.assertEqual([listing_id for listing_id, _ in results], [2, 1, 0])
+        self.assertEqual(total, 3)
+
+    def test_rare_terms_weigh_more(self):
+        """
+        Test that a rare term contributes more than a common one
+        """
+        scores = score_terms(self.index, ["developer", "intern"])
+        results, _ = rank(self.index, "developer intern")
+        self.assertEqual(results[0][0], 2)
+        self.assertGreater(scores[2], scores[1])
+
+    def test_equal_scores_keep_listing_order(self):
+        """
+        Test that ties are broken by original listing order
+        """
+        index = SearchIndex([{"Title": "Intern"}, {"Title": "Intern"}])
+        results, _ = rank(index, "intern")
+        self.assertEqual([listing_id for listing_id, _ in results], [0, 1])
+
+    def test_top_k_matches_full_ranking(self):
+        """
+        Test that top-k selection returns the head of the full ranking and
+            still reports the total number of matches
+        """
+        full, total = rank(self.index, "python developer office")
+        top, top_total = rank(self.index, "python developer office", k=2)
+        self.assertEqual(top, full[:2])
+        self.assertEqual(top_total, total)
+        self.assertEqual(total, 4)
+
+
+class TestLocationRanking(unittest.TestCase):
+    """
+    Tests for location criteria in ranked searches
+    """
+
+    def setUp(self):
+        self.listings = [
+            {"Title": "Python Developer", "Location": "Syracuse, NY"},
+            {
+                "Title": "Python Engineer",
+                "Description": "Join a company in Denver",
+                "Location": "Denver, CO",
+            },
+            {"Title": "Data Analyst", "Location": "Remote; Albany, NY"},
+            {"Title": "Python Intern", "Location": "Remote"},
+        ]
+        self.index = SearchIndex(self.listings)
+
+    def test_state_code_matches_location_only(self):
+        """
+        Test that a state code selects listings in that state instead of
+            matching "ny" inside other words
+        """
+        results, total = rank(self.index, "python NY")
+        self.assertEqual([listing_id for listing_id, _ in results], [0])
+        self.assertEqual(total, 1)
+
+    def test_more_locations_rank_higher(self):
+        """
+        Test that a listing in every named location ranks first
+        """
+        results, total = rank(self.index, "NY remote")
+        self.assertEqual(results[0][0], 2)
+        self.assertEqual(total, 3)
+
+    def test_location_only_query(self):
+        """
+        Test that a query of only locations returns every listing there
+        """
+        results, total = rank(self.index, "remote")
+        self.assertCountEqual([listing_id for listing_id, _ in results], [2, 3])
+        self.assertEqual(total, 2)
+
+    def test_city_query(self):
+        """
+        Test that a capitalized city selects listings in that city
+        """
+        results, _ = rank(self.index, "python Denver")
+        self.assertEqual([listing_id for listing_id, _ in results], [1])
+
+
+class TestQualifiedRanking(unittest.TestCase):
+    """
+    Tests for field qualifiers in ranked searches
+    """
+
+    def setUp(self):
+        self.listings = [
+            {"Title": "Google Analyst", "Company": "Acme", "Type": "Job"},
+            {"Title": "Python Intern", "Company": "Google", "Type": "Internship"},
+            {"Title": "Python Developer", "Company": "Google", "Type": "Job"},
+            {"Title": "Java Intern", "Company": "Google LLC", "Type": "Internship"},
+        ]
+        self.index = SearchIndex(self.listings)
+
+    def test_qualifier_filters_ranked_terms(self):
+        """
+        Test that qualifiers restrict the listings matching the free terms
+        """
+        results, total = rank(self.index, "python type:internship")
+        self.assertEqual([listing_id for listing_id, _ in results], [1])
+        self.assertEqual(total, 1)
+
+    def test_qualifier_only_matches_its_field(self):
+        """
+        Test that a company qualifier ignores the value in other fields
+        """
+        results, _ = rank(self.index, "company:google")
+        self.assertEqual([listing_id for listing_id, _ in results], [1, 2, 3])
+
+    def test_qualifiers_combine(self):
+        """
+        Test that every qualifier must match
+        """
+        results, _ = rank(self.index, "company:google type:internship")
+        self.assertEqual([listing_id for listing_id, _ in results], [1, 3])
+        self.assertEqual(rank(self.index, "company:nobody python"), ([], 0))
+
+
+class TestBooleanRanking(unittest.TestCase):
+    """
+    Tests for negation and boolean operators in ranked searches
+    """
+
+    def setUp(self):
+        self.listings = [
+            {"Title": "Java Intern", "Company": "Acme"},
+            {"Title": "Kotlin Intern", "Company": "Google"},
+            {"Title": "Senior Java Developer", "Company": "Acme"},
+            {"Title": "Python Intern", "Company": "Acme"},
+        ]
+        self.index = SearchIndex(self.listings)
+
+    def _ids(self, _filters):
+        results, _ = rank(self.index, _filters)
+        return [listing_id for listing_id, _ in results]
+
+    def test_negated_term_is_excluded(self):
+        """
+        Test that listings matching a negated term are dropped
+        """
+        self.assertCountEqual(self._ids("java -senior"), [0])
+        self.assertCountEqual(self._ids("intern -company:acme"), [1])
+
+    def test_negation_only_query(self):
+        """
+        Test that a query of only exclusions returns everything else
+        """
+        self.assertEqual(self._ids("-intern"), [2])
+
+    def test_or_with_implicit_and(self):
+        """
+        Test that (java OR kotlin) intern requires intern and either term
+        """
+        self.assertCountEqual(self._ids("(java OR kotlin) intern"), [0, 1])
+        self.assertCountEqual(self._ids("java OR python"), [0, 2, 3])
+
+    def test_boolean_with_qualifier_and_negation(self):
+        """
+        Test that qualifiers and negations combine inside expressions
+        """
+        self.assertEqual(self._ids("(java OR kotlin) company:acme -senior"), [0])
+
+    def test_negated_group_is_excluded(self):
+        """
+        Test that -( ... ) drops the listings matching the group
+        """
+        self.assertEqual(self._ids("intern -(java OR kotlin)"), [3])
+
+    def test_trailing_or_is_not_oregon(self):
+        """
+        Test that OR at the end of a query is not read as a state
+        """
+        listings = [
+            {"Title": "Python Developer", "Location": "Portland, OR"},
+            {"Title": "Python Intern", "Location": "Austin, TX"},
+        ]
+        index = SearchIndex(listings)
+        results, total = rank(index, "python OR")
+        self.assertEqual(total, 2)
+        self.assertNotIn("state:OR", normalize_query("python OR", index.locations))
+
+    def test_correct_query_keeps_operators(self):
+        """
+        Test that only misspelled free terms are rewritten
+        """
+        self.assertEqual(
+            correct_query(self.index, "(jaav OR kotlin) company:acme -intern"),
+            "(java OR kotlin) company:acme -intern",
+        )
+        self.assertIsNone(correct_query(self.index, "java intern"))
+
+    def test_rank_with_correction(self):
+        """
+        Test that the corrected query is only used when nothing matches
+        """
+        results, total, corrected = rank_with_correction(self.index, "kotlni")
+        self.assertEqual(
+            ([r[0] for r in results], total, corrected), ([1], 1, "kotlin")
+        )
+        self.assertIsNone(rank_with_correction(self.index, "kotlin")[2])
+        self.assertEqual(rank_with_correction(self.index, "zzzzzz"), ([], 0, None))
+
+    def test_plain_terms_still_match_any(self):
+        """
+        Test that queries without operators keep matching any term
+        """
+        self.assertCountEqual(self._ids("kotlin python"), [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,4 +100,7 @@ class TestGetJobs(unittest.TestCase):
         self.assertEqual(result[0]["pubDate"], "Wed, 29 Jan 2025 20:13:44 +0000")
         self.assertIn("Boston, MA", result[0]["Location"])
         self.assertIn("Remote", result[0]["Location"])
+        self.assertNotIn("[", result[0]["Location"])
         self.assertEqual(result[0]["link"], "http://example.com/event1")
+        self.assertEqual(result[0]["pubTimestamp"], 1738181624)
+        self.assertEqual(result[0]["whenTimestamp"], 1754006400)
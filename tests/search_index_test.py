@@ -0,0 +1,161 @@
+"""Unittests for search_index.py"""
+
+import unittest
+
+from data_processing.search_index import SearchIndex, normalize_query, tokenize
+
+
+class TestSearchIndex(unittest.TestCase):
+    """
+    Tests for the SearchIndex class
+    """
+
+    def setUp(self):
+        self.listings = [
+            {
+                "Title": "Software Engineering Intern",
+                "Company": "Whiskers & Co",
+                "Location": "['Remote']",
+            },
+            {
+                "Title": "Senior Software Engineer",
+                "Company": "Sky High Analytics",
+                "Location": "['Denver, CO']",
+            },
+            {
+                "Title": "Data Analyst",
+                "Company": "Pop Culture Studios",
+                "Description": None,
+            },
+        ]
+        self.index = SearchIndex(self.listings)
+
+    def test_tokenize(self):
+        """
+        Test that values are lower-cased and split on whitespace
+        """
+        self.assertEqual(tokenize("Denver, CO"), ["denver,", "co"])
+        self.assertEqual(tokenize(None), [])
+
+    def test_normalize_query(self):
+        """
+        Test that case, spacing and term order do not change the query
+        """
+        self.assertEqual(
+            normalize_query("  Software   INTERNSHIP "), "internship software"
+        )
+
+    def test_normalize_query_keeps_location_case(self):
+        """
+        Test that location terms stay distinct from the same lower-case words
+        """
+        locations = self.index.locations
+        self.assertEqual(
+            normalize_query("intern  Remote", locations),
+            normalize_query("remote intern", locations),
+        )
+        self.assertNotEqual(
+            normalize_query("engineer CO", locations),
+            normalize_query("engineer co", locations),
+        )
+
+    def test_normalize_query_keeps_qualifiers(self):
+        """
+        Test that qualifiers stay distinct from the same free terms
+        """
+        self.assertEqual(
+            normalize_query("python Company:Google"),
+            normalize_query("company:google  python"),
+        )
+        self.assertNotEqual(
+            normalize_query("company:google"), normalize_query("google")
+        )
+
+    def test_qualifier_ids(self):
+        """
+        Test that a qualifier only matches the value in its own fields
+        """
+        self.assertEqual(self.index.qualifier_ids("company", "sky high"), {1})
+        self.assertEqual(self.index.qualifier_ids("company", "analyst"), set())
+        self.assertEqual(self.index.qualifier_ids("location", "co"), {1})
+        self.assertEqual(self.index.qualifier_ids("location", "remote"), {0})
+        self.assertEqual(self.index.qualifier_ids("location", "denver"), {1})
+
+    def test_bitmap(self):
+        """
+        Test that expressions evaluate to bitmaps of the matching listings
+        """
+        self.assertEqual(self.index.bitmap(("term", "software")), 0b011)
+        self.assertEqual(self.index.bitmap(("not", ("term", "software"))), 0b100)
+        self.assertEqual(
+            self.index.bitmap(
+                ("and", (("term", "software"), ("qualifier", "location", "remote")))
+            ),
+            0b001,
+        )
+        self.assertEqual(
+            self.index.bitmap(("or", (("term", "intern"), ("term", "analyst")))),
+            0b101,
+        )
+
+    def test_normalize_query_keeps_operators(self):
+        """
+        Test that exclusions and boolean expressions change the query
+        """
+        self.assertNotEqual(normalize_query("a -b"), normalize_query("a b"))
+        self.assertNotEqual(
+            normalize_query("(a OR b) c"), normalize_query("a OR (b c)")
+        )
+
+    def test_lookup_matches_substrings_of_tokens(self):
+        """
+        Test that a term matches any token containing it
+        """
+        self.assertEqual(self.index.lookup("intern"), {0})
+        self.assertEqual(self.index.lookup("engineer"), {0, 1})
+        self.assertEqual(self.index.lookup("CO"), {0, 1})
+        self.assertEqual(self.index.lookup("remote"), {0})
+        self.assertEqual(self.index.lookup("nothing"), set())
+
+    def test_expand_returns_tokens_containing_term(self):
+        """
+        Test that a term expands to every vocabulary token containing it
+        """
+        self.assertEqual(
+            set(self.index.expand("engineer")), {"engineering", "engineer"}
+        )
+
+    def test_field_statistics(self):
+        """
+        Test that per-field term frequencies and lengths are recorded
+        """
+        self.assertEqual(self.index.field_postings["Title"]["software"], {0: 1, 1: 1})
+        self.assertEqual(self.index.field_lengths["Title"], [3, 3, 2])
+        self.assertAlmostEqual(self.index.avg_field_lengths["Title"], 8 / 3)
+        # Fields that are empty everywhere still normalize safely
+        self.assertEqual(self.index.avg_field_lengths["subType"], 1.0)
+
+    def test_category_codes(self):
+        """
+        Test that categorical values are encoded as integer codes
+        """
+        self.assertEqual(len(self.index.category_codes["Company"]), 3)
+        code = self.index.category_code("Company", " whiskers & co ")
+        self.assertEqual(self.index.category_values["Company"][code], "whiskers & co")
+        self.assertIsNone(self.index.category_code("Company", "Whiskers"))
+
+    def test_category_postings(self):
+        """
+        Test that each category code maps to the listings holding it
+        """
+        code = self.index.category_code("Location", "")
+        self.assertEqual(self.index.category_postings["Location"][code], {2})
+        self.assertEqual(
+            sorted(map(len, self.index.category_postings["Company"].values())),
+            [1, 1, 1],
+        )
+        self.assertEqual(self.index.qualifier_ids("company", "s"), {0, 1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unittests for single_flight.py"""
+
+import asyncio
+import unittest
+
+from data_processing.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for coalescing concurrent requests
+    """
+
+    async def asyncSetUp(self):
+        self.flight = SingleFlight()
+        self.release = asyncio.Event()
+        self.started = 0
+
+    async def _compute(self, value):
+        self.started += 1
+        await self.release.wait()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    async def test_concurrent_callers_share_result(self):
+        """
+        Test that callers of the same key await one computation
+        """
+        tasks = [
+            asyncio.create_task(self.flight.run("key", lambda: self._compute([1])))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.flight), 1)
+        self.release.set()
+        results = await asyncio.gather(*tasks)
+        self.assertEqual(self.started, 1)
+        self.assertIs(results[0], results[2])
+        self.assertEqual(
+            self.flight.stats(), {"in_flight": 0, "calls": 1, "coalesced": 2}
+        )
+
+    async def test_finished_computation_is_not_reused(self):
+        """
+        Test that a request after completion starts a new computation
+        """
+        self.release.set()
+        await self.flight.run("key", lambda: self._compute(1))
+        await self.flight.run("key", lambda: self._compute(2))
+        self.assertEqual(self.started, 2)
+        self.assertEqual(self.flight.coalesced, 0)
+
+    async def test_errors_reach_every_caller(self):
+        """
+        Test that a failed computation raises in each waiting caller
+        """
+        tasks = [
+            asyncio.create_task(
+                self.flight.run("key", lambda: self._compute(OSError("boom")))
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, OSError) for result in results))
+        self.assertEqual(self.started, 1)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """
+        Test that the shared computation outlives a cancelled caller
+        """
+        first = asyncio.create_task(self.flight.run("key", lambda: self._compute(5)))
+        second = asyncio.create_task(self.flight.run("key", lambda: self._compute(5)))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await second, 5)
+        self.assertTrue(first.cancelled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unittests for spelling.py"""
+
+import unittest
+
+from data_processing.spelling import (
+    SpellingDictionary,
+    deletes,
+    edit_distance,
+    words,
+)
+
+
+class TestSpelling(unittest.TestCase):
+    """
+    Tests for the symmetric delete spelling dictionary
+    """
+
+    def setUp(self):
+        self.dictionary = SpellingDictionary(
+            {"internship": 12, "software": 30, "hardware": 2, "intern": 40}
+        )
+
+    def test_words(self):
+        """
+        Test that punctuation is dropped from tokens
+        """
+        self.assertEqual(words("(cpuc)-energy,"), ["cpuc", "energy"])
+        self.assertEqual(words("c++"), ["c++"])
+
+    def test_edit_distance(self):
+        """
+        Test insertions, deletions, substitutions and transpositions
+        """
+        self.assertEqual(edit_distance("sofware", "software", 2), 1)
+        self.assertEqual(edit_distance("pyhton", "python", 2), 1)
+        self.assertEqual(edit_distance("hardwear", "hardware", 2), 2)
+        self.assertEqual(edit_distance("kitten", "sitting", 2), 3)
+
+    def test_deletes(self):
+        """
+        Test that deletes include the word and every shorter variant
+        """
+        self.assertEqual(deletes("abc", 1), {"abc", "bc", "ac", "ab"})
+        self.assertEqual(len(deletes("abcd", 2)), 1 + 4 + 6)
+
+    def test_correct(self):
+        """
+        Test that misspelled terms are corrected to the closest word
+        """
+        self.assertEqual(self.dictionary.correct("internshp"), "internship")
+        self.assertEqual(self.dictionary.correct("sofware"), "software")
+
+    def test_correct_prefers_frequent_words(self):
+        """
+        Test that ties in distance go to the more frequent word
+        """
+        self.assertEqual(self.dictionary.correct("xoftware"), "software")
+        self.assertEqual(self.dictionary.correct("hardwear"), "hardware")
+
+    def test_no_correction(self):
+        """
+        Test that known, short and distant terms are not corrected
+        """
+        self.assertIsNone(self.dictionary.correct("software"))
+        self.assertIsNone(self.dictionary.correct("sfw"))
+        self.assertIsNone(self.dictionary.correct("database"))
+
+
+if __name__ == "__main__":
+    unittest.main()
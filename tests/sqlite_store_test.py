@@ -0,0 +1,123 @@
+"""Unittests for sqlite_store.py"""
+
+import csv
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from data_collections.sqlite_store import (
+    COLUMNS,
+    connect,
+    export_csv,
+    fetch_types_data,
+    import_csv,
+    insert_listings,
+    search_listings,
+)
+
+SAMPLE = [
+    {
+        "Type": "Internship",
+        "Company": "Cheesy Dreams Inc",
+        "Title": "Pizza Software Intern",
+        "Location": ["Remote"],
+        "link": "http://cheesydreams.com/apply",
+    },
+    {
+        "Type": "Job",
+        "Company": "Sky High Analytics",
+        "Title": "Cloud Engineer",
+        "Description": "Build pizza ordering software",
+        "link": "http://skyhigh.com/job",
+    },
+    {
+        "Type": "Event",
+        "subType": "workshop",
+        "Title": "Git Workshop",
+        "link": "http://club.com/git",
+    },
+]
+
+
+class TestSqliteStore(unittest.TestCase):
+    """Testing suite for the SQLite listings backend"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "listings.db")
+        self.csv_path = os.path.join(self.temp_dir.name, "listings.csv")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_connect_uses_wal(self):
+        conn = connect(self.db_path)
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(mode, "wal")
+
+    def test_insert_skips_duplicate_links(self):
+        self.assertEqual(insert_listings(self.db_path, SAMPLE), 3)
+        self.assertEqual(insert_listings(self.db_path, SAMPLE + [{"Title": "x"}]), 0)
+
+    def test_fetch_types_data_groups_by_type(self):
+        insert_listings(self.db_path, SAMPLE)
+        grouped = fetch_types_data(self.db_path, ("Job", "Internship", "Other"))
+        self.assertEqual(grouped["Job"][0]["Title"], "Cloud Engineer")
+        self.assertEqual(grouped["Internship"][0]["Location"], "Remote")
+        self.assertEqual(grouped["Other"], [])
+        self.assertNotIn("Event", grouped)
+
+    def test_search_listings_full_text(self):
+        insert_listings(self.db_path, SAMPLE)
+        results = search_listings(self.db_path, "pizza", ("Job", "Internship"))
+        # Title matches outrank Description matches in FTS5's bm25
+        self.assertEqual(
+            [r["Title"] for r in results], ["Pizza Software Intern", "Cloud Engineer"]
+        )
+        self.assertEqual(
+            search_listings(self.db_path, "softw", ("Job",))[0]["Title"],
+            "Cloud Engineer",
+        )
+        self.assertEqual(search_listings(self.db_path, "   "), [])
+
+    def test_csv_round_trip(self):
+        insert_listings(self.db_path, SAMPLE)
+        export_csv(self.db_path, self.csv_path)
+        with open(self.csv_path, encoding="utf8") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(tuple(rows[0]), COLUMNS)
+        self.assertEqual([row["link"] for row in rows], [s["link"] for s in SAMPLE])
+
+        other_db = os.path.join(self.temp_dir.name, "other.db")
+        self.assertEqual(import_csv(self.csv_path, other_db), 3)
+        self.assertEqual(fetch_types_data(other_db), fetch_types_data(self.db_path))
+
+    def test_timestamps_stored_as_integers(self):
+        insert_listings(
+            self.db_path, [{"Type": "Job", "pubDate": "2023-09-30", "link": "a"}]
+        )
+        job = fetch_types_data(self.db_path, ("Job",))["Job"][0]
+        self.assertEqual(job["pubTimestamp"], 1696032000)
+        self.assertIsNone(job["whenTimestamp"])
+
+    def test_adds_timestamp_columns_to_old_database(self):
+        connect(self.db_path).close()
+        conn = sqlite3.connect(self.db_path)
+        for column in ("pubTimestamp", "whenTimestamp", "entryTimestamp"):
+            conn.execute(f"ALTER TABLE listings DROP COLUMN {column}")
+        conn.execute(
+            "INSERT INTO listings (Type, whenDate, link) VALUES "
+            "('Job', '07/31/2025', 'a')"
+        )
+        conn.commit()
+        conn.close()
+        job = fetch_types_data(self.db_path, ("Job",))["Job"][0]
+        self.assertEqual(job["whenTimestamp"], 1753920000)
+
+
+if __name__ == "__main__":
+    unittest.main()